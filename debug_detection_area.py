@@ -10,18 +10,20 @@ import cv2
 import numpy as np
 import pyautogui
 import pygetwindow as gw
-import yaml
 
+from src.config_manager import ConfigManager
+from src.region_registry import Region, RegionRegistry
+from src.window_manager import StaticWindowManager
 
-def load_config():
+
+def load_config() -> ConfigManager:
     """加載配置檔案"""
     config_path = Path("config.yaml")
     if not config_path.exists():
         print("錯誤: 找不到 config.yaml 檔案")
         sys.exit(1)
 
-    with open(config_path, encoding="utf-8") as f:
-        return yaml.safe_load(f)
+    return ConfigManager(str(config_path))
 
 
 def find_game_window(window_title):
@@ -34,20 +36,10 @@ def find_game_window(window_title):
     return windows[0]
 
 
-def draw_region_on_screen(window, region_config, color, label, offset_y=0):
+def draw_region_on_screen(region: Region, color, label, offset_y=0):
     """在視窗截圖上繪製區域框"""
-    x, y, w, h = window.left, window.top, window.width, window.height
-
-    _, _ = x, y  # 未使用的變量，避免警告
-
-    # 計算區域座標
-    region_x = int(w * region_config["x"])
-    region_y = int(h * region_config["y"])
-    region_w = int(w * region_config["width"])
-    region_h = int(h * region_config["height"])
-
     return {
-        "rect": (region_x, region_y, region_w, region_h),
+        "rect": region.rect,
         "color": color,
         "label": label,
         "offset_y": offset_y,
@@ -61,7 +53,8 @@ def main():
 
     # 加載配置
     config = load_config()
-    window_title = config.get("game", {}).get("window_title", "")
+    settings = config.settings
+    window_title = settings.game.window_title
 
     if not window_title:
         print("錯誤: config.yaml 中未設置 window_title")
@@ -93,31 +86,30 @@ def main():
     )
     img = cv2.cvtColor(np.array(screenshot), cv2.COLOR_RGB2BGR)
 
+    # 以截圖左上角為原點解析所有檢測區域與點擊位置
+    registry = RegionRegistry(
+        config,
+        StaticWindowManager((0, 0, window.width, window.height)),
+    )
+    resolved = registry.regions()
+    points = registry.points()
+
     # 准备繪製的區域
     regions = []
 
     # 1. 咬勾檢測區域
-    bite_region = config.get("detection", {}).get("region", {})
+    bite_region = resolved.get("detection.region")
     if bite_region:
         regions.append(
-            draw_region_on_screen(
-                window, bite_region, (0, 0, 255), "bite_region", 0
-            )
+            draw_region_on_screen(bite_region, (0, 0, 255), "bite_region", 0)
         )
 
     # 2. 魚追踪區域
-    fish_splash_region = (
-        config.get("detection", {}).get("fish_splash", {}).get("region", {})
-    )
-    center_threshold = (
-        config.get("fishing", {})
-        .get("fish_tracking", {})
-        .get("center_threshold", 0.1)
-    )
+    fish_splash_region = resolved.get("detection.fish_splash.region")
+    center_threshold = settings.fishing.fish_tracking.center_threshold_min
     if fish_splash_region:
         regions.append(
             draw_region_on_screen(
-                window,
                 fish_splash_region,
                 (0, 255, 0),
                 "fish_splash_region",
@@ -126,15 +118,12 @@ def main():
         )
 
         # 繪製中心閾值線（左邊界和右邊界）
-        splash_x = int(window.width * fish_splash_region["x"])
-        splash_y = int(window.height * fish_splash_region["y"])
-        splash_w = int(window.width * fish_splash_region["width"])
-        splash_h = int(window.height * fish_splash_region["height"])
+        splash_x, splash_y, splash_w, splash_h = fish_splash_region.rect
 
         # 計算閾值邊界
         threshold_pixels = int(window.width * center_threshold)
-        center_offset = config.get("fishing.fish_tracking.center_offset", 0)
-        center_x = window.width // 2 + center_offset  # 視窗中心X座標
+        center_offset = settings.fishing.fish_tracking.center_offset
+        center_x = int(window.width // 2 + center_offset)  # 視窗中心X座標
         left_boundary = center_x - threshold_pixels
         right_boundary = center_x + threshold_pixels
 
@@ -191,13 +180,10 @@ def main():
         )
 
     # 3. 拉力計檢測區域
-    tension_bar_region = (
-        config.get("detection", {}).get("tension_bar", {}).get("region", {})
-    )
+    tension_bar_region = resolved.get("detection.tension_bar.region")
     if tension_bar_region:
         regions.append(
             draw_region_on_screen(
-                window,
                 tension_bar_region,
                 (0, 255, 255),
                 "tension_bar_region",
@@ -206,13 +192,10 @@ def main():
         )
 
     # 4. 紅色張力檢測區域
-    red_tension_region = (
-        config.get("detection", {}).get("red_tension", {}).get("region", {})
-    )
+    red_tension_region = resolved.get("detection.red_tension.region")
     if red_tension_region:
         regions.append(
             draw_region_on_screen(
-                window,
                 red_tension_region,
                 (0, 128, 255),
                 "red_tension_region",
@@ -221,13 +204,10 @@ def main():
         )
 
     # 5. "再來一次"按鈕檢測區域
-    retry_button_region = (
-        config.get("detection", {}).get("retry_button", {}).get("region", {})
-    )
+    retry_button_region = resolved.get("detection.retry_button.region")
     if retry_button_region:
         regions.append(
             draw_region_on_screen(
-                window,
                 retry_button_region,
                 (255, 0, 255),
                 "retry_button_region",
@@ -236,13 +216,10 @@ def main():
         )
 
     # 6. 魚竿耐久度檢測區域
-    rod_durability_region = (
-        config.get("detection", {}).get("rod_durability", {}).get("region", {})
-    )
+    rod_durability_region = resolved.get("detection.rod_durability.region")
     if rod_durability_region:
         regions.append(
             draw_region_on_screen(
-                window,
                 rod_durability_region,
                 (128, 0, 255),
                 "rod_durability_region",
@@ -251,11 +228,10 @@ def main():
         )
 
     # 點擊位置（如果使用點擊模式）
-    if config.get("fishing", {}).get("cast_type") == "click":
-        cast_pos = config.get("fishing", {}).get("cast_click_pos", {})
+    if settings.fishing.cast_type == "click":
+        cast_pos = points.get("fishing.cast_click_pos")
         if cast_pos:
-            click_x = int(window.width * cast_pos["x"])
-            click_y = int(window.height * cast_pos["y"])
+            click_x, click_y = cast_pos
             cv2.circle(img, (click_x, click_y), 10, (255, 0, 0), 2)
             cv2.putText(
                 img,
@@ -268,13 +244,11 @@ def main():
             )
 
     # 魚竿更換的點擊位置
-    rod_config = config.get("detection", {}).get("rod_durability", {})
-    first_click_pos = rod_config.get("first_click_pos", {})
-    second_click_pos = rod_config.get("second_click_pos", {})
+    first_click_pos = points.get("detection.rod_durability.first_click_pos")
+    second_click_pos = points.get("detection.rod_durability.second_click_pos")
 
     if first_click_pos:
-        first_x = int(window.width * first_click_pos["x"])
-        first_y = int(window.height * first_click_pos["y"])
+        first_x, first_y = first_click_pos
         # 繪製第一次點擊位置（綠色）
         cv2.circle(img, (first_x, first_y), 12, (0, 255, 0), -1)
         cv2.circle(img, (first_x, first_y), 15, (0, 255, 0), 2)
@@ -289,8 +263,7 @@ def main():
         )
 
     if second_click_pos:
-        second_x = int(window.width * second_click_pos["x"])
-        second_y = int(window.height * second_click_pos["y"])
+        second_x, second_y = second_click_pos
         # 繪製第二次點擊位置（紅色）
         cv2.circle(img, (second_x, second_y), 12, (0, 0, 255), -1)
         cv2.circle(img, (second_x, second_y), 15, (0, 0, 255), 2)
@@ -306,14 +279,10 @@ def main():
 
     # 如果兩個點擊位置都存在，繪製連接線
     if first_click_pos and second_click_pos:
-        first_x = int(window.width * first_click_pos["x"])
-        first_y = int(window.height * first_click_pos["y"])
-        second_x = int(window.width * second_click_pos["x"])
-        second_y = int(window.height * second_click_pos["y"])
         cv2.arrowedLine(
             img,
-            (first_x, first_y),
-            (second_x, second_y),
+            first_click_pos,
+            second_click_pos,
             (255, 255, 0),
             2,
             tipLength=0.3,
@@ -4,23 +4,36 @@
 釣魚自動化主程式
 """
 
+import argparse
 import sys
 import time
 
 from src import __version__
 from src.config_manager import ConfigManager
 from src.fishing_bot import FishingBot
-from src.logger import setup_logger
+from src.logger import setup_logger, stop_logger
+from src.multi_window import MultiWindowBot
 
 
 def main():
     """主函數"""
 
+    parser = argparse.ArgumentParser(description="釣魚機器人")
+    parser.add_argument(
+        "--calibrate",
+        action="store_true",
+        help="校準輸入到畫面反應的延遲後結束",
+    )
+    args = parser.parse_args()
+
     config = ConfigManager("config.yaml")
+    # 校準只針對單一視窗
+    multi_window = config.settings.multi_window.enabled and not args.calibrate
 
     logger = setup_logger(
-        config.get("logging.level", "INFO"),
-        config.get("logging.file", "fishing_bot.log"),
+        config.settings.logging.level,
+        config.settings.logging.file,
+        thread_name=multi_window,
     )
 
     logger.info("=" * 50)
@@ -31,6 +44,17 @@ def main():
     logger.info("=" * 50)
 
     try:
+        if multi_window:
+            # 多視窗模式：每個遊戲視窗各自執行釣魚循環
+            bots = MultiWindowBot(config)
+            if not bots.find_game_windows():
+                logger.error("未找到遊戲視窗，請檢查設定檔中的視窗標題")
+                return
+
+            time.sleep(2)
+            bots.start()
+            return
+
         # 創建釣魚機器人實例
         bot = FishingBot(config)
 
@@ -43,6 +67,11 @@ def main():
 
         time.sleep(2)
 
+        if args.calibrate:
+            # 校準輸入延遲
+            bot.calibrate_latency()
+            return
+
         # 開始釣魚循環
         bot.start()
 
@@ -52,6 +81,8 @@ def main():
         logger.error(f"程式異常: {e}", exc_info=True)
     finally:
         logger.info("程式結束")
+        # 寫完佇列中的日誌後再等待輸入，避免提示與日誌交錯
+        stop_logger()
         # 停止以便查看日誌
         input("按下 Enter 鍵以退出...")
 
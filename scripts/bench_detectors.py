@@ -0,0 +1,458 @@
+#!/usr/bin/env python
+"""
+圖像檢測效能測試腳本
+
+以合成畫面（以及指定的錄製畫面）在配置中各檢測區域的實際大小下
+測量 ImageDetector 各檢測方法的延遲百分位數與每次呼叫的記憶體配置，
+並可與保存的基準比較，退步超過容許範圍時以非零狀態結束。
+不需要遊戲視窗或顯示器，可在 Linux 上執行。
+
+延遲是實際時間，只能與同一台機器、同一個 Python 版本測得的基準比較：
+基準記錄測量環境，環境不同時略過比較。基準只能以專案支援的 Python 版本產生。
+
+使用方式：
+    python scripts/bench_detectors.py
+    python scripts/bench_detectors.py --frames recordings/session1
+    python scripts/bench_detectors.py --save-baseline bench_baseline.json
+    python scripts/bench_detectors.py --baseline bench_baseline.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+
+import cv2
+import numpy as np
+from util import abort
+
+from src.capture_backend import FrameSequenceCaptureBackend
+from src.config_manager import ConfigManager
+from src.image_detector import ImageDetector
+from src.phases.waiting_phase import BITE_COLOR_RANGE
+from src.region_registry import Region, RegionRegistry
+from src.utils import get_resource_path
+from src.window_manager import StaticWindowManager
+
+# 與 pyproject.toml 的 requires-python 一致
+MIN_PYTHON = (3, 14)
+
+# 必須相同才比較的測量環境欄位
+COMPARABLE_ENVIRONMENT = ("python", "system", "machine", "processor", "window")
+
+
+def get_region(regions: RegionRegistry, key: str) -> Region:
+    """
+    取得檢測區域
+
+    Raises:
+        RuntimeError: 無法取得視窗位置時
+    """
+    region = regions.region(key)
+    if region is None:
+        raise RuntimeError(f"無法取得檢測區域: {key}")
+    return region
+
+
+def synthetic_frame(
+    width: int, height: int, regions: RegionRegistry, rng: np.random.Generator
+) -> np.ndarray:
+    """
+    產生包含各檢測目標的整個視窗畫面
+
+    背景為帶雜訊的深色畫面，並在對應區域放入咬鉤指示器模板、橙色像素、
+    白色水花與紅色張力條，讓各檢測方法走完整的命中路徑。
+    """
+    frame = rng.integers(20, 60, (height, width, 3), dtype=np.uint8)
+
+    def paste(key: str, image: np.ndarray):
+        region = get_region(regions, key)
+        h = min(image.shape[0], region.height)
+        w = min(image.shape[1], region.width)
+        top = region.rows.start + (region.height - h) // 2
+        left = region.cols.start + (region.width - w) // 2
+        frame[top : top + h, left : left + w] = image[:h, :w]
+
+    bite = cv2.imread(get_resource_path("templates/bite_indicator.png"))
+    if bite is not None:
+        paste("detection.region", bite)
+
+    # 咬鉤橙色（BITE_COLOR_RANGE 範圍內）
+    region = get_region(regions, "detection.region")
+    frame[
+        region.rows.start : region.rows.start + region.height // 4,
+        region.cols,
+    ] = (15, 130, 250)
+
+    # 白色水花
+    region = get_region(regions, "detection.fish_splash.region")
+    center = (
+        region.cols.start + region.width // 3,
+        region.rows.start + region.height // 2,
+    )
+    axes = (max(region.width // 20, 4), max(region.height // 12, 3))
+    cv2.ellipse(frame, center, axes, 0, 0, 360, (255, 255, 255), -1)
+
+    # 紅色張力條
+    region = get_region(regions, "detection.red_tension.region")
+    frame[region.rows, region.cols] = (20, 20, 240)
+    return frame
+
+
+def build_cases(
+    detector: ImageDetector, regions: RegionRegistry, settings, ocr: bool
+) -> list[tuple[str, Region, Callable[[np.ndarray], object]]]:
+    """
+    建立測試案例
+
+    Returns:
+        (名稱, 檢測區域, 以整個視窗畫面呼叫檢測方法的函數) 列表
+    """
+    detection = settings.detection
+    templates = [
+        ("bite_indicator", "detection.region", "templates/bite_indicator.png"),
+        (
+            "tension_bar",
+            "detection.tension_bar.region",
+            detection.tension_bar.template,
+        ),
+        (
+            "red_tension",
+            "detection.red_tension_template.region",
+            settings.fishing.tension_phase.red_template,
+        ),
+        (
+            "retry_button",
+            "detection.retry_button.region",
+            detection.retry_button.template,
+        ),
+        (
+            "rod_depleted",
+            "detection.rod_durability.region",
+            detection.rod_durability.template,
+        ),
+    ]
+
+    def crop(region: Region):
+        return lambda frame: frame[region.rows, region.cols]
+
+    cases = []
+    for name, key, template in templates:
+        region = get_region(regions, key)
+        path = get_resource_path(template)
+        if detector.load_template(path) is None:
+            continue
+        screen = crop(region)
+        cases.append(
+            (
+                f"find_template[{name}]",
+                region,
+                lambda frame, s=screen, p=path: detector.find_template(
+                    s(frame), p
+                ),
+            )
+        )
+
+    region = get_region(regions, "detection.red_tension.region")
+    screen = crop(region)
+    cases.append(
+        (
+            "detect_red_ratio",
+            region,
+            lambda frame: detector.detect_red_ratio(screen(frame)),
+        )
+    )
+
+    region = get_region(regions, "detection.region")
+    cases.append(
+        (
+            "detect_color_in_range",
+            region,
+            lambda frame, r=region.rect: detector.detect_color_in_range(
+                r, *BITE_COLOR_RANGE
+            ),
+        )
+    )
+
+    region = get_region(regions, "detection.fish_splash.region")
+    splash = detection.fish_splash
+    cases.append(
+        (
+            "find_white_splash",
+            region,
+            lambda frame, r=region.rect: detector.find_white_splash(
+                r, splash.white_threshold, splash.min_area
+            ),
+        )
+    )
+
+    if ocr:
+        region = get_region(regions, "detection.red_tension.region")
+        cases.append(
+            (
+                "_detect_tension_by_ocr",
+                region,
+                lambda frame, r=region.rect: detector._detect_tension_by_ocr(
+                    r
+                ),
+            )
+        )
+    return cases
+
+
+def measure(
+    call: Callable[[np.ndarray], object],
+    frames: list[np.ndarray],
+    backend: FrameSequenceCaptureBackend,
+    iterations: int,
+    warmup: int,
+) -> dict:
+    """
+    測量單一檢測方法
+
+    時間與記憶體分兩輪測量，避免 tracemalloc 的開銷影響延遲數據。
+
+    Returns:
+        延遲百分位數（微秒）與每次呼叫的記憶體配置（KB）
+    """
+
+    def run(i: int):
+        # 直接呼叫與經由截圖後端的方法看到同一張畫面
+        backend.index = i % len(frames)
+        return call(frames[i % len(frames)])
+
+    for i in range(warmup):
+        run(i)
+
+    samples = np.empty(iterations)
+    for i in range(iterations):
+        start = time.perf_counter_ns()
+        run(i)
+        samples[i] = (time.perf_counter_ns() - start) / 1000
+
+    allocations = np.empty(min(iterations, 50))
+    tracemalloc.start()
+    try:
+        for i in range(len(allocations)):
+            baseline, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            run(i)
+            _, peak = tracemalloc.get_traced_memory()
+            allocations[i] = (peak - baseline) / 1024
+    finally:
+        tracemalloc.stop()
+
+    p50, p95, p99 = np.percentile(samples, [50, 95, 99])
+    return {
+        "p50_us": round(float(p50), 2),
+        "p95_us": round(float(p95), 2),
+        "p99_us": round(float(p99), 2),
+        "alloc_kb": round(float(allocations.mean()), 2),
+    }
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """
+    與基準比較
+
+    Args:
+        results: 本次結果
+        baseline: 基準結果
+        tolerance: 容許的退步比例（p95 延遲與記憶體配置）
+
+    Returns:
+        退步項目說明列表
+    """
+    regressions = []
+    for name, base in baseline.items():
+        current = results.get(name)
+        if current is None:
+            continue
+        # 容許 50 微秒的絕對誤差，避免極短延遲的排程雜訊
+        if current["p95_us"] > base["p95_us"] * (1 + tolerance) + 50.0:
+            regressions.append(
+                f"{name}: p95 {base['p95_us']:.1f} → {current['p95_us']:.1f} us"
+            )
+        # 容許 1 KB 的絕對誤差，避免極小配置量的比例波動
+        if current["alloc_kb"] > base["alloc_kb"] * (1 + tolerance) + 1.0:
+            regressions.append(
+                f"{name}: 配置 {base['alloc_kb']:.1f} → "
+                f"{current['alloc_kb']:.1f} KB"
+            )
+    return regressions
+
+
+def environment(window: str) -> dict:
+    """
+    目前的測量環境
+
+    Args:
+        window: 合成畫面的視窗大小
+
+    Returns:
+        環境描述（python 只記錄主次版本）
+    """
+    return {
+        "python": ".".join(platform.python_version_tuple()[:2]),
+        "python_full": platform.python_version(),
+        "numpy": np.__version__,
+        "opencv": cv2.__version__,
+        "system": platform.system(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor() or platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "window": window,
+    }
+
+
+def environment_mismatch(baseline: dict, current: dict) -> list[str]:
+    """
+    比較基準與目前的測量環境
+
+    Returns:
+        不同的欄位說明列表
+    """
+    return [
+        f"{key}: {baseline.get(key)} → {current[key]}"
+        for key in COMPARABLE_ENVIRONMENT
+        if baseline.get(key) != current[key]
+    ]
+
+
+def ocr_available() -> bool:
+    """檢查是否安裝 Tesseract"""
+    try:
+        import pytesseract
+
+        pytesseract.get_tesseract_version()
+        return True
+    except Exception:
+        return False
+
+
+def main():
+    try:
+        parser = argparse.ArgumentParser(description="圖像檢測效能測試")
+        parser.add_argument(
+            "--config", default="config.yaml", help="設定檔路徑"
+        )
+        parser.add_argument(
+            "--frames", help="錄製畫面目錄（整個視窗的 PNG 截圖）"
+        )
+        parser.add_argument(
+            "--window",
+            default="1920x1080",
+            help="合成畫面的視窗大小（寬x高）",
+        )
+        parser.add_argument(
+            "--iterations", type=int, default=200, help="每個案例的測量次數"
+        )
+        parser.add_argument(
+            "--warmup", type=int, default=10, help="每個案例的預熱次數"
+        )
+        parser.add_argument("--baseline", help="比較的基準檔案")
+        parser.add_argument("--save-baseline", help="將結果保存為基準檔案")
+        parser.add_argument(
+            "--tolerance",
+            type=float,
+            default=0.25,
+            help="容許的退步比例（預設 0.25）",
+        )
+        args = parser.parse_args()
+
+        if args.save_baseline and sys.version_info < MIN_PYTHON:
+            abort(
+                "基準需以 Python "
+                + ".".join(map(str, MIN_PYTHON))
+                + f" 以上測量，目前為 {platform.python_version()}"
+            )
+
+        config = ConfigManager(args.config)
+        settings = config.settings
+        width, height = map(int, args.window.lower().split("x"))
+
+        frame_sets = {}
+        regions = RegionRegistry(
+            config, StaticWindowManager((0, 0, width, height))
+        )
+        rng = np.random.default_rng(0)
+        frame_sets["synthetic"] = (
+            [synthetic_frame(width, height, regions, rng) for _ in range(4)],
+            regions,
+        )
+        if args.frames:
+            recorded = FrameSequenceCaptureBackend.from_directory(args.frames)
+            h, w = recorded.frames[0].shape[:2]
+            frame_sets["recorded"] = (
+                recorded.frames,
+                RegionRegistry(config, StaticWindowManager((0, 0, w, h))),
+            )
+
+        ocr = ocr_available()
+        if not ocr:
+            print("未安裝 Tesseract，略過 _detect_tension_by_ocr")
+
+        results = {}
+        for source, (frames, source_regions) in frame_sets.items():
+            backend = FrameSequenceCaptureBackend(frames, loop=True)
+            detector = ImageDetector(settings.detection.threshold, backend)
+            cases = build_cases(detector, source_regions, settings, ocr)
+            for name, region, call in cases:
+                key = f"{name}@{source}"
+                result = measure(
+                    call, frames, backend, args.iterations, args.warmup
+                )
+                result["region"] = f"{region.width}x{region.height}"
+                results[key] = result
+
+        print("=" * 78)
+        print(
+            f"{'案例':40} {'區域':>9} {'p50':>7} {'p95':>7} {'p99':>7} "
+            f"{'KB':>6}"
+        )
+        for key, result in results.items():
+            print(
+                f"{key:42} {result['region']:>9} {result['p50_us']:7.0f} "
+                f"{result['p95_us']:7.0f} {result['p99_us']:7.0f} "
+                f"{result['alloc_kb']:6.1f}"
+            )
+        print("延遲單位: 微秒")
+
+        current = environment(f"{width}x{height}")
+        if args.save_baseline:
+            report = {"environment": current, "results": results}
+            Path(args.save_baseline).write_text(
+                json.dumps(report, indent=2, ensure_ascii=False),
+                encoding="utf-8",
+            )
+            print(f"基準已保存: {args.save_baseline}")
+
+        if args.baseline:
+            baseline = json.loads(
+                Path(args.baseline).read_text(encoding="utf-8")
+            )
+            mismatch = environment_mismatch(baseline["environment"], current)
+            if mismatch:
+                print(
+                    "基準的測量環境不同，略過比較"
+                    "（請在本機以 --save-baseline 重新產生）:\n  "
+                    + "\n  ".join(mismatch)
+                )
+                return
+            regressions = compare(results, baseline["results"], args.tolerance)
+            if regressions:
+                abort("效能退步:\n  " + "\n  ".join(regressions))
+            print(f"與基準相比沒有超過 {args.tolerance:.0%} 的退步")
+
+    except KeyboardInterrupt:
+        abort("\n用戶中斷")
+
+
+if __name__ == "__main__":
+    main()
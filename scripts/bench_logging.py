@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+"""
+日誌開銷測量腳本
+
+模擬拉力階段每個控制週期的日誌呼叫（張力值、魚偏移、水花位置、模板匹配），
+比較「同步寫入 + f-string」與「佇列背景寫入 + 延遲格式化」兩種方式
+在 INFO 與 DEBUG 級別下每個週期佔用控制線程的時間。
+
+使用方式：
+    python scripts/bench_logging.py
+    python scripts/bench_logging.py --ticks 20000
+"""
+
+import argparse
+import contextlib
+import logging
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+from util import abort
+
+from src.logger import setup_logger, stop_logger
+
+
+def tick_eager(logger: logging.Logger, i: int):
+    """改動前的寫法：f-string 在呼叫前就完成格式化"""
+    offset = (i % 200 - 100) / 1000
+    logger.debug(f"張力值: {i % 100}")
+    logger.debug(f"偏移 {offset:+.3f}，輸出 {offset * 5.5:+.2f}，按住 a 鍵")
+    logger.debug(
+        f"檢測到白色水花: ({i % 640}, {i % 480}), 面積: {i % 900:.0f}"
+    )
+    logger.debug(f"未找到模板，最高匹配度: {offset + 0.5:.2f}")
+
+
+def tick_lazy(logger: logging.Logger, i: int):
+    """改動後的寫法：只在級別啟用時才格式化"""
+    offset = (i % 200 - 100) / 1000
+    logger.debug("張力值: %s", i % 100)
+    logger.debug(
+        "偏移 %+.3f，輸出 %+.2f，按住 %s 鍵", offset, offset * 5.5, "a"
+    )
+    logger.debug(
+        "檢測到白色水花: (%d, %d), 面積: %.0f", i % 640, i % 480, i % 900
+    )
+    logger.debug("未找到模板，最高匹配度: %.2f", offset + 0.5)
+
+
+def setup_sync_logger(level: str, log_file: str) -> logging.Logger:
+    """改動前的設定：控制線程直接寫入控制台與檔案"""
+    stop_logger()
+    logger = logging.getLogger("FishingBot")
+    logger.setLevel(level)
+    logger.handlers.clear()
+
+    formatter = logging.Formatter(
+        "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+    for handler in (
+        logging.StreamHandler(sys.stdout),
+        logging.FileHandler(log_file, encoding="utf-8"),
+    ):
+        handler.setFormatter(formatter)
+        logger.addHandler(handler)
+    return logger
+
+
+def measure(logger: logging.Logger, tick, ticks: int) -> np.ndarray:
+    """
+    測量每個週期的日誌耗時
+
+    Returns:
+        每個週期的耗時（微秒）
+    """
+    child = logger.getChild("TensionPhase")
+    samples = np.empty(ticks)
+    for i in range(ticks):
+        start = time.perf_counter_ns()
+        tick(child, i)
+        samples[i] = (time.perf_counter_ns() - start) / 1000
+    return samples
+
+
+def main():
+    try:
+        parser = argparse.ArgumentParser(description="測量日誌開銷")
+        parser.add_argument(
+            "--ticks", type=int, default=5000, help="每種組合的控制週期數"
+        )
+        args = parser.parse_args()
+
+        results = []
+        with (
+            tempfile.TemporaryDirectory() as tmp_dir,
+            open(os.devnull, "w", encoding="utf-8") as devnull,
+            contextlib.redirect_stdout(devnull),
+        ):
+            log_file = os.path.join(tmp_dir, "bench.log")
+            for level in ("INFO", "DEBUG"):
+                logger = setup_sync_logger(level, log_file)
+                before = measure(logger, tick_eager, args.ticks)
+                for handler in logger.handlers:
+                    handler.close()
+                logger.handlers.clear()
+
+                logger = setup_logger(level, log_file)
+                after = measure(logger, tick_lazy, args.ticks)
+                stop_logger()
+                logger.handlers.clear()
+
+                results.append((level, "同步 + f-string", before))
+                results.append((level, "佇列 + 延遲格式化", after))
+
+        print(f"每個控制週期 4 次日誌呼叫，{args.ticks} 個週期（微秒）")
+        print("=" * 50)
+        for level, name, samples in results:
+            p50, p99 = np.percentile(samples, [50, 99])
+            print(
+                f"{level:5} {name:12} 平均 {samples.mean():7.2f}  "
+                f"p50 {p50:7.2f}  p99 {p99:7.2f}"
+            )
+
+    except KeyboardInterrupt:
+        abort("\n用戶中斷")
+
+
+if __name__ == "__main__":
+    main()
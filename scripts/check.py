@@ -7,18 +7,27 @@
 使用方式：
     python scripts/check.py       # 只檢查不修復
     python scripts/check.py --fix # 自動修復問題，並檢查
+    python scripts/check.py --bench # 另外比較圖像檢測效能
+
+--bench 以 bench_baseline.json 比較圖像檢測效能，退步超過一倍時失敗。
+基準需先在同一台機器以 bench_detectors.py --save-baseline 產生。
 """
 
 import argparse
 import sys
 
-from util import abort, run
+from util import ROOT_DIR, abort, run
 
 
 def main():
     try:
         parser = argparse.ArgumentParser(description="執行代碼檢查工具")
         parser.add_argument("--fix", action="store_true", help="執行修復操作")
+        parser.add_argument(
+            "--bench",
+            action="store_true",
+            help="另外以 bench_baseline.json 比較圖像檢測效能",
+        )
         args = parser.parse_args()
 
         # Prepare command sequence
@@ -35,6 +44,30 @@ def main():
                 [sys.executable, "-m", "ty", "check"],
             ]
 
+        # 圖像檢測效能門檻（選用）：計時受機器負載影響，容許範圍較寬
+        if args.bench:
+            baseline = ROOT_DIR / "bench_baseline.json"
+            if not baseline.exists():
+                abort(
+                    f"\n找不到 {baseline.name}，請先執行 "
+                    f"python scripts/bench_detectors.py --save-baseline "
+                    f"{baseline.name}"
+                )
+            cmds.append(
+                [
+                    sys.executable,
+                    str(ROOT_DIR / "scripts" / "bench_detectors.py"),
+                    "--config",
+                    str(ROOT_DIR / "config.yaml"),
+                    "--baseline",
+                    str(baseline),
+                    "--tolerance",
+                    "1.0",
+                    "--iterations",
+                    "100",
+                ]
+            )
+
         for cmd in cmds:
             run(cmd)
 
@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+"""
+畫面回放腳本
+
+以預先錄製的整個視窗截圖（依檔名排序）取代螢幕截圖，並以記錄輸入後端
+取代實際輸入，執行完整的釣魚流程。不需要遊戲視窗，可在 Linux 上執行。
+結束後列出所有輸入事件與「最後一次截圖 → 輸入事件」的反應延遲。
+
+使用方式：
+    python scripts/replay_frames.py recordings/session1
+    python scripts/replay_frames.py recordings/session1 --cycles 3 --interval 0.05
+"""
+
+import argparse
+import logging
+
+import numpy as np
+from util import abort
+
+from src.capture_backend import FrameSequenceCaptureBackend
+from src.config_manager import ConfigManager
+from src.fishing_bot import FishingBot
+from src.image_detector import ImageDetector
+from src.input_backend import RecordingInputBackend
+from src.logger import setup_logger
+from src.window_manager import StaticWindowManager
+
+
+def main():
+    try:
+        parser = argparse.ArgumentParser(description="以錄製畫面回放釣魚流程")
+        parser.add_argument("frames", help="畫面目錄（整個視窗的 PNG 截圖）")
+        parser.add_argument(
+            "--config", default="config.yaml", help="設定檔路徑"
+        )
+        parser.add_argument(
+            "--cycles", type=int, default=1, help="執行的釣魚循環次數"
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=None,
+            help="畫面間隔（秒），未指定時每次截圖前進一張",
+        )
+        args = parser.parse_args()
+
+        config = ConfigManager(args.config)
+        setup_logger(config.settings.logging.level, None)
+
+        capture_backend = FrameSequenceCaptureBackend.from_directory(
+            args.frames, frame_interval=args.interval
+        )
+        height, width = capture_backend.frames[0].shape[:2]
+        input_backend = RecordingInputBackend()
+
+        bot = FishingBot(
+            config,
+            window_manager=StaticWindowManager((0, 0, width, height)),
+            input_controller=input_backend,
+            image_detector=ImageDetector(
+                config.settings.detection.threshold, capture_backend
+            ),
+        )
+
+        try:
+            for _ in range(args.cycles):
+                bot._fishing_cycle()
+        finally:
+            bot.stop()
+
+        latencies = []
+        print("=" * 50)
+        for event in input_backend.events:
+            if event.kind == "move":
+                continue
+            frame_time = capture_backend.last_capture_before(event.timestamp)
+            latency = (
+                None if frame_time is None else event.timestamp - frame_time
+            )
+            label = "-" if latency is None else f"{latency * 1000:.1f} ms"
+            print(f"{event.kind:5} {event.name:6} {event.action:4} {label}")
+            if latency is not None:
+                latencies.append(latency)
+
+        print("=" * 50)
+        print(f"統計: {bot.get_statistics()}")
+        if latencies:
+            p50, p95 = np.percentile(latencies, [50, 95]) * 1000
+            print(
+                f"反應延遲（{len(latencies)} 個事件）: "
+                f"p50 {p50:.1f} ms，p95 {p95:.1f} ms"
+            )
+
+    except KeyboardInterrupt:
+        abort("\n用戶中斷")
+
+    except Exception as e:
+        logging.getLogger("FishingBot").debug("回放失敗", exc_info=True)
+        abort(f"\n回放發生錯誤: {e}")
+
+
+if __name__ == "__main__":
+    main()
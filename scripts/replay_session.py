@@ -0,0 +1,295 @@
+#!/usr/bin/env python
+"""
+流程錄製回放腳本
+
+讀取 session_recording 錄製的釣魚循環（zip），以虛擬時鐘和錄製的畫面
+重新執行 FishingBot 的完整流程，3 分鐘的拉力階段只需數秒。
+結束後比較回放與錄製時的輸入事件和階段切換，列出第一個分歧點。
+不需要遊戲視窗，可在 Linux 上執行。
+
+使用方式：
+    python scripts/replay_session.py sessions/recordings/20250101_120000_0001.zip
+    python scripts/replay_session.py session.zip --config config.yaml --strict
+    python scripts/replay_session.py session.zip --check-determinism
+"""
+
+import argparse
+import dataclasses
+import logging
+import tempfile
+import time
+from pathlib import Path
+
+from util import abort
+
+from src.clock import VirtualClock
+from src.config_manager import ConfigManager
+from src.fishing_bot import FishingBot
+from src.image_detector import ImageDetector
+from src.logger import setup_logger
+from src.session_recorder import (
+    RecordedSession,
+    SessionReplayCaptureBackend,
+    SessionReplayInputBackend,
+)
+from src.window_manager import StaticWindowManager
+
+
+def load_config(session: RecordedSession, path: str | None) -> ConfigManager:
+    """
+    載入回放使用的配置（預設為錄製時的配置），並關閉回放不需要的功能
+
+    Args:
+        session: 錄製的流程
+        path: 指定的設定檔路徑
+
+    Returns:
+        配置管理器
+    """
+    if path is None and session.config_text is not None:
+        with tempfile.NamedTemporaryFile(
+            "w", suffix=".yaml", encoding="utf-8", delete=False
+        ) as f:
+            f.write(session.config_text)
+        config = ConfigManager(f.name)
+        Path(f.name).unlink()
+    else:
+        config = ConfigManager(path or "config.yaml")
+
+    settings = config.settings
+    config.settings = dataclasses.replace(
+        settings,
+        input=dataclasses.replace(settings.input, async_worker=False),
+        telemetry=dataclasses.replace(settings.telemetry, enabled=False),
+        flight_recorder=dataclasses.replace(
+            settings.flight_recorder, enabled=False
+        ),
+        session_recording=dataclasses.replace(
+            settings.session_recording, enabled=False
+        ),
+        config_reload=dataclasses.replace(
+            settings.config_reload, enabled=False
+        ),
+    )
+    return config
+
+
+def compare_sequences(
+    label: str,
+    recorded: list[tuple[float, str]],
+    replayed: list[tuple[float, str]],
+    time_tolerance: float,
+    context: int,
+) -> bool:
+    """
+    比較錄製與回放的事件序列並列出分歧
+
+    Args:
+        label: 序列名稱
+        recorded: 錄製的 (時間, 描述) 列表
+        replayed: 回放的 (時間, 描述) 列表
+        time_tolerance: 視為時間分歧的時間差（秒）
+        context: 分歧點前後列出的事件數
+
+    Returns:
+        是否一致
+    """
+    matched = 0
+    for (_, recorded_name), (_, replayed_name) in zip(
+        recorded, replayed, strict=False
+    ):
+        if recorded_name != replayed_name:
+            break
+        matched += 1
+
+    deltas = [replayed[i][0] - recorded[i][0] for i in range(matched)]
+    late = [i for i, delta in enumerate(deltas) if abs(delta) > time_tolerance]
+
+    print(
+        f"{label}: 錄製 {len(recorded)} 個，回放 {len(replayed)} 個，", end=""
+    )
+    print(f"前 {matched} 個一致")
+    if deltas:
+        worst = max(deltas, key=abs)
+        print(f"  時間差: 最大 {worst * 1000:+.0f} ms")
+
+    consistent = matched == len(recorded) == len(replayed) and not late
+    if late:
+        i = late[0]
+        print(
+            f"  第 {i + 1} 個事件時間分歧: {recorded[i][1]} "
+            f"錄製 {recorded[i][0]:.3f}s，回放 {replayed[i][0]:.3f}s"
+        )
+    if matched < max(len(recorded), len(replayed)):
+        print(f"  第 {matched + 1} 個事件開始分歧:")
+        start = max(matched - context, 0)
+        for i in range(start, matched + context + 1):
+            left = (
+                f"{recorded[i][0]:8.3f} {recorded[i][1]:18}"
+                if i < len(recorded)
+                else " " * 27
+            )
+            right = (
+                f"{replayed[i][0]:8.3f} {replayed[i][1]}"
+                if i < len(replayed)
+                else ""
+            )
+            marker = ">" if i == matched else " "
+            print(f"  {marker} {left} | {right}")
+    return consistent
+
+
+def replay(
+    session: RecordedSession, config: ConfigManager
+) -> tuple[list[tuple[float, str]], list[tuple[float, str]], float, float]:
+    """
+    以虛擬時鐘和錄製的畫面重新執行一次釣魚循環
+
+    Args:
+        session: 錄製的流程
+        config: 配置管理器
+
+    Returns:
+        (階段切換, 輸入事件（不含滑鼠移動）, 回放虛擬時間, 實際耗時)，
+        事件為 (時間, 描述) 列表
+    """
+    clock = VirtualClock()
+    input_backend = SessionReplayInputBackend(session, clock)
+    bot = FishingBot(
+        config,
+        window_manager=StaticWindowManager(session.frame_windows[0]),
+        input_controller=input_backend,
+        image_detector=ImageDetector(
+            config.settings.detection.threshold,
+            SessionReplayCaptureBackend(session, clock),
+        ),
+        clock=clock,
+    )
+
+    # 記錄回放中的階段切換（時間與錄製檔同樣相對於循環開始）
+    phases = []
+    bot.state_listeners.append(
+        lambda state: phases.append((clock.monotonic(), state.name.lower()))
+    )
+
+    start = time.perf_counter()
+    try:
+        bot._fishing_cycle()
+    finally:
+        bot.stop()
+    wall_time = time.perf_counter() - start
+
+    inputs = [
+        (event.timestamp, f"{event.kind} {event.name} {event.action}")
+        for event in input_backend.events
+        if event.kind != "move"
+    ]
+    return phases, inputs, clock.monotonic(), wall_time
+
+
+def main():
+    try:
+        parser = argparse.ArgumentParser(
+            description="以虛擬時鐘回放錄製的流程"
+        )
+        parser.add_argument("session", help="錄製檔（zip）")
+        parser.add_argument(
+            "--config", default=None, help="設定檔路徑（預設使用錄製時的配置）"
+        )
+        parser.add_argument(
+            "--time-tolerance",
+            type=float,
+            default=0.25,
+            help="視為時間分歧的時間差（秒）",
+        )
+        parser.add_argument(
+            "--context", type=int, default=3, help="分歧點前後列出的事件數"
+        )
+        parser.add_argument(
+            "--strict", action="store_true", help="有分歧時以非零狀態結束"
+        )
+        parser.add_argument(
+            "--check-determinism",
+            action="store_true",
+            help="再回放一次，兩次的階段切換與輸入事件（含時間）不同時失敗",
+        )
+        parser.add_argument(
+            "--verbose", action="store_true", help="顯示回放中的日誌"
+        )
+        args = parser.parse_args()
+
+        session = RecordedSession(args.session)
+        config = load_config(session, args.config)
+        setup_logger("DEBUG" if args.verbose else "WARNING", None)
+
+        replayed_phases, replayed_inputs, virtual_time, wall_time = replay(
+            session, config
+        )
+        recorded_inputs = [
+            (event["t"], f"{event['kind']} {event['name']} {event['action']}")
+            for event in session.inputs()
+            if event["kind"] != "move"
+        ]
+        recorded_phases = [
+            (event["t"], event["phase"]) for event in session.phases()
+        ]
+
+        print("=" * 60)
+        print(
+            f"錄製時長 {session.duration:.1f}s，回放虛擬時間 "
+            f"{virtual_time:.1f}s，實際耗時 {wall_time:.2f}s"
+            f"（{virtual_time / max(wall_time, 1e-9):.0f} 倍速）"
+        )
+        consistent = compare_sequences(
+            "階段切換",
+            recorded_phases,
+            replayed_phases,
+            args.time_tolerance,
+            args.context,
+        )
+        consistent &= compare_sequences(
+            "輸入事件",
+            recorded_inputs,
+            replayed_inputs,
+            args.time_tolerance,
+            args.context,
+        )
+        print("=" * 60)
+        print("回放與錄製一致" if consistent else "回放與錄製有分歧")
+
+        if args.check_determinism:
+            phases, inputs, _, _ = replay(session, config)
+            deterministic = compare_sequences(
+                "第二次回放的階段切換",
+                replayed_phases,
+                phases,
+                0.0,
+                args.context,
+            )
+            deterministic &= compare_sequences(
+                "第二次回放的輸入事件",
+                replayed_inputs,
+                inputs,
+                0.0,
+                args.context,
+            )
+            print("=" * 60)
+            if not deterministic:
+                session.close()
+                abort("兩次回放的事件序列不同")
+            print("兩次回放的事件序列完全相同")
+        session.close()
+
+        if args.strict and not consistent:
+            abort("回放結果與錄製不一致")
+
+    except KeyboardInterrupt:
+        abort("\n用戶中斷")
+
+    except Exception as e:
+        logging.getLogger("FishingBot").debug("回放失敗", exc_info=True)
+        abort(f"\n回放發生錯誤: {e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,343 @@
+#!/usr/bin/env python
+"""
+閉迴路模擬腳本
+
+以 SimulatedGame 代替遊戲視窗執行完整的釣魚流程：模擬器依配置的
+檢測區域繪製畫面，並依機器人發送的滑鼠與方向鍵輸入更新張力與魚的位置。
+統計每小時釣魚數、拉力階段成功率與每條魚的 CPU 時間，
+可用於比較控制邏輯或配置的改動。不需要遊戲視窗，可在 Linux 上執行。
+
+預設使用虛擬時鐘，等待與拉力階段的時間直接跳過。
+
+使用方式：
+    python scripts/simulate.py --cycles 50
+    python scripts/simulate.py --cycles 20 --param fish_speed=0.2 --seed 1
+    python scripts/simulate.py --realtime --cycles 3
+    python scripts/simulate.py --cycles 3 --trace trace.json
+    python scripts/simulate.py --cycles 10 --profile
+    python scripts/simulate.py --calibrate
+"""
+
+import argparse
+import dataclasses
+import json
+import random
+import time
+from pathlib import Path
+
+from util import abort
+
+from src.clock import SYSTEM_CLOCK, VirtualClock
+from src.config_manager import ConfigManager
+from src.fishing_bot import FishingBot
+from src.image_detector import ImageDetector
+from src.latency_calibration import (
+    CALIBRATION_ACTIONS,
+    POLL_INTERVAL,
+    LatencyCalibrator,
+)
+from src.logger import setup_logger
+from src.sampling_profiler import SamplingProfiler
+from src.simulator import SimulatedGame, SimulatedInputBackend, SimulatorParams
+from src.tracing import Tracer, install
+
+
+def parse_params(values: list[str]) -> SimulatorParams:
+    """
+    解析 --param key=value 覆寫的模擬參數
+
+    Args:
+        values: key=value 列表
+
+    Returns:
+        模擬參數
+    """
+    params = SimulatorParams()
+    fields = {field.name: field.type for field in dataclasses.fields(params)}
+    overrides = {}
+    for value in values:
+        key, _, text = value.partition("=")
+        if key not in fields:
+            raise ValueError(f"未知的模擬參數: {key}")
+        overrides[key] = (
+            int(text) if fields[key] in (int, "int") else float(text)
+        )
+    return dataclasses.replace(params, **overrides)
+
+
+def load_config(path: str) -> ConfigManager:
+    """載入配置，並關閉模擬不需要的功能"""
+    config = ConfigManager(path)
+    settings = config.settings
+    config.settings = dataclasses.replace(
+        settings,
+        input=dataclasses.replace(settings.input, async_worker=False),
+        telemetry=dataclasses.replace(settings.telemetry, enabled=False),
+        flight_recorder=dataclasses.replace(
+            settings.flight_recorder, enabled=False
+        ),
+        session_recording=dataclasses.replace(
+            settings.session_recording, enabled=False
+        ),
+        config_reload=dataclasses.replace(
+            settings.config_reload, enabled=False
+        ),
+    )
+    return config
+
+
+def print_phase_table(metrics: dict):
+    """輸出各階段與檢測耗時的百分位數（模擬時間，毫秒）"""
+    print("-" * 60)
+    print(f"{'指標':<32}{'次數':>6}{'p50':>8}{'p95':>8}{'p99':>8}")
+    for name, summary in metrics["histograms"].items():
+        if not summary["count"]:
+            continue
+        print(
+            f"{name:<32}{summary['count']:>6}"
+            + "".join(
+                f"{summary[key] * 1000:>8.1f}" for key in ("p50", "p95", "p99")
+            )
+        )
+
+
+def run_calibration(bot: FishingBot, game: SimulatedGame) -> list[str]:
+    """
+    以模擬器執行延遲校準，檢查測量值是否符合模擬器的 input_delay
+
+    測量值應落在 [input_delay, input_delay + 模擬步長 + 截圖間隔) 內。
+
+    Returns:
+        不符合的項目說明列表
+    """
+    calibrator = LatencyCalibrator(
+        bot.config,
+        bot.window_manager,
+        bot.input_controller,
+        bot.image_detector,
+        bot.regions,
+        bot.clock,
+    )
+    trials = bot.config.settings.calibration.trials
+    expected = game.params.input_delay
+    upper = expected + game.params.step + POLL_INTERVAL
+
+    failures = []
+    for action in CALIBRATION_ACTIONS:
+        samples = calibrator.measure(action, trials)
+        if samples:
+            print(
+                f"{action}: {len(samples)}/{trials} 次有效，"
+                f"最小 {min(samples) * 1000:.1f} ms，"
+                f"最大 {max(samples) * 1000:.1f} ms"
+                f"（預期 {expected * 1000:.1f}-{upper * 1000:.1f} ms）"
+            )
+        if len(samples) < trials:
+            failures.append(f"{action}: {trials - len(samples)} 次測量逾時")
+        # 容許浮點誤差
+        outliers = [
+            s for s in samples if not expected - 1e-9 <= s < upper + 1e-9
+        ]
+        if outliers:
+            failures.append(f"{action}: {len(outliers)} 次測量超出預期範圍")
+    return failures
+
+
+def main():
+    try:
+        parser = argparse.ArgumentParser(description="以模擬遊戲執行釣魚流程")
+        parser.add_argument(
+            "--config", default="config.yaml", help="設定檔路徑"
+        )
+        parser.add_argument(
+            "--cycles", type=int, default=20, help="執行的釣魚循環數"
+        )
+        parser.add_argument("--seed", type=int, default=0, help="隨機種子")
+        parser.add_argument(
+            "--window",
+            default="1920x1080",
+            help="模擬視窗大小（寬x高）",
+        )
+        parser.add_argument(
+            "--param",
+            action="append",
+            default=[],
+            metavar="KEY=VALUE",
+            help="覆寫模擬參數（SimulatorParams 的欄位），可重複指定",
+        )
+        parser.add_argument(
+            "--realtime", action="store_true", help="使用實際時間執行"
+        )
+        parser.add_argument("--output", help="將結果保存為 JSON")
+        parser.add_argument(
+            "--trace",
+            help="將執行區段保存為 Chrome trace-event JSON（可在 Perfetto 開啟）",
+        )
+        parser.add_argument(
+            "--profile",
+            action="store_true",
+            help="以取樣分析器分析機器人，結果依 profiler 配置輸出為 .folded",
+        )
+        parser.add_argument(
+            "--calibrate",
+            action="store_true",
+            help="只執行延遲校準，檢查測量值是否符合模擬器的 input_delay",
+        )
+        parser.add_argument(
+            "--verbose", action="store_true", help="顯示模擬中的日誌"
+        )
+        args = parser.parse_args()
+
+        setup_logger("DEBUG" if args.verbose else "WARNING", None)
+        config = load_config(args.config)
+        params = parse_params(args.param)
+        width, height = map(int, args.window.lower().split("x"))
+        random.seed(args.seed)
+
+        tracer = None
+        if args.trace:
+            tracer = Tracer()
+            install(tracer)
+
+        clock = SYSTEM_CLOCK if args.realtime else VirtualClock()
+        game = SimulatedGame(
+            config, (0, 0, width, height), params, clock, args.seed
+        )
+        bot = FishingBot(
+            config,
+            window_manager=game.window_manager,
+            input_controller=SimulatedInputBackend(game, clock),
+            image_detector=ImageDetector(
+                config.settings.detection.threshold, game
+            ),
+            clock=clock,
+        )
+
+        if args.calibrate:
+            try:
+                failures = run_calibration(bot, game)
+            finally:
+                bot.stop()
+            if failures:
+                abort("延遲校準結果不符:\n  " + "\n  ".join(failures))
+            print("延遲校準結果符合模擬器的 input_delay")
+            return
+
+        profiler = None
+        if args.profile:
+            profiler_config = config.settings.profiler
+            profiler = SamplingProfiler(
+                profiler_config.rate, profiler_config.output_dir
+            )
+            profiler.start()
+
+        anti_detection = config.settings.anti_detection
+        start_time = clock.monotonic()
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            for cycle in range(args.cycles):
+                bot._fishing_cycle()
+                clock.sleep(
+                    random.uniform(
+                        anti_detection.rest_time_min,
+                        anti_detection.rest_time_max,
+                    )
+                )
+                print(
+                    f"\r循環 {cycle + 1}/{args.cycles}，"
+                    f"釣到 {game.stats['caught']} 條",
+                    end="",
+                    flush=True,
+                )
+        finally:
+            bot.stop()
+        print()
+
+        if profiler is not None:
+            profile_path = profiler.stop()
+
+        elapsed = clock.monotonic() - start_time
+        wall_time = time.perf_counter() - wall_start
+        cpu_time = time.process_time() - cpu_start
+        bot_cpu = max(cpu_time - game.cpu_time, 0.0)
+        stats = game.stats
+        caught = stats["caught"]
+        hooked = stats["hooked"]
+        metrics = bot.get_metrics()
+
+        results = {
+            "cycles": args.cycles,
+            "seed": args.seed,
+            "params": dataclasses.asdict(params),
+            "game": dict(stats),
+            "bot_fishing_count": bot.fishing_count,
+            "simulated_seconds": round(elapsed, 3),
+            "wall_seconds": round(wall_time, 3),
+            "fish_per_hour": round(caught / elapsed * 3600, 2)
+            if elapsed > 0
+            else 0.0,
+            "tension_success_rate": round(caught / hooked, 4)
+            if hooked
+            else 0.0,
+            "cpu_ms_per_fish": round(bot_cpu / caught * 1000, 2)
+            if caught
+            else None,
+            "simulator_cpu_seconds": round(game.cpu_time, 3),
+            "metrics": metrics,
+        }
+
+        print("=" * 60)
+        print(
+            f"模擬時間 {elapsed / 60:.1f} 分鐘，實際耗時 {wall_time:.1f} 秒"
+            f"（{elapsed / max(wall_time, 1e-9):.0f} 倍速）"
+        )
+        print(
+            f"拋竿 {stats['casts']} 次，咬鉤 {stats['bites']} 次"
+            f"（錯過 {stats['missed_bites']} 次），進入拉力階段 {hooked} 次"
+        )
+        print(
+            f"釣到 {caught} 條，斷線 {stats['line_broken']} 次，"
+            f"脫鉤 {stats['escaped']} 次（機器人計數 {bot.fishing_count}）"
+        )
+        print(f"每小時釣魚數: {results['fish_per_hour']:.1f}")
+        print(f"拉力階段成功率: {results['tension_success_rate']:.1%}")
+        if caught:
+            print(
+                f"每條魚 CPU 時間: {results['cpu_ms_per_fish']:.0f} ms"
+                f"（不含模擬器的 {game.cpu_time:.2f} 秒）"
+            )
+        if metrics is not None:
+            print_phase_table(metrics)
+        print("=" * 60)
+
+        if args.output:
+            Path(args.output).write_text(
+                json.dumps(results, indent=2, ensure_ascii=False),
+                encoding="utf-8",
+            )
+            print(f"結果已保存: {args.output}")
+
+        if profiler is not None:
+            print(
+                f"取樣 {profiler.sample_count} 次"
+                f"（分析器 CPU 時間 {profiler.cpu_time:.2f} 秒），"
+                f"結果已保存: {profile_path}"
+            )
+
+        if tracer is not None:
+            install(None)
+            Path(args.trace).write_text(
+                json.dumps(tracer.to_chrome()), encoding="utf-8"
+            )
+            print(f"追蹤記錄已保存（{len(tracer)} 個區段）: {args.trace}")
+
+    except KeyboardInterrupt:
+        abort("\n用戶中斷")
+
+    except ValueError as e:
+        abort(f"\n參數錯誤: {e}")
+
+
+if __name__ == "__main__":
+    main()
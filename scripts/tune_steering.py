@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+"""
+方向控制器增益調整腳本
+
+從拉力階段記錄（fishing.fish_tracking.record_sessions 開啟時產生）
+擬合魚追蹤模型，並以閉迴路模擬搜索代價最低的 PID 增益。
+
+使用方式：
+    python scripts/tune_steering.py sessions/steering/*.npz
+    python scripts/tune_steering.py sessions/steering --duration 120
+"""
+
+import argparse
+from pathlib import Path
+
+from util import abort
+
+from src.config_manager import ConfigManager
+from src.latency_calibration import LatencyProfile
+from src.steering_controller import (
+    SteeringController,
+    SteeringGains,
+    SteeringTrace,
+    fit_plant_model,
+    simulate_controller,
+    tune_gains,
+)
+
+
+def collect_traces(paths: list[str]) -> list[SteeringTrace]:
+    """載入指定檔案或目錄中的所有記錄"""
+    files: list[Path] = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            files.extend(sorted(path.glob("*.npz")))
+        else:
+            files.append(path)
+
+    traces = []
+    for file in files:
+        trace = SteeringTrace.load(file)
+        print(f"載入 {file}（{len(trace)} 筆）")
+        traces.append(trace)
+    return traces
+
+
+def main():
+    try:
+        parser = argparse.ArgumentParser(description="調整方向控制器增益")
+        parser.add_argument("sessions", nargs="+", help="記錄檔案或目錄")
+        parser.add_argument(
+            "--config", default="config.yaml", help="設定檔路徑"
+        )
+        parser.add_argument(
+            "--duration", type=float, default=60.0, help="每次模擬時長（秒）"
+        )
+        parser.add_argument(
+            "--seeds", type=int, default=3, help="每組增益的模擬次數"
+        )
+        args = parser.parse_args()
+
+        traces = collect_traces(args.sessions)
+        if not traces:
+            abort("找不到任何記錄檔案")
+
+        config = ConfigManager(args.config)
+        settings = config.settings
+        tracking_config = settings.fishing.fish_tracking
+        controller_config = tracking_config.controller
+
+        # 與拉力階段相同，以校準測得的按鍵延遲中位數作為預測時間
+        lookahead = 0.0
+        if settings.calibration.apply:
+            profile = LatencyProfile.load(settings.calibration.output_file)
+            lookahead = profile.percentile("key", 50) or 0.0
+
+        model = fit_plant_model(traces, min_duty=controller_config.min_duty)
+        print("=" * 50)
+        print(
+            f"擬合模型: 增益 {model.gain:.3f}，延遲 {model.delay} 步，"
+            f"取樣間隔 {model.dt:.3f} 秒"
+        )
+
+        # 目前配置的增益作為比較基準
+        current = SteeringGains(
+            kp=controller_config.kp,
+            ki=controller_config.ki,
+            kd=controller_config.kd,
+        )
+        baseline = simulate_controller(
+            model,
+            SteeringController.from_settings(
+                tracking_config, current, lookahead
+            ),
+            args.duration,
+        )
+
+        gains, result = tune_gains(
+            model,
+            tracking_config,
+            lookahead,
+            seeds=args.seeds,
+            duration=args.duration,
+        )
+
+        print("=" * 50)
+        for label, g, r in (
+            ("目前增益", current, baseline),
+            ("建議增益", gains, result),
+        ):
+            print(
+                f"{label}: kp={g.kp} ki={g.ki} kd={g.kd} | "
+                f"平均偏移 {r.mean_abs_error:.4f}，"
+                f"過衝 {r.overshoots_per_second:.2f} 次/秒，"
+                f"按鍵事件 {r.key_events_per_second:.1f} 次/秒"
+            )
+
+        print("=" * 50)
+        print(
+            "將以下設定填入 config.yaml 的 fishing.fish_tracking.controller："
+        )
+        print(f"  kp: {gains.kp}")
+        print(f"  ki: {gains.ki}")
+        print(f"  kd: {gains.kd}")
+
+    except KeyboardInterrupt:
+        abort("\n用戶中斷")
+
+    except Exception as e:
+        abort(f"\n調整增益發生錯誤: {e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,12 @@
 
 import subprocess
 import sys
+from pathlib import Path
+
+# 專案根目錄，加入模組搜尋路徑以便腳本導入 src
+ROOT_DIR = Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
 
 
 def run(cmd: list[str]):
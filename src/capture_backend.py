@@ -0,0 +1,159 @@
+"""
+截圖後端模組
+"""
+
+import bisect
+from collections import deque
+from pathlib import Path
+from typing import Self
+
+import cv2
+import numpy as np
+
+from src.clock import SYSTEM_CLOCK, Clock
+
+
+class ScreenCaptureBackend:
+    """使用 PyAutoGUI 截取螢幕"""
+
+    def __init__(self):
+        """初始化截圖後端"""
+        # 延遲導入：PyAutoGUI 在無顯示環境下導入即失敗，回放或模擬時不需要它
+        import pyautogui
+
+        self._pyautogui = pyautogui
+
+    def capture(
+        self, region: tuple[int, int, int, int] | None = None
+    ) -> np.ndarray:
+        """
+        截取螢幕
+
+        Args:
+            region: 截取區域 (x, y, width, height)
+
+        Returns:
+            截圖（BGR格式）
+        """
+        screenshot = self._pyautogui.screenshot(region=region)
+        return cv2.cvtColor(np.array(screenshot), cv2.COLOR_RGB2BGR)
+
+
+class FrameSequenceCaptureBackend:
+    """
+    回放預先錄製的畫面序列
+
+    畫面為整個視窗的截圖，截取時依 origin（視窗左上角的螢幕座標）
+    裁切出指定區域。未指定 frame_interval 時每次截取前進一張畫面，
+    否則依經過時間選擇畫面。
+    """
+
+    def __init__(
+        self,
+        frames: list[np.ndarray],
+        origin: tuple[int, int] = (0, 0),
+        frame_interval: float | None = None,
+        loop: bool = False,
+        clock: Clock | None = None,
+    ):
+        """
+        初始化回放後端
+
+        Args:
+            frames: 畫面列表（BGR格式）
+            origin: 畫面左上角對應的螢幕座標
+            frame_interval: 畫面間隔（秒），None 表示每次截取前進一張
+            loop: 播放完畢後是否從頭開始
+            clock: 時鐘（畫面間隔與截取時間，預設使用實際時間）
+        """
+        if not frames:
+            raise ValueError("畫面序列不可為空")
+
+        self.frames = frames
+        self.origin = origin
+        self.frame_interval = frame_interval
+        self.loop = loop
+        self.clock = clock or SYSTEM_CLOCK
+        self.index = 0
+        self.start_time = self.clock.monotonic()
+        # 最近的截取時間（clock.monotonic），用於計算畫面到輸入的反應延遲
+        self.capture_times: deque[float] = deque(maxlen=10000)
+
+    @classmethod
+    def from_directory(
+        cls, directory: str | Path, pattern: str = "*.png", **kwargs
+    ) -> Self:
+        """
+        從目錄載入畫面（依檔名排序）
+
+        Args:
+            directory: 畫面目錄
+            pattern: 檔名匹配模式
+            **kwargs: 傳給建構函數的其他參數
+
+        Returns:
+            回放後端
+        """
+        frames = []
+        for path in sorted(Path(directory).glob(pattern)):
+            frame = cv2.imread(str(path))
+            if frame is not None:
+                frames.append(frame)
+        return cls(frames, **kwargs)
+
+    def rewind(self):
+        """從第一張畫面重新開始"""
+        self.index = 0
+        self.start_time = self.clock.monotonic()
+        self.capture_times.clear()
+
+    def last_capture_before(self, timestamp: float) -> float | None:
+        """
+        取得指定時間之前最後一次截取的時間
+
+        Args:
+            timestamp: 時間戳（clock.monotonic）
+
+        Returns:
+            截取時間，之前沒有截取時返回 None
+        """
+        times = list(self.capture_times)
+        index = bisect.bisect_right(times, timestamp)
+        return times[index - 1] if index else None
+
+    def current_frame(self) -> np.ndarray:
+        """取得當前畫面"""
+        if self.frame_interval is None:
+            index = self.index
+            self.index += 1
+        else:
+            elapsed = self.clock.monotonic() - self.start_time
+            index = int(elapsed / self.frame_interval)
+
+        if self.loop:
+            index %= len(self.frames)
+        else:
+            index = min(index, len(self.frames) - 1)
+        return self.frames[index]
+
+    def capture(
+        self, region: tuple[int, int, int, int] | None = None
+    ) -> np.ndarray:
+        """
+        截取當前畫面的指定區域
+
+        Args:
+            region: 截取區域 (x, y, width, height)，螢幕座標
+
+        Returns:
+            截圖（BGR格式）
+        """
+        frame = self.current_frame()
+        self.capture_times.append(self.clock.monotonic())
+        if region is None:
+            return frame.copy()
+
+        x, y, w, h = region
+        left = x - self.origin[0]
+        top = y - self.origin[1]
+        return frame[top : top + h, left : left + w].copy()
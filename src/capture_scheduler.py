@@ -0,0 +1,229 @@
+"""
+多視窗截圖排程模組
+"""
+
+import itertools
+import logging
+import math
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future
+
+import numpy as np
+
+from src.clock import SYSTEM_CLOCK, Clock
+from src.metrics import Metrics
+
+
+class ScheduledCaptureBackend:
+    """
+    經由共用截圖線程截圖的後端（每個視窗一個）
+
+    rate 返回目前允許的每秒截圖次數（0 表示不限制），由排程器在每次
+    選擇下一個截圖請求時查詢，因此可以隨釣魚狀態即時改變。
+    """
+
+    def __init__(self, scheduler: CaptureScheduler, name: str):
+        """
+        初始化排程截圖後端
+
+        Args:
+            scheduler: 截圖排程器
+            name: 視窗名稱（統計用）
+        """
+        self.scheduler = scheduler
+        self.name = name
+        self.rate: Callable[[], float] = lambda: 0.0
+        # 截圖等待時間指標（由多視窗機器人設定，None 時不記錄）
+        self.metrics: Metrics | None = None
+
+        self.last_capture = -math.inf
+        self.capture_count = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def capture(
+        self, region: tuple[int, int, int, int] | None = None
+    ) -> np.ndarray:
+        """
+        排入截圖請求並等待結果
+
+        Args:
+            region: 截取區域 (x, y, width, height)
+
+        Returns:
+            截圖（BGR格式）
+        """
+        return self.scheduler.submit(self, region).result()
+
+
+class CaptureScheduler:
+    """
+    多視窗共用的截圖線程
+
+    所有視窗的截圖都在同一個線程中依序執行。每個請求依所屬視窗目前的
+    截圖頻率上限排程：不限制的視窗（收竿、拉力階段）立即處理並優先於
+    其他視窗，其餘視窗距上次截圖不到 1/rate 秒時延後處理，
+    讓處於時間關鍵階段的視窗取得大部分的截圖時間。
+    """
+
+    def __init__(self, backend, clock: Clock | None = None):
+        """
+        初始化截圖排程器並啟動截圖線程
+
+        Args:
+            backend: 實際截圖後端
+            clock: 時鐘（截圖頻率限制，預設使用實際時間）
+        """
+        self.backend = backend
+        self.clock = clock or SYSTEM_CLOCK
+        self.logger = logging.getLogger("FishingBot.CaptureScheduler")
+        self.clients: list[ScheduledCaptureBackend] = []
+
+        self._condition = threading.Condition()
+        self._pending: list[tuple] = []
+        self._sequence = itertools.count()
+        self._closed = False
+
+        self._thread = threading.Thread(
+            target=self._worker, name="CaptureSchedulerThread", daemon=True
+        )
+        self._thread.start()
+
+    def client(self, name: str) -> ScheduledCaptureBackend:
+        """
+        建立視窗的截圖後端
+
+        Args:
+            name: 視窗名稱
+
+        Returns:
+            經由此排程器截圖的後端
+        """
+        client = ScheduledCaptureBackend(self, name)
+        self.clients.append(client)
+        return client
+
+    def submit(
+        self,
+        client: ScheduledCaptureBackend,
+        region: tuple[int, int, int, int] | None,
+    ) -> Future:
+        """
+        排入截圖請求
+
+        Args:
+            client: 發出請求的視窗
+            region: 截取區域
+
+        Returns:
+            截圖完成時設定結果的 Future
+        """
+        future: Future = Future()
+        with self._condition:
+            if self._closed:
+                future.set_exception(RuntimeError("截圖排程器已停止"))
+                return future
+            self._pending.append(
+                (
+                    next(self._sequence),
+                    client,
+                    region,
+                    future,
+                    self.clock.monotonic(),
+                )
+            )
+            self._condition.notify()
+        return future
+
+    def close(self, timeout: float | None = 1.0):
+        """
+        停止截圖線程（已排入的請求會先處理完畢）
+
+        Args:
+            timeout: 等待線程結束的時間（秒）
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._thread.join(timeout)
+
+    def _next_request(self, now: float) -> tuple[tuple | None, float | None]:
+        """
+        選擇下一個可以處理的請求
+
+        Args:
+            now: 目前時間
+
+        Returns:
+            (請求, None)，或沒有可處理的請求時為 (None, 最早可處理前的等待秒數)
+        """
+        best = None
+        best_key = None
+        wait = None
+        for request in self._pending:
+            sequence, client = request[:2]
+            rate = client.rate()
+            interval = 1.0 / rate if rate > 0 else 0.0
+            ready = client.last_capture + interval
+            # 停止後不再限制頻率，盡快處理剩餘請求
+            if ready > now and not self._closed:
+                wait = ready - now if wait is None else min(wait, ready - now)
+                continue
+
+            # 截圖間隔越短（越接近時間關鍵階段）越優先，相同時先到先處理
+            key = (interval, sequence)
+            if best_key is None or key < best_key:
+                best, best_key = request, key
+        return best, None if best is not None else wait
+
+    def _worker(self):
+        """截圖線程：依排程依序處理截圖請求"""
+        while True:
+            with self._condition:
+                while True:
+                    request, wait = self._next_request(self.clock.monotonic())
+                    if request is not None:
+                        self._pending.remove(request)
+                        break
+                    if self._closed:
+                        return
+                    self._condition.wait(wait)
+
+            _, client, region, future, submit_time = request
+            if not future.set_running_or_notify_cancel():
+                continue
+
+            start = self.clock.monotonic()
+            waited = start - submit_time
+            client.last_capture = start
+            client.capture_count += 1
+            client.wait_total += waited
+            client.wait_max = max(client.wait_max, waited)
+            if client.metrics is not None:
+                client.metrics.observe("capture_wait", waited)
+
+            try:
+                future.set_result(self.backend.capture(region))
+            except Exception as e:
+                future.set_exception(e)
+
+    def get_statistics(self) -> dict[str, dict]:
+        """
+        取得各視窗的截圖統計
+
+        Returns:
+            視窗名稱 → 統計資料字典（等待時間為從排入到開始截圖，單位為毫秒）
+        """
+        return {
+            client.name: {
+                "captures": client.capture_count,
+                "mean_wait_ms": (
+                    client.wait_total / client.capture_count * 1000
+                    if client.capture_count
+                    else 0.0
+                ),
+                "max_wait_ms": client.wait_max * 1000,
+            }
+            for client in self.clients
+        }
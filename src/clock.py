@@ -0,0 +1,252 @@
+"""
+時鐘模組
+"""
+
+import heapq
+import itertools
+import math
+import threading
+import time
+from collections.abc import Callable
+from typing import Protocol
+
+
+class Clock(Protocol):
+    """時鐘介面：所有控制流程的時間讀取與等待都經由時鐘"""
+
+    def time(self) -> float: ...
+
+    def monotonic(self) -> float: ...
+
+    def sleep(self, seconds: float) -> None: ...
+
+    def start_thread(
+        self, target: Callable[[], object], name: str
+    ) -> threading.Thread: ...
+
+    def join(
+        self, thread: threading.Thread, timeout: float | None = None
+    ) -> None: ...
+
+
+class SystemClock:
+    """實際時間"""
+
+    def time(self) -> float:
+        """目前時間（time.time）"""
+        return time.time()
+
+    def monotonic(self) -> float:
+        """單調時間（time.monotonic）"""
+        return time.monotonic()
+
+    def sleep(self, seconds: float):
+        """睡眠指定秒數"""
+        time.sleep(seconds)
+
+    def start_thread(
+        self, target: Callable[[], object], name: str
+    ) -> threading.Thread:
+        """
+        建立並啟動線程
+
+        Args:
+            target: 線程函數
+            name: 線程名稱
+
+        Returns:
+            已啟動的線程
+        """
+        thread = threading.Thread(target=target, name=name)
+        thread.start()
+        return thread
+
+    def join(self, thread: threading.Thread, timeout: float | None = None):
+        """
+        等待線程結束
+
+        Args:
+            thread: 線程
+            timeout: 最多等待的秒數
+        """
+        thread.join(timeout)
+
+
+# 預設使用的實際時鐘
+SYSTEM_CLOCK = SystemClock()
+
+
+class VirtualClock:
+    """
+    虛擬時鐘
+
+    sleep() 不實際等待。參與的線程一次只有一個在執行：執行中的線程
+    sleep() 時交出執行權，時間直接跳到最早的喚醒時間並只喚醒該線程
+    （喚醒時間相同時依進入睡眠的順序），因此檢測等運算不佔用虛擬時間，
+    多線程的控制流程（例如拉力階段的滑鼠與方向控制線程）能以遠快於
+    實際時間的速度執行，且每次執行的時序與事件順序完全相同。
+
+    使用過 sleep()、start_thread()、join() 的線程與由 start_thread()
+    啟動的線程視為參與者。控制線程應以 start_thread() 啟動並以 join()
+    等待結束；參與者在時鐘以外阻塞（例如 Thread.join、等待其他參與者
+    持有的鎖）時，其他參與者無法執行。
+    """
+
+    def __init__(self, start: float = 0.0):
+        """
+        初始化虛擬時鐘
+
+        Args:
+            start: 起始時間（秒）
+        """
+        self._now = start
+        self._cond = threading.Condition()
+        # 等待執行的線程：[喚醒時間, 序號, 線程]
+        self._wakeups: list[list] = []
+        self._sequence = itertools.count()
+        self._running: threading.Thread | None = None
+        self._threads: set[threading.Thread] = set()
+        self._joiners: dict[threading.Thread, list[list]] = {}
+
+    def time(self) -> float:
+        """目前的虛擬時間"""
+        with self._cond:
+            return self._now
+
+    def monotonic(self) -> float:
+        """目前的虛擬時間"""
+        with self._cond:
+            return self._now
+
+    def advance(self, seconds: float):
+        """
+        直接推進時間（不喚醒尚未到期的睡眠）
+
+        Args:
+            seconds: 推進的秒數
+        """
+        with self._cond:
+            self._now += max(seconds, 0.0)
+            self._cond.notify_all()
+
+    def start_thread(
+        self, target: Callable[[], object], name: str
+    ) -> threading.Thread:
+        """
+        建立並啟動參與虛擬時間的線程
+
+        新線程排在目前時間的最後，呼叫端交出執行權後才開始執行。
+
+        Args:
+            target: 線程函數
+            name: 線程名稱
+
+        Returns:
+            已啟動的線程
+        """
+
+        def run():
+            with self._cond:
+                self._wait_turn()
+            try:
+                target()
+            finally:
+                self._exit()
+
+        thread = threading.Thread(target=run, name=name)
+        with self._cond:
+            self._enter()
+            self._threads.add(thread)
+            self._schedule(self._now, thread)
+            thread.start()
+        return thread
+
+    def join(self, thread: threading.Thread, timeout: float | None = None):
+        """
+        等待線程結束（等待期間交出執行權）
+
+        Args:
+            thread: 線程（非由 start_thread() 啟動時直接等待）
+            timeout: 最多等待的虛擬秒數
+        """
+        with self._cond:
+            participant = thread in self._threads
+            if participant:
+                self._enter()
+                wake_time = self._now + (
+                    math.inf if timeout is None else max(timeout, 0.0)
+                )
+                entry = self._schedule(wake_time, threading.current_thread())
+                self._joiners.setdefault(thread, []).append(entry)
+                self._yield()
+                # 逾時醒來時取消登記
+                joiners = self._joiners.get(thread, [])
+                if any(joiner is entry for joiner in joiners):
+                    joiners.remove(entry)
+                finished = thread not in self._threads
+        if not participant:
+            thread.join(timeout)
+        elif finished:
+            # 線程已離開排程，等待它實際結束
+            thread.join()
+
+    def sleep(self, seconds: float):
+        """
+        睡眠到虛擬時間經過指定秒數
+
+        Args:
+            seconds: 睡眠秒數
+        """
+        with self._cond:
+            self._enter()
+            current = threading.current_thread()
+            self._schedule(self._now + max(seconds, 0.0), current)
+            self._yield()
+
+    def _enter(self):
+        """沒有線程在執行時由目前線程執行（呼叫端需持有鎖）"""
+        if self._running is None:
+            self._running = threading.current_thread()
+
+    def _schedule(self, wake_time: float, thread: threading.Thread) -> list:
+        """登記線程的喚醒時間（呼叫端需持有鎖）"""
+        entry = [wake_time, next(self._sequence), thread]
+        heapq.heappush(self._wakeups, entry)
+        return entry
+
+    def _switch(self):
+        """把執行權交給最早喚醒的線程，並推進時間（呼叫端需持有鎖）"""
+        if self._wakeups:
+            wake_time, _, thread = heapq.heappop(self._wakeups)
+            self._now = max(self._now, wake_time)
+            self._running = thread
+        else:
+            self._running = None
+        self._cond.notify_all()
+
+    def _yield(self):
+        """交出執行權並等待輪到目前線程（呼叫端需持有鎖）"""
+        if self._running is threading.current_thread():
+            self._switch()
+        self._wait_turn()
+
+    def _wait_turn(self):
+        """等待輪到目前線程執行（呼叫端需持有鎖）"""
+        current = threading.current_thread()
+        while self._running is not current:
+            self._cond.wait(0.1)
+            running = self._running
+            if running is not None and not running.is_alive():
+                # 執行中的線程未經 start_thread() 啟動且已結束，改由下一個執行
+                self._switch()
+
+    def _exit(self):
+        """由 start_thread() 啟動的線程結束：喚醒等待它的線程並交出執行權"""
+        with self._cond:
+            current = threading.current_thread()
+            self._threads.discard(current)
+            for entry in self._joiners.pop(current, []):
+                entry[0] = self._now
+            heapq.heapify(self._wakeups)
+            if self._running is current:
+                self._switch()
@@ -3,10 +3,13 @@
 """
 
 import sys
+import threading
 from pathlib import Path
 
 import yaml
 
+from src.settings import Settings, compile_settings
+
 
 class ConfigManager:
     """配置管理器"""
@@ -35,6 +38,11 @@ class ConfigManager:
             self.config_path = Path.cwd() / config_path
 
         self.config = self._load_config()
+        self.settings: Settings = compile_settings(self.config)
+
+        # 熱重載時預先驗證好的配置，於階段邊界由 apply_pending() 套用
+        self._pending_lock = threading.Lock()
+        self._pending: tuple[dict, Settings] | None = None
 
     def _load_config(self) -> dict:
         """加載配置檔案"""
@@ -66,6 +74,44 @@ class ConfigManager:
 
         return value
 
+    def load_snapshot(self) -> tuple[dict, Settings]:
+        """
+        讀取並驗證配置檔案，不改變目前使用中的配置
+
+        Returns:
+            (配置字典, 編譯後的配置)
+
+        Raises:
+            ConfigError: 配置包含未知的鍵或型別錯誤
+        """
+        config = self._load_config()
+        return config, compile_settings(config)
+
     def reload(self):
-        """重新加載配置檔案"""
-        self.config = self._load_config()
+        """重新加載配置檔案（驗證失敗時保留原配置並拋出 ConfigError）"""
+        self.config, self.settings = self.load_snapshot()
+
+    def stage(self, config: dict, settings: Settings):
+        """
+        暫存已驗證的新配置，等待 apply_pending() 套用
+
+        Args:
+            config: 配置字典
+            settings: 編譯後的配置
+        """
+        with self._pending_lock:
+            self._pending = (config, settings)
+
+    def apply_pending(self) -> bool:
+        """
+        套用暫存的新配置（應在階段邊界呼叫，避免同一階段讀到新舊混合的值）
+
+        Returns:
+            是否有新配置被套用
+        """
+        with self._pending_lock:
+            pending, self._pending = self._pending, None
+        if pending is None:
+            return False
+        self.config, self.settings = pending
+        return True
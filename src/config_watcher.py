@@ -0,0 +1,116 @@
+"""
+配置熱重載模組
+"""
+
+import logging
+import threading
+from collections.abc import Callable
+
+import yaml
+
+from src.config_manager import ConfigManager
+from src.settings import ConfigError, Settings
+
+
+class ConfigWatcher:
+    """
+    配置檔案監看器
+
+    在獨立線程中定期檢查配置檔案的修改時間，檔案改變時讀取並完整驗證，
+    再呼叫 prepare 預先載入模板與解析區域，最後以 ConfigManager.stage()
+    暫存。控制線程只需在階段邊界呼叫 apply_pending() 一次替換整份配置。
+    驗證失敗時保留目前配置並記錄錯誤。
+    """
+
+    def __init__(
+        self,
+        config: ConfigManager,
+        interval: float = 1.0,
+        prepare: Callable[[Settings], object] | None = None,
+    ):
+        """
+        初始化配置監看器
+
+        Args:
+            config: 配置管理器
+            interval: 檢查間隔（秒）
+            prepare: 新配置暫存前呼叫的準備函數（在監看線程中執行）
+        """
+        self.config = config
+        self.interval = interval
+        self.prepare = prepare
+        self.logger = logging.getLogger("FishingBot.ConfigWatcher")
+
+        self.reload_count = 0
+        self.error_count = 0
+        self._mtime = self._get_mtime()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def _get_mtime(self) -> int | None:
+        """取得配置檔案的修改時間，檔案不存在時返回 None"""
+        try:
+            return self.config.config_path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def start(self):
+        """啟動監看線程"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._worker, name="ConfigWatcherThread", daemon=True
+        )
+        self._thread.start()
+        self.logger.debug("開始監看配置檔案: %s", self.config.config_path)
+
+    def stop(self, timeout: float | None = 1.0):
+        """
+        停止監看線程
+
+        Args:
+            timeout: 等待線程結束的時間（秒）
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _worker(self):
+        """監看線程：檔案修改時間改變時重新載入"""
+        while not self._stop_event.wait(self.interval):
+            self.check()
+
+    def check(self) -> bool:
+        """
+        檢查配置檔案是否改變，改變時載入並暫存新配置
+
+        Returns:
+            是否暫存了新配置
+        """
+        mtime = self._get_mtime()
+        if mtime is None or mtime == self._mtime:
+            return False
+        self._mtime = mtime
+
+        try:
+            data, settings = self.config.load_snapshot()
+        except (ConfigError, yaml.YAMLError, OSError) as e:
+            self.error_count += 1
+            self.logger.error("配置檔案已修改但無法載入，保留目前配置: %s", e)
+            return False
+
+        if self.prepare is not None:
+            try:
+                self.prepare(settings)
+            except Exception as e:
+                self.error_count += 1
+                self.logger.error("新配置準備失敗，保留目前配置: %s", e)
+                return False
+
+        self.config.stage(data, settings)
+        self.reload_count += 1
+        self.logger.info("配置檔案已更新，將於下一個釣魚循環開始時套用")
+        return True
@@ -0,0 +1,133 @@
+"""
+滑鼠移動路徑模組
+"""
+
+import time
+from collections.abc import Callable
+
+import numpy as np
+
+# 支援的移動曲線
+CURSOR_PROFILES = ("linear", "eased", "curved")
+
+
+class CursorPath:
+    """
+    預先計算的滑鼠移動路徑
+
+    times 為每個路徑點相對開始時間的時間偏移（秒），
+    points 為對應的螢幕座標，最後一點必定為目標位置。
+    """
+
+    def __init__(self, times: np.ndarray, points: np.ndarray):
+        """
+        初始化移動路徑
+
+        Args:
+            times: 時間偏移，形狀 (n,)
+            points: 整數座標，形狀 (n, 2)
+        """
+        self.times = times
+        self.points = points
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    @property
+    def duration(self) -> float:
+        """路徑總時長（秒）"""
+        return float(self.times[-1]) if len(self.times) else 0.0
+
+
+def generate_cursor_path(
+    start: tuple[int, int],
+    end: tuple[int, int],
+    duration: float,
+    profile: str = "linear",
+    rate: float = 100.0,
+    curvature: float = 0.15,
+    rng: np.random.Generator | None = None,
+) -> CursorPath:
+    """
+    一次計算所有路徑點
+
+    Args:
+        start: 起點座標
+        end: 終點座標
+        duration: 移動時長（秒）
+        profile: 移動曲線（linear 等速、eased 緩入緩出、curved 緩入緩出的弧線）
+        rate: 每秒路徑點數
+        curvature: curved 曲線的彎曲程度（控制點偏離直線的距離佔移動距離的比例）
+        rng: 隨機數產生器（curved 曲線的彎曲方向與幅度）
+
+    Returns:
+        移動路徑
+    """
+    if profile not in CURSOR_PROFILES:
+        raise ValueError(f"不支援的移動曲線: {profile}")
+
+    steps = max(1, int(duration * rate))
+    times = np.linspace(0.0, duration, steps + 1)[1:]
+    progress = times / duration if duration > 0 else np.ones(steps)
+
+    # 緩入緩出：smoothstep
+    if profile != "linear":
+        progress = progress * progress * (3.0 - 2.0 * progress)
+
+    p0 = np.asarray(start, dtype=np.float64)
+    p2 = np.asarray(end, dtype=np.float64)
+    u = progress[:, np.newaxis]
+
+    if profile == "curved":
+        # 二次貝茲曲線，控制點位於中點的垂直方向
+        rng = rng or np.random.default_rng()
+        delta = p2 - p0
+        normal = np.array([-delta[1], delta[0]])
+        offset = rng.uniform(-curvature, curvature)
+        p1 = (p0 + p2) / 2 + normal * offset
+        points = (1 - u) ** 2 * p0 + 2 * (1 - u) * u * p1 + u**2 * p2
+    else:
+        points = p0 + (p2 - p0) * u
+
+    points = np.rint(points).astype(np.int32)
+    points[-1] = end
+    return CursorPath(times, points)
+
+
+def play_cursor_path(
+    path: CursorPath,
+    set_position: Callable[[int, int], object],
+    clock: Callable[[], float] = time.monotonic,
+    sleep: Callable[[float], object] = time.sleep,
+):
+    """
+    依絕對截止時間播放路徑
+
+    每個路徑點的截止時間為開始時間加上時間偏移，睡眠只等待到截止時間，
+    因此睡眠誤差不會累積。落後時略過已過期的路徑點，直接移到最新的點。
+
+    Args:
+        path: 移動路徑
+        set_position: 設定滑鼠位置的函數
+        clock: 單調時鐘
+        sleep: 睡眠函數
+    """
+    start_time = clock()
+    deadlines = start_time + path.times
+    index = 0
+    count = len(path)
+
+    while index < count:
+        now = clock()
+        remaining = deadlines[index] - now
+        if remaining > 0:
+            sleep(remaining)
+        else:
+            # 落後時跳到最後一個已到期的路徑點
+            index = max(
+                index, int(np.searchsorted(deadlines, now, "right")) - 1
+            )
+
+        x, y = path.points[index]
+        set_position(int(x), int(y))
+        index += 1
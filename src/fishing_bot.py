@@ -2,14 +2,28 @@
 釣魚機器人主邏輯
 """
 
+import contextlib
+import dataclasses
 import logging
 import random
 import time
+from collections.abc import Callable
 from enum import Enum
+from pathlib import Path
 
+from src.clock import SYSTEM_CLOCK, Clock
 from src.config_manager import ConfigManager
+from src.config_watcher import ConfigWatcher
+from src.flight_recorder import FlightRecorder
+from src.hotkey import HotkeyListener
 from src.image_detector import ImageDetector
-from src.input_controller_winapi import WinAPIInputController
+from src.input_arbiter import ArbitratedInputBackend
+from src.input_backend import InputBackend, create_input_backend
+from src.input_executor import AsyncInputController, InputExecutor
+from src.input_state import InputStateManager
+from src.latency_calibration import LatencyCalibrator, LatencyProfile
+from src.metrics import Metrics
+from src.metrics_exporter import MetricsExporter
 from src.phases import (
     CastingPhase,
     CompletionPhase,
@@ -17,77 +31,271 @@ from src.phases import (
     TensionPhase,
     WaitingPhase,
 )
-from src.window_manager import WindowManager
+from src.reaction_latency import ReactionTracker
+from src.region_registry import RegionRegistry
+from src.sampling_profiler import SamplingProfiler
+from src.session_recorder import (
+    SessionCaptureRecorder,
+    SessionInputRecorder,
+    SessionRecorder,
+)
+from src.settings import Settings, template_paths
+from src.telemetry import TelemetryRing
+from src.tracing import Tracer, install
+from src.utils import get_resource_path
+from src.window_manager import WindowManager, WindowManagerLike
+
+# 只在啟動時讀取、熱重載後需重新啟動才會生效的配置區段
+RESTART_REQUIRED_SECTIONS = (
+    "game",
+    "multi_window",
+    "input",
+    "logging",
+    "telemetry",
+    "flight_recorder",
+    "metrics",
+    "tracing",
+    "profiler",
+    "session_recording",
+    "config_reload",
+)
 
 
 class FishingState(Enum):
     """釣魚狀態"""
 
     IDLE = "空閒"
+    PREPARING = "準備"
     CASTING = "拋竿"
     WAITING = "等待咬鉤"
     BITING = "咬鉤"
     REELING = "收竿"
+    TENSION = "拉力計"
 
 
 class FishingBot:
     """釣魚自動化機器人"""
 
-    def __init__(self, config: ConfigManager):
+    def __init__(
+        self,
+        config: ConfigManager,
+        window_manager: WindowManagerLike | None = None,
+        input_controller: InputBackend | None = None,
+        image_detector: ImageDetector | None = None,
+        clock: Clock | None = None,
+        instance: int | None = None,
+    ):
         """
         初始化釣魚機器人
 
         Args:
             config: 設定管理器
+            window_manager: 視窗管理器，None 時依配置建立
+            input_controller: 輸入後端，None 時依 input.backend 建立
+            image_detector: 圖像檢測器，None 時使用螢幕截圖
+            clock: 時鐘，None 時使用實際時間（回放時使用虛擬時鐘）
+            instance: 多視窗模式下的視窗編號（從 0 開始），None 表示單視窗；
+                輸出目錄加上視窗名稱子目錄，指標端點埠號加上編號，
+                追蹤與取樣分析器為整個程序共用，只由第一個視窗建立
         """
         self.config = config
-        self.logger = logging.getLogger("FishingBot")
+        self.clock = clock or SYSTEM_CLOCK
+        self.instance = instance
+        self.name = None if instance is None else f"window{instance + 1}"
+        self.logger = logging.getLogger(
+            "FishingBot" if self.name is None else f"FishingBot.{self.name}"
+        )
+        primary = instance is None or instance == 0
 
         # 讀取滑鼠移動時間配置
-        self.mouse_move_duration = config.get(
-            "anti_detection.mouse_move_duration", 0.0
-        )
+        settings = config.settings
+        self.mouse_move_duration = settings.anti_detection.mouse_move_duration
 
         # 初始化各個模組
-        self.window_manager = WindowManager(config.get("game.window_title"))
-        self.input_controller = WinAPIInputController(
-            config.get("anti_detection.random_delay_min", 0.1),
-            config.get("anti_detection.random_delay_max", 0.5),
+        self.window_manager = window_manager or WindowManager(
+            settings.game.window_title,
+            settings.game.window_rect_ttl,
+            self.clock,
+        )
+        backend = input_controller or create_input_backend(config, self.clock)
+        # 多視窗模式下經由輸入仲裁器激活視窗
+        self._arbitrated_input = (
+            backend if isinstance(backend, ArbitratedInputBackend) else None
         )
-        self.image_detector = ImageDetector(
-            config.get("detection.threshold", 0.8)
+        self.image_detector = image_detector or ImageDetector(
+            settings.detection.threshold
         )
 
+        # 流程錄製：包裝實際發送的輸入與截圖，每個釣魚循環寫入一個錄製檔
+        recording = settings.session_recording
+        self.session_recorder: SessionRecorder | None = None
+        self._input_recorder: SessionInputRecorder | None = None
+        self._capture_recorder: SessionCaptureRecorder | None = None
+        if recording.enabled:
+            self._input_recorder = SessionInputRecorder(backend)
+            backend = self._input_recorder
+            self._capture_recorder = SessionCaptureRecorder(
+                self.image_detector.capture_backend,
+                self.window_manager,
+                recording.max_fps,
+                self.clock,
+            )
+            self.image_detector.capture_backend = self._capture_recorder
+
+        # 畫面飛行記錄：常駐保存各檢測區域最近數秒的畫面，失敗時保存
+        flight = settings.flight_recorder
+        self.flight_recorder = None
+        if flight.enabled:
+            self.flight_recorder = FlightRecorder(
+                self.image_detector.capture_backend,
+                flight.seconds,
+                flight.fps,
+                flight.max_size,
+                flight.grayscale,
+                flight.max_regions,
+                self._output_dir(flight.dir),
+                self.clock,
+            )
+            self.image_detector.capture_backend = self.flight_recorder
+
+        # 在獨立線程中發送輸入，避免點擊延遲阻塞檢測與控制線程
+        self.input_executor = None
+        if settings.input.async_worker:
+            self.input_executor = InputExecutor(backend)
+            backend = AsyncInputController(self.input_executor)
+
+        # 所有控制線程共用的按鍵狀態，略過冗餘的按下與釋放事件
+        self.input_state = InputStateManager(backend)
+        self.input_controller = self.input_state
+
+        # 載入輸入延遲校準結果（未校準時為空分佈）
+        self.latency_profile = LatencyProfile()
+        if settings.calibration.apply:
+            self.latency_profile = LatencyProfile.load(
+                settings.calibration.output_file
+            )
+
+        # 所有階段共用的檢測區域，視窗位置改變時才重新換算
+        self.regions = RegionRegistry(config, self.window_manager)
+
+        # 控制週期遙測：常駐記錄，失敗、逾時或按下熱鍵時保存
+        self.telemetry = None
+        self.hotkeys = HotkeyListener()
+        if settings.telemetry.enabled:
+            self.telemetry = TelemetryRing(
+                settings.telemetry.capacity, self.clock
+            )
+            # 多視窗模式下由 MultiWindowBot 註冊一次，保存所有視窗的遙測
+            if settings.telemetry.dump_hotkey and instance is None:
+                self.hotkeys.register(
+                    settings.telemetry.dump_hotkey,
+                    lambda: self.dump_telemetry("hotkey"),
+                )
+
+        # 執行指標：各階段耗時、檢測與截圖耗時、每小時釣魚數
+        self.metrics = None
+        self.metrics_exporter = None
+        if settings.metrics.enabled:
+            self.metrics = Metrics(self.clock)
+            self.image_detector.metrics = self.metrics
+            self.input_state.reaction = ReactionTracker(
+                self.metrics,
+                dataclasses.asdict(settings.metrics.reaction_budget),
+            )
+            exporter = settings.metrics.exporter
+            if exporter.enabled:
+                self.metrics_exporter = MetricsExporter(
+                    self.metrics,
+                    exporter.host,
+                    exporter.port + (instance or 0),
+                    state=lambda: self.state.name,
+                    states=[state.name for state in FishingState],
+                    counters=self._input_event_counters,
+                )
+
+        # 執行區段追蹤：停止時或按下熱鍵時保存為 Chrome trace-event JSON
+        self.tracer = None
+        if settings.tracing.enabled and primary:
+            self.tracer = Tracer(settings.tracing.capacity)
+            install(self.tracer)
+            if settings.tracing.dump_hotkey:
+                self.hotkeys.register(
+                    settings.tracing.dump_hotkey,
+                    lambda: self._dump_trace("hotkey"),
+                )
+
+        # 取樣分析器：依配置在啟動時開始，或以熱鍵開始／停止
+        profiler = settings.profiler
+        self.profiler = None
+        if (profiler.enabled or profiler.hotkey) and primary:
+            self.profiler = SamplingProfiler(
+                profiler.rate, profiler.output_dir
+            )
+            if profiler.hotkey:
+                self.hotkeys.register(profiler.hotkey, self.profiler.toggle)
+
         # 初始化各階段處理器
         self.casting_phase = CastingPhase(
-            config, self.window_manager, self.input_controller
+            config,
+            self.window_manager,
+            self.input_controller,
+            regions=self.regions,
+            clock=self.clock,
         )
         self.waiting_phase = WaitingPhase(
-            config, self.window_manager, self.image_detector
+            config,
+            self.window_manager,
+            self.image_detector,
+            self.latency_profile,
+            regions=self.regions,
+            telemetry=self.telemetry,
+            clock=self.clock,
         )
         self.tension_phase = TensionPhase(
             config,
             self.window_manager,
             self.input_controller,
             self.image_detector,
+            self.latency_profile,
+            regions=self.regions,
+            telemetry=self.telemetry,
+            clock=self.clock,
         )
         self.completion_phase = CompletionPhase(
             config,
             self.window_manager,
             self.input_controller,
             self.image_detector,
+            regions=self.regions,
+            clock=self.clock,
         )
         self.preparation_phase = PreparationPhase(
             config,
             self.window_manager,
             self.input_controller,
             self.image_detector,
+            regions=self.regions,
+            clock=self.clock,
         )
 
+        # 配置熱重載：監看線程預先驗證新配置並載入模板、解析區域，
+        # 每個釣魚循環開始時才套用
+        self.config_watcher = None
+        if settings.config_reload.enabled:
+            self.config_watcher = ConfigWatcher(
+                config,
+                settings.config_reload.interval,
+                prepare=self._prepare_settings,
+            )
+
         # 釣魚狀態
         self.state = FishingState.IDLE
+        # 狀態切換時呼叫（回放比較、多視窗輸入仲裁等）
+        self.state_listeners: list[Callable[[FishingState], None]] = []
         self.fishing_count = 0
+        self.cycle_count = 0
         self.running = False
+        self._cycle_failures: list[str] = []
 
     def find_game_window(self) -> bool:
         """
@@ -102,10 +310,20 @@ class FishingBot:
         """開始釣魚循環"""
         self.running = True
         self.logger.info("開始自動釣魚...")
+        if self.config_watcher is not None:
+            self.config_watcher.start()
+        if self.metrics_exporter is not None:
+            self.metrics_exporter.start()
+        if self.profiler is not None and self.config.settings.profiler.enabled:
+            self.profiler.start()
+        self.hotkeys.start()
 
         # 確保視窗啟動
-        self.window_manager.activate_window()
-        time.sleep(0.5)
+        if self._arbitrated_input is not None:
+            self._arbitrated_input.activate()
+        else:
+            self.window_manager.activate_window()
+        self.clock.sleep(0.5)
 
         while self.running:
             try:
@@ -113,64 +331,355 @@ class FishingBot:
                 self._fishing_cycle()
 
                 # 釣魚後休息
+                anti_detection = self.config.settings.anti_detection
                 rest_time = random.uniform(
-                    self.config.get("anti_detection.rest_time_min", 1),
-                    self.config.get("anti_detection.rest_time_max", 3),
+                    anti_detection.rest_time_min, anti_detection.rest_time_max
                 )
-                self.logger.debug(f"休息 {rest_time:.2f} 秒")
-                time.sleep(rest_time)
+                self.logger.debug("休息 %.2f 秒", rest_time)
+                self.clock.sleep(rest_time)
 
             except KeyboardInterrupt:
                 self.logger.info("檢測到中斷信號，停止釣魚")
                 break
             except Exception as e:
-                self.logger.error(f"釣魚循環出錯: {e}", exc_info=True)
-                time.sleep(5)
+                self.logger.error("釣魚循環出錯: %s", e, exc_info=True)
+                self.clock.sleep(5)
+
+        self.log_metrics_summary()
+
+    def calibrate_latency(self) -> LatencyProfile:
+        """
+        校準輸入到畫面反應的延遲
+
+        Returns:
+            測量到的延遲分佈
+        """
+        self.logger.info("開始校準輸入延遲...")
+        self.window_manager.activate_window()
+        self.clock.sleep(0.5)
+
+        calibrator = LatencyCalibrator(
+            self.config,
+            self.window_manager,
+            self.input_controller,
+            self.image_detector,
+            self.regions,
+            self.clock,
+        )
+        self.latency_profile = calibrator.calibrate()
+        return self.latency_profile
 
     def stop(self):
         """停止釣魚"""
         self.running = False
+        if self.config_watcher is not None:
+            self.config_watcher.stop()
+        if self.metrics_exporter is not None:
+            self.metrics_exporter.stop()
+        self.hotkeys.stop()
+        self.waiting_phase.shutdown()
+        self.input_state.release_all()
+        if self.input_executor is not None:
+            self.input_executor.shutdown()
+        if self.flight_recorder is not None:
+            self.flight_recorder.close()
+        if self.tracer is not None:
+            self._dump_trace("stop")
+            install(None)
+        if self.profiler is not None:
+            self.profiler.stop()
         self.logger.info("停止自動釣魚")
 
+    def _prepare_settings(self, settings: Settings):
+        """
+        在套用前預先載入新配置的模板並解析區域（於監看線程中執行）
+
+        Args:
+            settings: 尚未套用的新配置
+        """
+        paths = [get_resource_path(path) for path in template_paths(settings)]
+        self.image_detector.preload_templates(
+            list(
+                dict.fromkeys(
+                    paths + self.image_detector.cached_template_paths()
+                )
+            )
+        )
+        self.regions.prepare(settings)
+
+    def _apply_pending_config(self):
+        """在階段邊界套用監看線程暫存的新配置"""
+        previous = self.config.settings
+        if not self.config.apply_pending():
+            return
+
+        settings = self.config.settings
+        self.image_detector.threshold = settings.detection.threshold
+        self.mouse_move_duration = settings.anti_detection.mouse_move_duration
+
+        changed = [
+            section
+            for section in RESTART_REQUIRED_SECTIONS
+            if getattr(previous, section) != getattr(settings, section)
+        ]
+        if changed:
+            self.logger.warning(
+                "以下配置區段需重新啟動才會生效: %s", ", ".join(changed)
+            )
+        self.logger.info("已套用新配置")
+
     def _fishing_cycle(self):
         """執行一次完整的釣魚流程"""
+        self._apply_pending_config()
+        self.cycle_count += 1
+        self._cycle_failures = []
+        self._start_session_recording()
+        self._increment("cycles")
+        try:
+            with self._timer("cycle"):
+                self._run_fishing_cycle()
+        except Exception:
+            self._report_failure("error")
+            raise
+        finally:
+            # 確保流程結束時沒有按住的按鍵，出錯時也回到閒置狀態
+            self.input_state.release_all()
+            if self.state != FishingState.IDLE:
+                self._set_state(FishingState.IDLE)
+            self._finish_session_recording()
+
+        interval = self.config.settings.metrics.summary_interval
+        if interval and self.cycle_count % interval == 0:
+            self.log_metrics_summary()
+
+    def _set_state(self, state: FishingState):
+        """切換釣魚狀態（錄製中時記錄階段切換，並通知 state_listeners）"""
+        self.state = state
+        if self.session_recorder is not None:
+            self.session_recorder.record_phase(state.name.lower())
+        for listener in self.state_listeners:
+            listener(state)
+
+    def _report_failure(self, reason: str):
+        """
+        記錄本次循環的失敗（逾時或出錯）並保存遙測
+
+        Args:
+            reason: 失敗原因
+        """
+        self._cycle_failures.append(reason)
+        self._increment(f"failures.{reason}")
+        if self.session_recorder is not None:
+            self.session_recorder.record_event("failure", reason=reason)
+        self.dump_telemetry(reason)
+        if self.flight_recorder is not None:
+            self.flight_recorder.trigger(reason)
+
+    def _start_session_recording(self):
+        """開始錄製本次釣魚循環（未啟用錄製時略過）"""
+        if self._capture_recorder is None or self._input_recorder is None:
+            return
+
+        recording = self.config.settings.session_recording
+        try:
+            config_text = self.config.config_path.read_text(encoding="utf-8")
+        except OSError:
+            config_text = None
+
+        filename = (
+            time.strftime("%Y%m%d_%H%M%S") + f"_{self.cycle_count:04d}.zip"
+        )
+        self.session_recorder = SessionRecorder(
+            Path(self._output_dir(recording.dir)) / filename,
+            self.clock,
+            config_text,
+        )
+        self._capture_recorder.attach(self.session_recorder)
+        self._input_recorder.recorder = self.session_recorder
+
+    def _finish_session_recording(self):
+        """結束本次錄製，依 keep 配置刪除成功循環的錄製檔"""
+        recorder = self.session_recorder
+        if recorder is None:
+            return
+
+        if self._capture_recorder is not None:
+            self._capture_recorder.attach(None)
+        if self._input_recorder is not None:
+            self._input_recorder.recorder = None
+        self.session_recorder = None
+        recorder.close()
+
+        keep = self.config.settings.session_recording.keep
+        if keep == "failed" and not self._cycle_failures:
+            recorder.path.unlink(missing_ok=True)
+            self.logger.debug("本次循環成功，刪除錄製檔: %s", recorder.path)
+
+    def _run_fishing_cycle(self):
+        """依序執行各釣魚階段"""
 
         # 檢查魚竿是否耐久度耗盡
-        self.preparation_phase.check_and_replace_rod()
+        self._set_state(FishingState.PREPARING)
+        with self._timer("phase.preparation"):
+            self.preparation_phase.check_and_replace_rod()
 
         # 1. 拋竿
-        self.state = FishingState.CASTING
-        self.casting_phase.execute()
+        self._set_state(FishingState.CASTING)
+        with self._timer("phase.cast"):
+            self.casting_phase.execute()
 
         # 2. 等待咬鉤
-        self.state = FishingState.WAITING
+        self._set_state(FishingState.WAITING)
         count = 0
         while count < 2:
-            if self.waiting_phase.wait_for_bite():
+            with self._timer("phase.bite_wait"):
+                bitten = self.waiting_phase.wait_for_bite()
+            if bitten:
                 self.logger.info("上鉤了！")
 
                 # 3. 收竿
-                self.state = FishingState.REELING
-                self.waiting_phase.reel_in(self.input_controller)
+                self._set_state(FishingState.REELING)
+                with self._timer("phase.reel"):
+                    self.waiting_phase.reel_in(self.input_controller)
 
-                # 檢測是否出現拉力計
-                if self.tension_phase.detect_tension_bar():
+                    # 檢測是否出現拉力計
+                    tension = self.tension_phase.detect_tension_bar()
+                if tension:
                     self.logger.info("檢測到拉力計，進入魚追蹤階段")
-                    self.tension_phase.handle_tension_phase()
+                    self._set_state(FishingState.TENSION)
+                    with self._timer("phase.tension"):
+                        completed = self.tension_phase.handle_tension_phase()
+                    if not completed:
+                        self._report_failure("tension_timeout")
                 else:
                     self.logger.debug("未檢測到拉力計，直接完成收竿")
 
                 # 統計釣魚次數
                 self.fishing_count += 1
-                self.logger.info(f"成功釣魚 #{self.fishing_count}")
+                self._increment("fish")
+                self.logger.info("成功釣魚 #%s", self.fishing_count)
                 break
             else:
                 self.logger.warning("等待咬鉤逾時，重新開始")
+                self._report_failure("bite_timeout")
                 count += 1
 
         # 4. 重置狀態 - 點擊"再來一次"按鈕
-        self.state = FishingState.IDLE
-        self.completion_phase.reset_and_continue()
+        self._set_state(FishingState.IDLE)
+        with self._timer("phase.completion"):
+            found = self.completion_phase.reset_and_continue()
+        if not found:
+            self._report_failure("retry_button_not_found")
+
+    def _timer(self, name: str) -> contextlib.AbstractContextManager:
+        """
+        測量區塊耗時的計時器（未啟用指標時不測量）
+
+        Args:
+            name: 直方圖名稱
+        """
+        if self.metrics is None:
+            return contextlib.nullcontext()
+        return self.metrics.timer(name)
+
+    def _increment(self, name: str):
+        """增加指標計數器（未啟用指標時略過）"""
+        if self.metrics is not None:
+            self.metrics.increment(name)
+
+    def get_metrics(self) -> dict | None:
+        """
+        取得執行指標摘要
+
+        Returns:
+            指標摘要（含每小時釣魚數與截圖 FPS），未啟用指標時為 None
+        """
+        if self.metrics is None:
+            return None
+        snapshot = self.metrics.snapshot()
+        snapshot["fish_per_hour"] = self.metrics.rate("fish") * 3600
+        snapshot["capture_fps"] = self.metrics.rate("capture")
+        snapshot["input_events"] = self.input_state.get_statistics()["events"]
+        return snapshot
+
+    def _input_event_counters(self) -> dict[str, int]:
+        """取得依類型的輸入事件數（指標端點用）"""
+        events = self.input_state.get_statistics()["events"]
+        return {
+            f"input_events.{kind}": count for kind, count in events.items()
+        }
+
+    def log_metrics_summary(self):
+        """輸出執行指標摘要日誌（未啟用指標時略過）"""
+        metrics = self.get_metrics()
+        if metrics is None:
+            return
+
+        counters = metrics["counters"]
+        self.logger.info(
+            "指標摘要: 循環 %s 次，釣魚 %s 條，每小時 %.1f 條，截圖 %.1f FPS",
+            counters.get("cycles", 0),
+            counters.get("fish", 0),
+            metrics["fish_per_hour"],
+            metrics["capture_fps"],
+        )
+        over_budget = {
+            name.removeprefix("reaction_over_budget."): count
+            for name, count in counters.items()
+            if name.startswith("reaction_over_budget.")
+        }
+        if over_budget:
+            self.logger.info(
+                "反應延遲超過預算: "
+                + "，".join(
+                    f"{name} {n} 次" for name, n in over_budget.items()
+                )
+            )
+        for name, summary in metrics["histograms"].items():
+            if not summary["count"]:
+                continue
+            self.logger.info(
+                "  %s: %s 次，p50 %.1f ms，p95 %.1f ms，p99 %.1f ms",
+                name,
+                summary["count"],
+                summary["p50"] * 1000,
+                summary["p95"] * 1000,
+                summary["p99"] * 1000,
+            )
+
+    def _output_dir(self, directory: str) -> str:
+        """
+        取得此視窗的輸出目錄（多視窗模式下加上視窗名稱子目錄）
+
+        Args:
+            directory: 配置的輸出目錄
+        """
+        if self.name is None:
+            return directory
+        return str(Path(directory) / self.name)
+
+    def dump_telemetry(self, reason: str):
+        """
+        保存控制週期遙測記錄（未啟用遙測時略過）
+
+        Args:
+            reason: 觸發原因
+        """
+        if self.telemetry is not None:
+            self.telemetry.dump(
+                self._output_dir(self.config.settings.telemetry.dump_dir),
+                reason,
+            )
+
+    def _dump_trace(self, reason: str):
+        """
+        保存執行區段追蹤記錄（未啟用追蹤時略過）
+
+        Args:
+            reason: 觸發原因
+        """
+        if self.tracer is not None:
+            self.tracer.dump(self.config.settings.tracing.dump_dir, reason)
 
     def get_statistics(self) -> dict:
         """
@@ -179,7 +688,34 @@ class FishingBot:
         Returns:
             統計資料字典
         """
-        return {
+        statistics = {
             "fishing_count": self.fishing_count,
             "current_state": self.state.value,
+            "bite_detectors": self.waiting_phase.get_bite_detector_stats(),
+            "input_state": self.input_state.get_statistics(),
         }
+        if self.input_executor is not None:
+            statistics["input_queue"] = self.input_executor.get_statistics()
+        if self.telemetry is not None:
+            statistics["telemetry"] = {
+                "records": len(self.telemetry),
+                "dumps": self.telemetry.dump_count,
+            }
+        if self.flight_recorder is not None:
+            statistics["flight_recorder"] = {
+                "memory_bytes": self.flight_recorder.memory_bytes(),
+                "dumps": self.flight_recorder.dump_count,
+            }
+        if self.metrics is not None:
+            statistics["metrics"] = self.get_metrics()
+        if self.tracer is not None:
+            statistics["tracing"] = {
+                "spans": len(self.tracer),
+                "dumps": self.tracer.dump_count,
+            }
+        if self.config_watcher is not None:
+            statistics["config_reload"] = {
+                "reloads": self.config_watcher.reload_count,
+                "errors": self.config_watcher.error_count,
+            }
+        return statistics
@@ -0,0 +1,259 @@
+"""
+畫面飛行記錄器模組
+"""
+
+import json
+import logging
+import math
+import queue
+import threading
+import time
+import zipfile
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+from src.clock import SYSTEM_CLOCK, Clock
+
+
+class _RegionRing:
+    """單一截取區域的畫面環形緩衝區（建立時一次配置）"""
+
+    def __init__(self, capacity: int, shape: tuple[int, ...]):
+        self.frames = np.zeros((capacity, *shape), dtype=np.uint8)
+        self.times = np.zeros(capacity, dtype=np.float64)
+        self.count = 0
+        self.last_time = -math.inf
+
+    def __len__(self) -> int:
+        return min(self.count, len(self.frames))
+
+    def snapshot(self) -> tuple[np.ndarray, np.ndarray]:
+        """依時間順序複製目前的畫面與時間戳"""
+        capacity = len(self.frames)
+        if self.count <= capacity:
+            order = np.arange(self.count)
+        else:
+            start = self.count % capacity
+            order = np.r_[start:capacity, 0:start]
+        return self.frames[order], self.times[order]
+
+
+class FlightRecorder:
+    """
+    畫面飛行記錄器（截圖後端包裝）
+
+    常駐保存每個截取區域最近 seconds 秒的畫面：每個區域每秒最多記錄 fps 張，
+    縮小到最長邊 max_size 像素（可轉為灰階）後寫入建立時配置好的環形緩衝區，
+    記憶體不隨運行時間增加。等待咬鉤逾時、找不到"再來一次"按鈕等失敗時
+    呼叫 trigger()，由背景線程複製緩衝區並寫入 zip，不會阻塞控制線程。
+    """
+
+    def __init__(
+        self,
+        backend,
+        seconds: float = 10.0,
+        fps: float = 5.0,
+        max_size: int = 320,
+        grayscale: bool = True,
+        max_regions: int = 8,
+        output_dir: str = "flight_recorder",
+        clock: Clock | None = None,
+    ):
+        """
+        初始化飛行記錄器並啟動寫入線程
+
+        Args:
+            backend: 實際截圖後端
+            seconds: 保存的時間長度（秒）
+            fps: 每個區域每秒最多記錄的畫面數
+            max_size: 縮小後的最長邊（像素）
+            grayscale: 是否轉為灰階保存
+            max_regions: 最多記錄的截取區域數（超過時新的區域不記錄）
+            output_dir: 輸出目錄
+            clock: 時鐘
+        """
+        if seconds <= 0 or fps <= 0 or max_size <= 0:
+            raise ValueError("seconds、fps 與 max_size 必須大於 0")
+
+        self.backend = backend
+        self.seconds = seconds
+        self.interval = 1.0 / fps
+        self.capacity = max(1, math.ceil(seconds * fps))
+        self.max_size = max_size
+        self.grayscale = grayscale
+        self.max_regions = max_regions
+        self.output_dir = output_dir
+        self.clock = clock or SYSTEM_CLOCK
+        self.logger = logging.getLogger("FishingBot.FlightRecorder")
+
+        self._lock = threading.Lock()
+        self._rings: dict[tuple[int, int, int, int] | None, _RegionRing] = {}
+        self.dump_count = 0
+
+        self._queue: queue.Queue[tuple[str, float] | None] = queue.Queue()
+        self._thread = threading.Thread(
+            target=self._writer, name="FlightRecorderThread", daemon=True
+        )
+        self._thread.start()
+
+    def __getattr__(self, name: str):
+        # 其他屬性轉交內部後端
+        if name == "backend":
+            raise AttributeError(name)
+        return getattr(self.backend, name)
+
+    def capture(
+        self, region: tuple[int, int, int, int] | None = None
+    ) -> np.ndarray:
+        """
+        截取指定區域並記錄到環形緩衝區
+
+        Args:
+            region: 截取區域 (x, y, width, height)
+
+        Returns:
+            截圖（BGR格式）
+        """
+        frame = self.backend.capture(region)
+        if frame is not None and frame.size:
+            self._record(region, frame)
+        return frame
+
+    def _record(
+        self, region: tuple[int, int, int, int] | None, frame: np.ndarray
+    ):
+        """縮小畫面並寫入該區域的環形緩衝區（距上次記錄不到間隔時略過）"""
+        now = self.clock.monotonic()
+        with self._lock:
+            ring = self._rings.get(region)
+            if ring is None:
+                if len(self._rings) >= self.max_regions:
+                    return
+                ring = _RegionRing(self.capacity, self._slot_shape(frame))
+                self._rings[region] = ring
+            if now - ring.last_time < self.interval:
+                return
+
+            index = ring.count % self.capacity
+            slot = ring.frames[index]
+            if self.grayscale and frame.ndim == 3:
+                frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+            elif not self.grayscale and frame.ndim == 2:
+                frame = cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR)
+            cv2.resize(
+                frame,
+                (slot.shape[1], slot.shape[0]),
+                dst=slot,
+                interpolation=cv2.INTER_AREA,
+            )
+            ring.times[index] = now
+            ring.count += 1
+            ring.last_time = now
+
+    def _slot_shape(self, frame: np.ndarray) -> tuple[int, ...]:
+        """依第一張畫面決定縮小後的大小"""
+        height, width = frame.shape[:2]
+        scale = min(1.0, self.max_size / max(height, width))
+        shape = (max(1, round(height * scale)), max(1, round(width * scale)))
+        return shape if self.grayscale else (*shape, 3)
+
+    def memory_bytes(self) -> int:
+        """目前配置的緩衝區大小（位元組）"""
+        with self._lock:
+            return sum(ring.frames.nbytes for ring in self._rings.values())
+
+    def trigger(self, reason: str):
+        """
+        保存目前緩衝區的畫面（交給寫入線程，立即返回）
+
+        Args:
+            reason: 觸發原因（加入檔名）
+        """
+        self._queue.put((reason, self.clock.monotonic()))
+
+    def close(self, timeout: float | None = 5.0):
+        """
+        等待已觸發的保存完成並停止寫入線程
+
+        Args:
+            timeout: 等待時間（秒）
+        """
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join(timeout)
+
+    def _writer(self):
+        """寫入線程：依序處理觸發的保存"""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            reason, trigger_time = item
+            try:
+                self._dump(reason, trigger_time)
+            except Exception as e:
+                self.logger.error("保存飛行記錄失敗: %s", e)
+
+    def _dump(self, reason: str, trigger_time: float):
+        """複製各區域的緩衝區並寫入 zip（於寫入線程中執行）"""
+        with self._lock:
+            snapshots = {
+                region: ring.snapshot()
+                for region, ring in self._rings.items()
+                if len(ring)
+            }
+
+        # 只保存觸發前 seconds 秒內的畫面（較少截取的區域可能留有更早的畫面）
+        start_time = trigger_time - self.seconds
+        for region, (frames, times) in list(snapshots.items()):
+            recent = times >= start_time
+            if recent.any():
+                snapshots[region] = (frames[recent], times[recent])
+            else:
+                del snapshots[region]
+        if not snapshots:
+            return
+
+        path = Path(self.output_dir)
+        path.mkdir(parents=True, exist_ok=True)
+        file = path / (
+            time.strftime("%Y%m%d_%H%M%S")
+            + f"_{self.dump_count:03d}_{reason}.zip"
+        )
+
+        index = []
+        with zipfile.ZipFile(file, "w", zipfile.ZIP_STORED) as archive:
+            for region, (frames, times) in snapshots.items():
+                folder = (
+                    "full"
+                    if region is None
+                    else "_".join(str(value) for value in region)
+                )
+                for i, (frame, timestamp) in enumerate(
+                    zip(frames, times, strict=True)
+                ):
+                    offset = timestamp - trigger_time
+                    name = f"{folder}/{i:03d}_{offset * 1000:+07.0f}ms.png"
+                    ok, encoded = cv2.imencode(".png", frame)
+                    if ok:
+                        archive.writestr(name, encoded.tobytes())
+                        index.append(
+                            {
+                                "file": name,
+                                "region": region,
+                                "offset": round(offset, 4),
+                            }
+                        )
+            archive.writestr(
+                "index.json",
+                json.dumps(
+                    {"reason": reason, "frames": index},
+                    ensure_ascii=False,
+                    indent=2,
+                ),
+            )
+
+        self.dump_count += 1
+        self.logger.info("飛行記錄已保存（%s 張畫面）: %s", len(index), file)
@@ -0,0 +1,112 @@
+"""
+全域熱鍵模組
+"""
+
+import logging
+import sys
+import threading
+from collections.abc import Callable
+
+
+def virtual_key_code(key: str) -> int:
+    """
+    將按鍵名稱轉換為 Windows 虛擬鍵碼
+
+    Args:
+        key: 按鍵名稱，支援 F1-F24、單一英文字母或數字
+
+    Returns:
+        虛擬鍵碼
+    """
+    name = key.strip().upper()
+    if len(name) == 1 and name.isascii() and name.isalnum():
+        return ord(name)
+    if name.startswith("F") and name[1:].isdigit():
+        number = int(name[1:])
+        if 1 <= number <= 24:
+            return 0x70 + number - 1
+    raise ValueError(f"不支援的熱鍵: {key}")
+
+
+class HotkeyListener:
+    """
+    全域熱鍵監聽器
+
+    在獨立線程中以 GetAsyncKeyState 輪詢已註冊的按鍵，按下時呼叫對應函數
+    （按住不放只觸發一次）。遊戲視窗在前景時也能觸發，不需要鍵盤掛鉤。
+    非 Windows 平台不啟動監聽線程。
+    """
+
+    def __init__(self, interval: float = 0.05):
+        """
+        初始化熱鍵監聽器
+
+        Args:
+            interval: 輪詢間隔（秒）
+        """
+        self.interval = interval
+        self.logger = logging.getLogger("FishingBot.HotkeyListener")
+
+        self._bindings: dict[int, tuple[str, Callable[[], object]]] = {}
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def register(self, key: str, callback: Callable[[], object]):
+        """
+        註冊熱鍵
+
+        Args:
+            key: 按鍵名稱（見 virtual_key_code）
+            callback: 按下時呼叫的函數（在監聽線程中執行）
+        """
+        self._bindings[virtual_key_code(key)] = (key, callback)
+
+    def start(self):
+        """啟動監聽線程"""
+        if not self._bindings:
+            return
+        if sys.platform != "win32":
+            self.logger.debug("非 Windows 平台，不啟用熱鍵")
+            return
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._worker, name="HotkeyThread", daemon=True
+        )
+        self._thread.start()
+        self.logger.info(
+            "已啟用熱鍵: %s",
+            ", ".join(key for key, _ in self._bindings.values()),
+        )
+
+    def stop(self, timeout: float | None = 1.0):
+        """
+        停止監聽線程
+
+        Args:
+            timeout: 等待線程結束的時間（秒）
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _worker(self):
+        """監聽線程：偵測按鍵由放開變為按下"""
+        # 只在 Windows 上啟動此線程
+        from ctypes import windll
+
+        get_key_state = windll.user32.GetAsyncKeyState
+        pressed = dict.fromkeys(self._bindings, False)
+
+        while not self._stop_event.wait(self.interval):
+            for vk_code, (key, callback) in self._bindings.items():
+                is_down = bool(get_key_state(vk_code) & 0x8000)
+                if is_down and not pressed[vk_code]:
+                    try:
+                        callback()
+                    except Exception as e:
+                        self.logger.error("熱鍵 %s 處理失敗: %s", key, e)
+                pressed[vk_code] = is_down
@@ -3,27 +3,147 @@
 """
 
 import logging
+import threading
+import time
 from pathlib import Path
 
 import cv2
 import numpy as np
-import pyautogui
 import pytesseract
 
+from src.capture_backend import ScreenCaptureBackend
+from src.metrics import Metrics, timed
+from src.tracing import traced
+
+
+class TemplateCache:
+    """
+    模板圖像快取
+
+    路徑 → 圖像（不存在或無法讀取時為 None）。更新時整個替換字典，
+    檢測線程讀取時不需加鎖；多視窗模式下所有檢測器共用同一個快取。
+    """
+
+    def __init__(self):
+        """初始化模板快取"""
+        self.logger = logging.getLogger("FishingBot.TemplateCache")
+        self._templates: dict[str, np.ndarray | None] = {}
+        self._lock = threading.Lock()
+
+    def _read(self, template_path: str) -> np.ndarray | None:
+        """從磁碟讀取模板圖像"""
+        template_file = Path(template_path)
+        if not template_file.exists():
+            self.logger.warning("模板檔案不存在: %s", template_path)
+            return None
+
+        template = cv2.imread(str(template_file))
+        if template is None:
+            self.logger.error("無法加載模板圖像: %s", template_path)
+        return template
+
+    def load(self, template_path: str) -> np.ndarray | None:
+        """
+        取得模板圖像（首次使用時從磁碟讀取並快取）
+
+        Args:
+            template_path: 模板圖像路徑
+
+        Returns:
+            模板圖像，不存在或無法讀取時返回 None
+        """
+        try:
+            return self._templates[template_path]
+        except KeyError:
+            pass
+
+        with self._lock:
+            if template_path not in self._templates:
+                self._templates = {
+                    **self._templates,
+                    template_path: self._read(template_path),
+                }
+            return self._templates[template_path]
+
+    def preload(self, template_paths: list[str]):
+        """
+        從磁碟重新讀取模板圖像並替換快取
+
+        Args:
+            template_paths: 模板圖像路徑列表
+        """
+        loaded = {path: self._read(path) for path in template_paths}
+        with self._lock:
+            self._templates = {**self._templates, **loaded}
+
+    def paths(self) -> list[str]:
+        """
+        取得已快取的模板路徑
+
+        Returns:
+            模板路徑列表
+        """
+        return list(self._templates)
+
 
 class ImageDetector:
     """圖像檢測器"""
 
-    def __init__(self, threshold: float = 0.8):
+    def __init__(
+        self,
+        threshold: float = 0.8,
+        capture_backend=None,
+        templates: TemplateCache | None = None,
+    ):
         """
         初始化圖像檢測器
 
         Args:
             threshold: 匹配閾值
+            capture_backend: 截圖後端（預設截取螢幕，回放或模擬時可替換）
+            templates: 模板快取（多個檢測器可共用，預設建立新的快取）
         """
         self.threshold = threshold
+        self.capture_backend = capture_backend or ScreenCaptureBackend()
+        self.templates = templates or TemplateCache()
+        # 截圖與檢測耗時指標（由機器人設定，None 時不測量）
+        self.metrics: Metrics | None = None
+        # 各線程最近一次截圖的開始時間（反應延遲的起點）
+        self._capture_local = threading.local()
         self.logger = logging.getLogger("FishingBot.ImageDetector")
 
+    def load_template(self, template_path: str) -> np.ndarray | None:
+        """
+        取得模板圖像（首次使用時從磁碟讀取並快取）
+
+        Args:
+            template_path: 模板圖像路徑
+
+        Returns:
+            模板圖像，不存在或無法讀取時返回 None
+        """
+        return self.templates.load(template_path)
+
+    def preload_templates(self, template_paths: list[str]):
+        """
+        從磁碟重新讀取模板圖像並替換快取
+
+        Args:
+            template_paths: 模板圖像路徑列表
+        """
+        self.templates.preload(template_paths)
+
+    def cached_template_paths(self) -> list[str]:
+        """
+        取得已快取的模板路徑
+
+        Returns:
+            模板路徑列表
+        """
+        return self.templates.paths()
+
+    @traced("capture", "capture")
+    @timed("capture")
     def capture_screen(
         self, region: tuple[int, int, int, int] | None = None
     ) -> np.ndarray | None:
@@ -36,13 +156,24 @@ class ImageDetector:
         Returns:
             截圖的 numpy 陣列，失敗時返回 None
         """
+        self._capture_local.time = time.perf_counter()
         try:
-            screenshot = pyautogui.screenshot(region=region)
-            return cv2.cvtColor(np.array(screenshot), cv2.COLOR_RGB2BGR)
+            return self.capture_backend.capture(region)
         except Exception as e:
             self.logger.error(f"截屏失敗: {e}")
             return None
 
+    def last_capture_time(self) -> float | None:
+        """
+        取得目前線程最近一次截圖的開始時間
+
+        Returns:
+            perf_counter 時間，此線程尚未截圖時返回 None
+        """
+        return getattr(self._capture_local, "time", None)
+
+    @traced("find_template", "detector")
+    @timed("detector.find_template")
     def find_template(
         self,
         screen: np.ndarray | None,
@@ -68,25 +199,23 @@ class ImageDetector:
             threshold if threshold is not None else self.threshold
         )
 
-        template_file = Path(template_path)
-        if not template_file.exists():
-            self.logger.warning(f"模板檔案不存在: {template_path}")
+        template = self.load_template(template_path)
+        if template is None:
             return None
 
         try:
-            template = cv2.imread(str(template_file))
-            if template is None:
-                self.logger.error(f"無法加載模板圖像: {template_path}")
-                return None
-
             # 檢查尺寸：搜索區域必須 >= 模板圖片
             screen_h, screen_w = screen.shape[:2]
             template_h, template_w = template.shape[:2]
 
             if screen_h < template_h or screen_w < template_w:
                 self.logger.warning(
-                    f"搜索區域 ({screen_w}x{screen_h}) 小於模板 ({template_w}x{template_h})，"
-                    f"請調整遊戲窗口大小或使用更小的模板圖片"
+                    "搜索區域 (%dx%d) 小於模板 (%dx%d)，"
+                    "請調整遊戲窗口大小或使用更小的模板圖片",
+                    screen_w,
+                    screen_h,
+                    template_w,
+                    template_h,
                 )
                 return None
 
@@ -99,17 +228,22 @@ class ImageDetector:
                 center_x = max_loc[0] + w // 2
                 center_y = max_loc[1] + h // 2
                 self.logger.debug(
-                    f"找到模板，匹配度: {max_val:.2f}，位置: ({center_x}, {center_y})"
+                    "找到模板，匹配度: %.2f，位置: (%d, %d)",
+                    max_val,
+                    center_x,
+                    center_y,
                 )
                 return (center_x, center_y)
             else:
-                self.logger.debug(f"未找到模板，最高匹配度: {max_val:.2f}")
+                self.logger.debug("未找到模板，最高匹配度: %.2f", max_val)
                 return None
 
         except Exception as e:
             self.logger.error(f"模板匹配失敗: {e}")
             return None
 
+    @traced("detect_red_ratio", "detector")
+    @timed("detector.detect_red_ratio")
     def detect_red_ratio(
         self,
         screen: np.ndarray,
@@ -148,12 +282,12 @@ class ImageDetector:
 
             if critical_ratio > 0.95:
                 self.logger.debug(
-                    f"檢測到張力過高，像素比例: {critical_ratio:.3f}"
+                    "檢測到張力過高，像素比例: %.3f", critical_ratio
                 )
                 return 100
             if critical_ratio > 0.6:
                 self.logger.debug(
-                    f"檢測到張力較高，像素比例: {critical_ratio:.3f}"
+                    "檢測到張力較高，像素比例: %.3f", critical_ratio
                 )
                 return 50
 
@@ -193,7 +327,7 @@ class ImageDetector:
             )
 
             if color_diff <= tolerance * 3:
-                self.logger.debug(f"檢測到顏色變化，平均顏色: {avg_color}")
+                self.logger.debug("檢測到顏色變化，平均顏色: %s", avg_color)
                 return True
             return False
 
@@ -224,6 +358,34 @@ class ImageDetector:
         if screen is None:
             return False
 
+        return self.detect_color_in_screen(
+            screen, color_min, color_max, min_pixel_ratio
+        )
+
+    @traced("detect_color_in_screen", "detector")
+    @timed("detector.detect_color_in_screen")
+    def detect_color_in_screen(
+        self,
+        screen: np.ndarray | None,
+        color_min: tuple[int, int, int],
+        color_max: tuple[int, int, int],
+        min_pixel_ratio: float = 0.01,
+    ) -> bool:
+        """
+        檢測已截取的圖像中是否存在特定顏色範圍的像素
+
+        Args:
+            screen: 螢幕截圖（BGR格式）
+            color_min: 最小顏色值 (B, G, R)
+            color_max: 最大顏色值 (B, G, R)
+            min_pixel_ratio: 最小像素比例（0.0-1.0），超過此比例才判定為存在該顏色
+
+        Returns:
+            是否檢測到目標顏色範圍
+        """
+        if screen is None:
+            return False
+
         try:
             # 創建顏色範圍遮罩
             lower = np.array(color_min, dtype=np.uint8)
@@ -239,7 +401,7 @@ class ImageDetector:
             ratio = matched_pixels / total_pixels if total_pixels > 0 else 0.0
 
             if ratio >= min_pixel_ratio:
-                self.logger.debug(f"檢測到目標顏色範圍，像素比例: {ratio:.3f}")
+                self.logger.debug("檢測到目標顏色範圍，像素比例: %.3f", ratio)
                 return True
 
             return False
@@ -263,6 +425,8 @@ class ImageDetector:
             cv2.imwrite(filename, screen)
             self.logger.info(f"截圖已保存: {filename}")
 
+    @traced("find_white_splash", "detector")
+    @timed("detector.find_white_splash")
     def find_white_splash(
         self,
         region: tuple[int, int, int, int],
@@ -325,15 +489,21 @@ class ImageDetector:
             abs_x = region[0] + cx
             abs_y = region[1] + cy
 
-            self.logger.debug(
-                f"檢測到白色水花: ({abs_x}, {abs_y}), 面積: {cv2.contourArea(largest_contour):.0f}"
-            )
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    "檢測到白色水花: (%d, %d), 面積: %.0f",
+                    abs_x,
+                    abs_y,
+                    cv2.contourArea(largest_contour),
+                )
             return (abs_x, abs_y)
 
         except Exception as e:
             self.logger.error(f"白色水花檢測失敗: {e}")
             return None
 
+    @traced("tension_ocr", "detector")
+    @timed("detector.tension_ocr")
     def _detect_tension_by_ocr(
         self, region: tuple[int, int, int, int]
     ) -> int | None:
@@ -371,5 +541,5 @@ class ImageDetector:
 
             return None
         except Exception as e:
-            self.logger.debug(f"OCR 識別失敗: {e}")
+            self.logger.debug("OCR 識別失敗: %s", e)
             return None
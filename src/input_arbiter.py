@@ -0,0 +1,216 @@
+"""
+多視窗輸入仲裁模組
+"""
+
+import contextlib
+import logging
+import threading
+from collections.abc import Generator
+
+from src.clock import SYSTEM_CLOCK, Clock
+from src.input_backend import InputBackend, InputBatch
+from src.window_manager import WindowManagerLike
+
+
+class InputArbiter:
+    """
+    多視窗共用的輸入仲裁器
+
+    滑鼠與鍵盤輸入只會送到前景視窗，多個視窗必須輪流使用。每個輸入操作
+    執行期間獨佔輸入；要送往其他視窗時先激活該視窗並等待 switch_delay 秒。
+    目前擁有輸入的視窗仍按住任何按鍵或滑鼠按鈕，或取得租約（整個拉力階段，
+    方向鍵與左鍵之間可能短暫全部放開）時，其他視窗的輸入會等到釋放後才切換，
+    避免拉力控制途中失去焦點。
+    """
+
+    def __init__(self, switch_delay: float = 0.05, clock: Clock | None = None):
+        """
+        初始化輸入仲裁器
+
+        Args:
+            switch_delay: 切換視窗後等待視窗取得焦點的時間（秒）
+            clock: 時鐘
+        """
+        self.switch_delay = switch_delay
+        self.clock = clock or SYSTEM_CLOCK
+        self.logger = logging.getLogger("FishingBot.InputArbiter")
+
+        self._condition = threading.Condition()
+        self.owner: ArbitratedInputBackend | None = None
+        self.switch_count = 0
+
+    def _blocked(self, client: ArbitratedInputBackend) -> bool:
+        """其他視窗是否仍佔用輸入（呼叫端需持有鎖）"""
+        owner = self.owner
+        return (
+            owner is not None
+            and owner is not client
+            and (owner.leased or bool(owner.held))
+        )
+
+    @contextlib.contextmanager
+    def acquire(self, client: ArbitratedInputBackend) -> Generator[None]:
+        """
+        取得輸入使用權（必要時切換前景視窗），區塊結束時釋放
+
+        Args:
+            client: 要發送輸入的視窗
+        """
+        with self._condition:
+            while self._blocked(client):
+                self._condition.wait()
+
+            # 使用者或其他程式可能已切換前景視窗，再次確認
+            if (
+                self.owner is not client
+                or not client.window_manager.is_window_active()
+            ):
+                client.window_manager.activate_window()
+                self.owner = client
+                self.switch_count += 1
+                self.clock.sleep(self.switch_delay)
+
+            try:
+                yield
+            finally:
+                self._condition.notify_all()
+
+    def lease(self, client: ArbitratedInputBackend, leased: bool):
+        """
+        取得或解除視窗的輸入租約
+
+        取得時等待其他視窗釋放輸入並切換到該視窗，之後其他視窗的輸入
+        會等到解除為止；解除時喚醒等待中的視窗。
+
+        Args:
+            client: 視窗
+            leased: True 取得租約，False 解除
+        """
+        if leased:
+            with self.acquire(client):
+                client.leased = True
+        else:
+            with self._condition:
+                client.leased = False
+                self._condition.notify_all()
+
+    def client(
+        self, backend: InputBackend, window_manager: WindowManagerLike
+    ) -> ArbitratedInputBackend:
+        """
+        建立視窗的輸入後端
+
+        Args:
+            backend: 實際發送輸入的後端
+            window_manager: 該視窗的視窗管理器
+
+        Returns:
+            經由此仲裁器發送輸入的後端
+        """
+        return ArbitratedInputBackend(backend, self, window_manager)
+
+
+class ArbitratedInputBackend:
+    """經由輸入仲裁器發送輸入的後端（每個視窗一個）"""
+
+    def __init__(
+        self,
+        backend: InputBackend,
+        arbiter: InputArbiter,
+        window_manager: WindowManagerLike,
+    ):
+        """
+        初始化仲裁輸入後端
+
+        Args:
+            backend: 實際發送輸入的後端
+            arbiter: 輸入仲裁器
+            window_manager: 該視窗的視窗管理器
+        """
+        self.backend = backend
+        self.arbiter = arbiter
+        self.window_manager = window_manager
+        # 此視窗目前按住的按鍵與滑鼠按鈕
+        self.held: set[tuple[str, str]] = set()
+        # 是否持有輸入租約（整個拉力階段）
+        self.leased = False
+
+    def activate(self):
+        """經由仲裁器激活此視窗（其他視窗佔用輸入時等待）"""
+        with self.arbiter.acquire(self):
+            pass
+
+    def lease(self, leased: bool):
+        """
+        取得或解除輸入租約（見 InputArbiter.lease）
+
+        Args:
+            leased: True 取得租約，False 解除
+        """
+        if leased != self.leased:
+            self.arbiter.lease(self, leased)
+
+    def _run(self, method: str, *args, events=()):
+        """取得輸入使用權後執行輸入操作，並更新按住的按鍵"""
+        with self.arbiter.acquire(self):
+            result = getattr(self.backend, method)(*args)
+            for kind, name, is_up in events:
+                if kind == "key":
+                    name = name.lower()
+                if is_up:
+                    self.held.discard((kind, name))
+                else:
+                    self.held.add((kind, name))
+            return result
+
+    def move_to(self, x: int, y: int, duration: float = 0.5):
+        """移動滑鼠到指定位置"""
+        return self._run("move_to", x, y, duration)
+
+    def click(
+        self, x: int, y: int, button: str = "left", move_duration: float = 0.0
+    ):
+        """點擊指定位置"""
+        return self._run("click", x, y, button, move_duration)
+
+    def press_key(self, key: str, duration: float = 0.1):
+        """按下按鍵"""
+        return self._run("press_key", key, duration)
+
+    def key_down(self, key: str):
+        """按下按鍵（不釋放）"""
+        return self._run("key_down", key, events=[("key", key, False)])
+
+    def key_up(self, key: str):
+        """釋放按鍵"""
+        return self._run("key_up", key, events=[("key", key, True)])
+
+    def mouse_down(self, button: str = "left"):
+        """按下滑鼠按鈕（不釋放）"""
+        return self._run(
+            "mouse_down", button, events=[("mouse", button, False)]
+        )
+
+    def mouse_up(self, button: str = "left"):
+        """釋放滑鼠按鈕"""
+        return self._run("mouse_up", button, events=[("mouse", button, True)])
+
+    def send_batch(self, events: list[tuple[str, str, bool]]):
+        """以單次輸入發送多個事件"""
+        return self._run("send_batch", events, events=events)
+
+    def batch(self) -> InputBatch:
+        """建立批次輸入，離開 with 區塊時一次發送"""
+        return InputBatch(self)
+
+    def flush(self, timeout: float | None = None):
+        """等待所有已發送的輸入完成"""
+        self.backend.flush(timeout)
+
+    def get_mouse_position(self) -> tuple[int, int]:
+        """取得當前滑鼠位置"""
+        return self.backend.get_mouse_position()
+
+    def last_emit_time(self) -> float | None:
+        """取得目前線程最近一次輸入操作實際發送的時間"""
+        return self.backend.last_emit_time()
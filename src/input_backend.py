@@ -0,0 +1,285 @@
+"""
+輸入後端模組
+"""
+
+import logging
+import threading
+import time
+from typing import NamedTuple, Protocol
+
+from src.clock import SYSTEM_CLOCK, Clock
+from src.config_manager import ConfigManager
+
+
+class InputBackend(Protocol):
+    """
+    輸入後端介面
+
+    WinAPIInputController、InputController（PyAutoGUI）、
+    RecordingInputBackend 與 AsyncInputController 皆實作此介面。
+    """
+
+    def move_to(self, x: int, y: int, duration: float = 0.5) -> object: ...
+
+    def click(
+        self, x: int, y: int, button: str = "left", move_duration: float = 0.0
+    ) -> object: ...
+
+    def press_key(self, key: str, duration: float = 0.1) -> object: ...
+
+    def key_down(self, key: str) -> object: ...
+
+    def key_up(self, key: str) -> object: ...
+
+    def mouse_down(self, button: str = "left") -> object: ...
+
+    def mouse_up(self, button: str = "left") -> object: ...
+
+    def send_batch(self, events: list[tuple[str, str, bool]]) -> object: ...
+
+    def batch(self) -> InputBatch: ...
+
+    def flush(self, timeout: float | None = None) -> None: ...
+
+    def get_mouse_position(self) -> tuple[int, int]: ...
+
+    def last_emit_time(self) -> float | None: ...
+
+
+class InputBatch:
+    """
+    批次輸入事件
+
+    在 with 區塊內排入的按鍵與滑鼠事件，離開區塊時以單次 send_batch
+    發送，確保事件之間不會插入其他輸入（例如切換方向時的「釋放 D + 按下 A」）。
+    """
+
+    def __init__(self, controller: InputBackend):
+        """
+        初始化批次輸入
+
+        Args:
+            controller: 輸入後端
+        """
+        self.controller = controller
+        self.events: list[tuple[str, str, bool]] = []
+
+    def key_down(self, key: str):
+        """排入按鍵按下事件"""
+        self.events.append(("key", key, False))
+
+    def key_up(self, key: str):
+        """排入按鍵釋放事件"""
+        self.events.append(("key", key, True))
+
+    def mouse_down(self, button: str = "left"):
+        """排入滑鼠按下事件"""
+        self.events.append(("mouse", button, False))
+
+    def mouse_up(self, button: str = "left"):
+        """排入滑鼠釋放事件"""
+        self.events.append(("mouse", button, True))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None and self.events:
+            # 與單一事件的方法相同，發送失敗（例如不支持的按鍵）只記錄錯誤，
+            # 不中斷呼叫的控制線程
+            try:
+                self.controller.send_batch(self.events)
+            except Exception as e:
+                logging.getLogger("FishingBot.InputBatch").error(
+                    "批次輸入失敗: %s", e
+                )
+        return False
+
+
+class InputEvent(NamedTuple):
+    """記錄的輸入事件"""
+
+    timestamp: float
+    kind: str  # key / mouse / move
+    name: str  # 按鍵名稱或滑鼠按鈕，move 事件為空字串
+    action: str  # down / up / move
+    x: int = 0
+    y: int = 0
+
+
+class RecordingInputBackend:
+    """
+    記錄輸入後端
+
+    不發送任何輸入，將每個事件加上時間戳記錄在記憶體中，
+    用於無視窗環境下執行完整的釣魚流程與測量反應延遲。
+    """
+
+    def __init__(self, clock: Clock | None = None):
+        """
+        初始化記錄輸入後端
+
+        Args:
+            clock: 時鐘（事件時間戳與按鍵持續時間，預設使用實際時間）
+        """
+        self.clock = clock or SYSTEM_CLOCK
+        self.events: list[InputEvent] = []
+        self.position = (0, 0)
+        self._lock = threading.Lock()
+        self._emit_local = threading.local()
+        self.logger = logging.getLogger("FishingBot.RecordingInputBackend")
+
+    def _record(self, kind: str, name: str, action: str):
+        """記錄事件"""
+        if kind != "move":
+            self._emit_local.time = time.perf_counter()
+        with self._lock:
+            x, y = self.position
+            self.events.append(
+                InputEvent(self.clock.monotonic(), kind, name, action, x, y)
+            )
+
+    def move_to(self, x: int, y: int, duration: float = 0.5):
+        """移動滑鼠到指定位置"""
+        self.position = (x, y)
+        self._record("move", "", "move")
+
+    def click(
+        self, x: int, y: int, button: str = "left", move_duration: float = 0.0
+    ):
+        """點擊指定位置"""
+        self.move_to(x, y, move_duration)
+        self._record("mouse", button, "down")
+        self._record("mouse", button, "up")
+
+    def press_key(self, key: str, duration: float = 0.1):
+        """按下按鍵"""
+        self._record("key", key.lower(), "down")
+        emit_time = self._emit_local.time
+        self.clock.sleep(duration)
+        self._record("key", key.lower(), "up")
+        self._emit_local.time = emit_time
+
+    def key_down(self, key: str):
+        """按下按鍵（不釋放）"""
+        self._record("key", key.lower(), "down")
+
+    def key_up(self, key: str):
+        """釋放按鍵"""
+        self._record("key", key.lower(), "up")
+
+    def mouse_down(self, button: str = "left"):
+        """按下滑鼠按鈕（不釋放）"""
+        self._record("mouse", button, "down")
+
+    def mouse_up(self, button: str = "left"):
+        """釋放滑鼠按鈕"""
+        self._record("mouse", button, "up")
+
+    def send_batch(self, events: list[tuple[str, str, bool]]):
+        """發送多個事件"""
+        for kind, name, is_up in events:
+            if kind == "key":
+                name = name.lower()
+            self._record(kind, name, "up" if is_up else "down")
+
+    def batch(self) -> InputBatch:
+        """建立批次輸入"""
+        return InputBatch(self)
+
+    def flush(self, timeout: float | None = None):
+        """等待所有輸入完成（即時記錄，無需等待）"""
+
+    def get_mouse_position(self) -> tuple[int, int]:
+        """取得當前滑鼠位置"""
+        return self.position
+
+    def last_emit_time(self) -> float | None:
+        """
+        取得目前線程最近一次輸入操作實際發送第一個事件的時間
+
+        Returns:
+            perf_counter 時間，此線程尚未發送時返回 None
+        """
+        return getattr(self._emit_local, "time", None)
+
+    def clear(self):
+        """清除已記錄的事件"""
+        with self._lock:
+            self.events.clear()
+
+    def first_event_after(
+        self, timestamp: float, kinds: tuple[str, ...] = ("key", "mouse")
+    ) -> InputEvent | None:
+        """
+        取得指定時間之後的第一個事件
+
+        Args:
+            timestamp: 時間戳（clock.monotonic）
+            kinds: 事件類型
+
+        Returns:
+            事件，沒有時返回 None
+        """
+        with self._lock:
+            for event in self.events:
+                if event.timestamp >= timestamp and event.kind in kinds:
+                    return event
+        return None
+
+    def reaction_latency(
+        self, frame_time: float, kinds: tuple[str, ...] = ("key", "mouse")
+    ) -> float | None:
+        """
+        計算從畫面時間戳到第一個輸入事件的反應延遲
+
+        Args:
+            frame_time: 畫面截取時間（clock.monotonic）
+            kinds: 事件類型
+
+        Returns:
+            延遲（秒），之後沒有事件時返回 None
+        """
+        event = self.first_event_after(frame_time, kinds)
+        if event is None:
+            return None
+        return event.timestamp - frame_time
+
+
+def create_input_backend(
+    config: ConfigManager, clock: Clock | None = None
+) -> InputBackend:
+    """
+    依配置建立輸入後端
+
+    Args:
+        config: 配置管理器
+        clock: 時鐘（隨機延遲與按鍵持續時間，預設使用實際時間）
+
+    Returns:
+        輸入後端
+    """
+    backend = config.settings.input.backend
+    anti_detection = config.settings.anti_detection
+    random_delay_min = anti_detection.random_delay_min
+    random_delay_max = anti_detection.random_delay_max
+
+    # 延遲導入：WinAPI 與 PyAutoGUI 後端在非 Windows 或無顯示環境下無法導入
+    if backend == "winapi":
+        from src.input_controller_winapi import WinAPIInputController
+
+        return WinAPIInputController(
+            random_delay_min,
+            random_delay_max,
+            anti_detection.mouse_move_profile,
+            anti_detection.mouse_move_rate,
+            clock,
+        )
+    if backend == "pyautogui":
+        from src.input_controller import InputController
+
+        return InputController(random_delay_min, random_delay_max, clock)
+    if backend == "recording":
+        return RecordingInputBackend(clock)
+
+    raise ValueError(f"不支援的輸入後端: {backend}")
@@ -4,16 +4,23 @@
 
 import logging
 import random
+import threading
 import time
 
 import pyautogui
 
+from src.clock import SYSTEM_CLOCK, Clock
+from src.input_backend import InputBatch
+
 
 class InputController:
     """輸入控制器"""
 
     def __init__(
-        self, random_delay_min: float = 0.1, random_delay_max: float = 0.5
+        self,
+        random_delay_min: float = 0.1,
+        random_delay_max: float = 0.5,
+        clock: Clock | None = None,
     ):
         """
         初始化輸入控制器
@@ -21,9 +28,11 @@ class InputController:
         Args:
             random_delay_min: 最小隨機延遲
             random_delay_max: 最大隨機延遲
+            clock: 時鐘（隨機延遲，預設使用實際時間）
         """
         self.random_delay_min = random_delay_min
         self.random_delay_max = random_delay_max
+        self.clock = clock or SYSTEM_CLOCK
         # 計算高斯分佈參數：平均值和標準差
         self.delay_mean = (random_delay_min + random_delay_max) / 2
         self.delay_std = (
@@ -35,13 +44,16 @@ class InputController:
         pyautogui.FAILSAFE = True  # 移動滑鼠到左上角可以中止
         pyautogui.PAUSE = 0.1  # 每次操作後的暫停時間
 
+        # 各線程最近一次輸入操作開始發送的時間（反應延遲）
+        self._emit_local = threading.local()
+
     def _random_delay(self):
         """添加隨機延遲，使用高斯分佈模擬人類行為"""
         # 使用高斯分佈生成延遲時間，68%落在平均值±1個標準差
         delay = random.gauss(self.delay_mean, self.delay_std)
         # 限制在合理範圍內，避免極端值
         delay = max(self.random_delay_min, min(self.random_delay_max, delay))
-        time.sleep(delay)
+        self.clock.sleep(delay)
 
     def press_key(self, key: str, duration: float = 0.1):
         """
@@ -53,8 +65,9 @@ class InputController:
         """
         try:
             self._random_delay()
+            self._emit_local.time = time.perf_counter()
             pyautogui.press(key, interval=duration)
-            self.logger.debug(f"按下按鍵: {key}")
+            self.logger.debug("按下按鍵: %s", key)
         except Exception as e:
             self.logger.error(f"按鍵操作失敗: {e}")
 
@@ -94,13 +107,15 @@ class InputController:
                 pyautogui.moveTo(
                     target_x, target_y, duration=duration_variation
                 )
+                self._emit_local.time = time.perf_counter()
                 pyautogui.click(button=button)
             else:
                 # 直接點擊（PyAutoGUI 預設行為）
+                self._emit_local.time = time.perf_counter()
                 pyautogui.click(target_x, target_y, button=button)
 
             self.logger.debug(
-                f"點擊位置: ({x}, {y}), 偏移: ({offset_x}, {offset_y})"
+                "點擊位置: (%d, %d), 偏移: (%d, %d)", x, y, offset_x, offset_y
             )
         except Exception as e:
             self.logger.error(f"點擊操作失敗: {e}")
@@ -119,11 +134,108 @@ class InputController:
             )
             pyautogui.moveTo(x, y, duration=duration_variation)
             self.logger.debug(
-                f"移動滑鼠到: ({x}, {y}), 用時: {duration_variation:.2f}秒"
+                "移動滑鼠到: (%d, %d), 用時: %.2f秒", x, y, duration_variation
             )
         except Exception as e:
             self.logger.error(f"滑鼠移動失敗: {e}")
 
+    def key_down(self, key: str):
+        """
+        按下按鍵（不釋放）
+
+        Args:
+            key: 按鍵名稱
+        """
+        try:
+            self._emit_local.time = time.perf_counter()
+            pyautogui.keyDown(key)
+            self.logger.debug("按下按鍵: %s (不釋放)", key)
+        except Exception as e:
+            self.logger.error("按鍵按下失敗: %s", e)
+
+    def key_up(self, key: str):
+        """
+        釋放按鍵
+
+        Args:
+            key: 按鍵名稱
+        """
+        try:
+            self._emit_local.time = time.perf_counter()
+            pyautogui.keyUp(key)
+            self.logger.debug("釋放按鍵: %s", key)
+        except Exception as e:
+            self.logger.error("按鍵釋放失敗: %s", e)
+
+    def mouse_down(self, button: str = "left"):
+        """
+        按下滑鼠按鈕（不釋放）
+
+        Args:
+            button: 滑鼠按鈕 ('left', 'right', 'middle')
+        """
+        try:
+            self._emit_local.time = time.perf_counter()
+            pyautogui.mouseDown(button=button)
+            self.logger.debug("按下滑鼠 %s 鍵", button)
+        except Exception as e:
+            self.logger.error("滑鼠按下失敗: %s", e)
+
+    def mouse_up(self, button: str = "left"):
+        """
+        釋放滑鼠按鈕
+
+        Args:
+            button: 滑鼠按鈕 ('left', 'right', 'middle')
+        """
+        try:
+            self._emit_local.time = time.perf_counter()
+            pyautogui.mouseUp(button=button)
+            self.logger.debug("釋放滑鼠 %s 鍵", button)
+        except Exception as e:
+            self.logger.error("滑鼠釋放失敗: %s", e)
+
+    def send_batch(self, events: list[tuple[str, str, bool]]):
+        """
+        依序發送多個輸入事件（PyAutoGUI 無法合併為單次輸入）
+
+        Args:
+            events: 事件列表，每個事件為 (類型, 名稱, 是否釋放)
+        """
+        emit_time = None
+        for kind, name, is_up in events:
+            if kind == "key":
+                if is_up:
+                    self.key_up(name)
+                else:
+                    self.key_down(name)
+            elif is_up:
+                self.mouse_up(name)
+            else:
+                self.mouse_down(name)
+            if emit_time is None:
+                emit_time = self._emit_local.time
+        # 反應延遲以第一個事件為準
+        if emit_time is not None:
+            self._emit_local.time = emit_time
+
+    def batch(self) -> InputBatch:
+        """
+        建立批次輸入，離開 with 區塊時發送
+
+        Returns:
+            批次輸入
+        """
+        return InputBatch(self)
+
+    def flush(self, timeout: float | None = None):
+        """
+        等待所有輸入完成（同步發送，無需等待）
+
+        Args:
+            timeout: 最長等待時間（秒）
+        """
+
     def get_mouse_position(self) -> tuple[int, int]:
         """
         取得當前滑鼠位置
@@ -132,3 +244,12 @@ class InputController:
             (x, y) 座標
         """
         return pyautogui.position()
+
+    def last_emit_time(self) -> float | None:
+        """
+        取得目前線程最近一次輸入操作開始發送的時間
+
+        Returns:
+            perf_counter 時間，此線程尚未發送時返回 None
+        """
+        return getattr(self._emit_local, "time", None)
@@ -5,6 +5,7 @@ Windows API 輸入控制器
 import ctypes
 import logging
 import random
+import threading
 import time
 from ctypes import (
     POINTER,
@@ -19,6 +20,10 @@ from ctypes import (
     wintypes,
 )
 
+from src.clock import SYSTEM_CLOCK, Clock
+from src.cursor_path import generate_cursor_path, play_cursor_path
+from src.input_backend import InputBatch
+
 # Windows API 常量
 INPUT_MOUSE = 0
 INPUT_KEYBOARD = 1
@@ -94,11 +99,27 @@ class INPUT(Structure):
     _fields_ = [("type", c_ulong), ("union", INPUT_UNION)]
 
 
+# 滑鼠按鈕對應的 (按下, 釋放) 標誌
+MOUSE_BUTTON_FLAGS = {
+    "left": (MOUSEEVENTF_LEFTDOWN, MOUSEEVENTF_LEFTUP),
+    "right": (MOUSEEVENTF_RIGHTDOWN, MOUSEEVENTF_RIGHTUP),
+    "middle": (MOUSEEVENTF_MIDDLEDOWN, MOUSEEVENTF_MIDDLEUP),
+}
+
+# 單次 SendInput 最多可發送的事件數量（預先分配的緩衝區大小）
+MAX_BATCH_INPUTS = 16
+
+
 class WinAPIInputController:
     """使用 Windows API 的輸入控制器"""
 
     def __init__(
-        self, random_delay_min: float = 0.1, random_delay_max: float = 0.5
+        self,
+        random_delay_min: float = 0.1,
+        random_delay_max: float = 0.5,
+        move_profile: str = "linear",
+        move_rate: float = 100.0,
+        clock: Clock | None = None,
     ):
         """
         初始化輸入控制器
@@ -106,9 +127,15 @@ class WinAPIInputController:
         Args:
             random_delay_min: 最小隨機延遲
             random_delay_max: 最大隨機延遲
+            move_profile: 滑鼠移動曲線（linear、eased、curved）
+            move_rate: 滑鼠移動每秒路徑點數
+            clock: 時鐘（隨機延遲與按鍵持續時間，預設使用實際時間）
         """
         self.random_delay_min = random_delay_min
         self.random_delay_max = random_delay_max
+        self.move_profile = move_profile
+        self.move_rate = move_rate
+        self.clock = clock or SYSTEM_CLOCK
         self.delay_mean = (random_delay_min + random_delay_max) / 2
         self.delay_std = (random_delay_max - random_delay_min) / 6
         self.logger = logging.getLogger("FishingBot.WinAPIInputController")
@@ -118,21 +145,104 @@ class WinAPIInputController:
         self.SetCursorPos = windll.user32.SetCursorPos
         self.GetCursorPos = windll.user32.GetCursorPos
 
+        # 預先分配的輸入緩衝區，避免每次發送都建立新的 ctypes 陣列
+        self._input_buffer = (INPUT * MAX_BATCH_INPUTS)()
+        self._input_size = sizeof(INPUT)
+        self._input_lock = threading.Lock()
+        # 各線程最近一次輸入操作第一次呼叫 SendInput 的時間（反應延遲）
+        self._emit_local = threading.local()
+
         self.logger.info("Windows API 輸入控制器已初始化")
 
     def _random_delay(self):
         """添加隨機延遲"""
         delay = random.gauss(self.delay_mean, self.delay_std)
         delay = max(self.random_delay_min, min(self.random_delay_max, delay))
-        time.sleep(delay)
+        self.clock.sleep(delay)
+
+    def _fill_input(self, slot: INPUT, kind: str, name: str, is_up: bool):
+        """
+        將事件寫入緩衝區中的輸入結構
+
+        Args:
+            slot: 緩衝區中的輸入結構
+            kind: 事件類型（key 或 mouse）
+            name: 按鍵名稱或滑鼠按鈕
+            is_up: 是否為釋放事件
+        """
+        if kind == "key":
+            key = name.lower()
+            if key not in VK_CODE:
+                raise ValueError(f"不支持的按鍵: {name}")
+
+            slot.type = INPUT_KEYBOARD
+            ki = slot.union.ki
+            ki.wVk = VK_CODE[key]
+            ki.wScan = SCAN_CODE.get(key, 0)
+            ki.dwFlags = KEYEVENTF_KEYUP if is_up else 0
+            ki.time = 0
+            ki.dwExtraInfo = None
+        else:
+            if name not in MOUSE_BUTTON_FLAGS:
+                raise ValueError(f"不支援的按鈕: {name}")
+
+            slot.type = INPUT_MOUSE
+            mi = slot.union.mi
+            mi.dx = 0
+            mi.dy = 0
+            mi.mouseData = 0
+            mi.dwFlags = MOUSE_BUTTON_FLAGS[name][1 if is_up else 0]
+            mi.time = 0
+            mi.dwExtraInfo = None
+
+    def _send_input(self, kind: str, name: str, is_up: bool) -> int:
+        """
+        發送單一輸入事件
+
+        Args:
+            kind: 事件類型（key 或 mouse）
+            name: 按鍵名稱或滑鼠按鈕
+            is_up: 是否為釋放事件
+
+        Returns:
+            成功發送的事件數量
+        """
+        return self.send_batch([(kind, name, is_up)])
+
+    def send_batch(self, events: list[tuple[str, str, bool]]) -> int:
+        """
+        以單次 SendInput 發送多個輸入事件
+
+        Args:
+            events: 事件列表，每個事件為 (類型, 名稱, 是否釋放)，
+                類型為 key 或 mouse
+
+        Returns:
+            成功發送的事件數量
+        """
+        if len(events) > MAX_BATCH_INPUTS:
+            raise ValueError(
+                f"單次最多發送 {MAX_BATCH_INPUTS} 個事件，收到 {len(events)} 個"
+            )
+
+        with self._input_lock:
+            for slot, (kind, name, is_up) in zip(
+                self._input_buffer, events, strict=False
+            ):
+                self._fill_input(slot, kind, name, is_up)
+            self._emit_local.time = time.perf_counter()
+            return self.SendInput(
+                len(events), self._input_buffer, self._input_size
+            )
 
-    def _send_input(self, *inputs):
-        """發送輸入事件"""
-        nInputs = len(inputs)
-        LPINPUT = INPUT * nInputs
-        pInputs = LPINPUT(*inputs)
-        cbSize = sizeof(INPUT)
-        return self.SendInput(nInputs, pInputs, cbSize)
+    def batch(self) -> InputBatch:
+        """
+        建立批次輸入，離開 with 區塊時一次發送
+
+        Returns:
+            批次輸入
+        """
+        return InputBatch(self)
 
     def move_to(self, x: int, y: int, duration: float = 0.5):
         """
@@ -146,27 +256,31 @@ class WinAPIInputController:
         try:
             self._random_delay()
 
-            # 獲取當前位置
-            current_pos = self.get_mouse_position()
-
-            # 計算移動步数
-            steps = max(10, int(duration * 100))
-            dx = (x - current_pos[0]) / steps
-            dy = (y - current_pos[1]) / steps
-
-            # 逐步移動
-            for i in range(steps):
-                new_x = int(current_pos[0] + dx * (i + 1))
-                new_y = int(current_pos[1] + dy * (i + 1))
-                self.SetCursorPos(new_x, new_y)
-                time.sleep(duration / steps)
-
-            # 確保到达目標位置
-            self.SetCursorPos(x, y)
-            self.logger.debug(f"移動滑鼠到: ({x}, {y})")
+            self._move_along_path(x, y, duration)
+            self.logger.debug("移動滑鼠到: (%d, %d)", x, y)
         except Exception as e:
             self.logger.error(f"滑鼠移動失敗: {e}")
 
+    def _move_along_path(self, x: int, y: int, duration: float):
+        """
+        沿預先計算的路徑移動滑鼠，總時長固定為 duration
+
+        Args:
+            x: X 座標（螢幕座標）
+            y: Y 座標（螢幕座標）
+            duration: 移動持續時間（秒）
+        """
+        path = generate_cursor_path(
+            self.get_mouse_position(),
+            (x, y),
+            duration,
+            self.move_profile,
+            self.move_rate,
+        )
+        play_cursor_path(
+            path, self.SetCursorPos, self.clock.monotonic, self.clock.sleep
+        )
+
     def click(
         self, x: int, y: int, button: str = "left", move_duration: float = 0.0
     ):
@@ -194,66 +308,26 @@ class WinAPIInputController:
             # 移動到目標位置
             if move_duration > 0:
                 # 使用平滑移動
-                current_pos = self.get_mouse_position()
-                steps = max(10, int(move_duration * 100))
-                dx = (target_x - current_pos[0]) / steps
-                dy = (target_y - current_pos[1]) / steps
-
-                for i in range(steps):
-                    new_x = int(current_pos[0] + dx * (i + 1))
-                    new_y = int(current_pos[1] + dy * (i + 1))
-                    self.SetCursorPos(new_x, new_y)
-                    time.sleep(move_duration / steps)
-
-                # 確保到達目標位置
-                # self.SetCursorPos(target_x, target_y)
+                self._move_along_path(target_x, target_y, move_duration)
             else:
                 # 瞬間移動
                 self.SetCursorPos(target_x, target_y)
-                time.sleep(0.01)
-
-            # 確定按鈕標誌
-            if button == "left":
-                down_flag = MOUSEEVENTF_LEFTDOWN
-                up_flag = MOUSEEVENTF_LEFTUP
-            elif button == "right":
-                down_flag = MOUSEEVENTF_RIGHTDOWN
-                up_flag = MOUSEEVENTF_RIGHTUP
-            elif button == "middle":
-                down_flag = MOUSEEVENTF_MIDDLEDOWN
-                up_flag = MOUSEEVENTF_MIDDLEUP
-            else:
-                raise ValueError(f"不支援的按鈕: {button}")
-
-            # 創建按下事件
-            down_input = INPUT()
-            down_input.type = INPUT_MOUSE
-            down_input.union.mi = MOUSEINPUT()
-            down_input.union.mi.dx = 0
-            down_input.union.mi.dy = 0
-            down_input.union.mi.mouseData = 0
-            down_input.union.mi.dwFlags = down_flag
-            down_input.union.mi.time = 0
-            down_input.union.mi.dwExtraInfo = None
-
-            # 創建釋放事件
-            up_input = INPUT()
-            up_input.type = INPUT_MOUSE
-            up_input.union.mi = MOUSEINPUT()
-            up_input.union.mi.dx = 0
-            up_input.union.mi.dy = 0
-            up_input.union.mi.mouseData = 0
-            up_input.union.mi.dwFlags = up_flag
-            up_input.union.mi.time = 0
-            up_input.union.mi.dwExtraInfo = None
+                self.clock.sleep(0.01)
 
             # 發送事件
-            self._send_input(down_input)
-            time.sleep(random.uniform(0.08, 0.12))
-            self._send_input(up_input)
+            self._send_input("mouse", button, False)
+            emit_time = self._emit_local.time
+            self.clock.sleep(random.uniform(0.08, 0.12))
+            self._send_input("mouse", button, True)
+            self._emit_local.time = emit_time
 
             self.logger.debug(
-                f"點擊位置: ({x}, {y}), 偏移: ({offset_x}, {offset_y}), 按鈕: {button}"
+                "點擊位置: (%d, %d), 偏移: (%d, %d), 按鈕: %s",
+                x,
+                y,
+                offset_x,
+                offset_y,
+                button,
             )
         except Exception as e:
             self.logger.error(f"點擊操作失敗: {e}")
@@ -277,35 +351,14 @@ class WinAPIInputController:
                 self.logger.error(f"不支持的按鍵: {key}")
                 return
 
-            vk_code = VK_CODE[key]
-            scan_code = SCAN_CODE.get(key, 0)
-
-            # 創建按下事件
-            down_input = INPUT()
-            down_input.type = INPUT_KEYBOARD
-            down_input.union.ki = KEYBDINPUT()
-            down_input.union.ki.wVk = vk_code
-            down_input.union.ki.wScan = scan_code
-            down_input.union.ki.dwFlags = 0
-            down_input.union.ki.time = 0
-            down_input.union.ki.dwExtraInfo = None
-
-            # 創建釋放事件
-            up_input = INPUT()
-            up_input.type = INPUT_KEYBOARD
-            up_input.union.ki = KEYBDINPUT()
-            up_input.union.ki.wVk = vk_code
-            up_input.union.ki.wScan = scan_code
-            up_input.union.ki.dwFlags = KEYEVENTF_KEYUP
-            up_input.union.ki.time = 0
-            up_input.union.ki.dwExtraInfo = None
-
             # 發送事件
-            self._send_input(down_input)
-            time.sleep(duration)
-            self._send_input(up_input)
+            self._send_input("key", key, False)
+            emit_time = self._emit_local.time
+            self.clock.sleep(duration)
+            self._send_input("key", key, True)
+            self._emit_local.time = emit_time
 
-            self.logger.debug(f"按下按鍵: {key}")
+            self.logger.debug("按下按鍵: %s", key)
         except Exception as e:
             self.logger.error(f"按鍵操作失敗: {e}")
 
@@ -322,22 +375,9 @@ class WinAPIInputController:
                 self.logger.error(f"不支持的按鍵: {key}")
                 return
 
-            vk_code = VK_CODE[key]
-            scan_code = SCAN_CODE.get(key, 0)
-
-            # 創建按下事件
-            down_input = INPUT()
-            down_input.type = INPUT_KEYBOARD
-            down_input.union.ki = KEYBDINPUT()
-            down_input.union.ki.wVk = vk_code
-            down_input.union.ki.wScan = scan_code
-            down_input.union.ki.dwFlags = 0
-            down_input.union.ki.time = 0
-            down_input.union.ki.dwExtraInfo = None
-
             # 發送事件
-            self._send_input(down_input)
-            self.logger.debug(f"按下按鍵: {key} (不釋放)")
+            self._send_input("key", key, False)
+            self.logger.debug("按下按鍵: %s (不釋放)", key)
         except Exception as e:
             self.logger.error(f"按鍵按下失敗: {e}")
 
@@ -354,22 +394,9 @@ class WinAPIInputController:
                 self.logger.error(f"不支持的按鍵: {key}")
                 return
 
-            vk_code = VK_CODE[key]
-            scan_code = SCAN_CODE.get(key, 0)
-
-            # 創建釋放事件
-            up_input = INPUT()
-            up_input.type = INPUT_KEYBOARD
-            up_input.union.ki = KEYBDINPUT()
-            up_input.union.ki.wVk = vk_code
-            up_input.union.ki.wScan = scan_code
-            up_input.union.ki.dwFlags = KEYEVENTF_KEYUP
-            up_input.union.ki.time = 0
-            up_input.union.ki.dwExtraInfo = None
-
             # 發送事件
-            self._send_input(up_input)
-            self.logger.debug(f"釋放按鍵: {key}")
+            self._send_input("key", key, True)
+            self.logger.debug("釋放按鍵: %s", key)
         except Exception as e:
             self.logger.error(f"按鍵釋放失敗: {e}")
 
@@ -381,30 +408,9 @@ class WinAPIInputController:
             button: 滑鼠按鈕 ('left', 'right', 'middle')
         """
         try:
-            # 確定按鈕標誌
-            if button == "left":
-                down_flag = MOUSEEVENTF_LEFTDOWN
-            elif button == "right":
-                down_flag = MOUSEEVENTF_RIGHTDOWN
-            elif button == "middle":
-                down_flag = MOUSEEVENTF_MIDDLEDOWN
-            else:
-                raise ValueError(f"不支援的按鈕: {button}")
-
-            # 創建按下事件
-            down_input = INPUT()
-            down_input.type = INPUT_MOUSE
-            down_input.union.mi = MOUSEINPUT()
-            down_input.union.mi.dx = 0
-            down_input.union.mi.dy = 0
-            down_input.union.mi.mouseData = 0
-            down_input.union.mi.dwFlags = down_flag
-            down_input.union.mi.time = 0
-            down_input.union.mi.dwExtraInfo = None
-
             # 發送事件
-            self._send_input(down_input)
-            self.logger.debug(f"按下滑鼠 {button} 鍵")
+            self._send_input("mouse", button, False)
+            self.logger.debug("按下滑鼠 %s 鍵", button)
         except Exception as e:
             self.logger.error(f"滑鼠按下失敗: {e}")
 
@@ -416,33 +422,20 @@ class WinAPIInputController:
             button: 滑鼠按鈕 ('left', 'right', 'middle')
         """
         try:
-            # 確定按鈕標誌
-            if button == "left":
-                up_flag = MOUSEEVENTF_LEFTUP
-            elif button == "right":
-                up_flag = MOUSEEVENTF_RIGHTUP
-            elif button == "middle":
-                up_flag = MOUSEEVENTF_MIDDLEUP
-            else:
-                raise ValueError(f"不支援的按鈕: {button}")
-
-            # 創建釋放事件
-            up_input = INPUT()
-            up_input.type = INPUT_MOUSE
-            up_input.union.mi = MOUSEINPUT()
-            up_input.union.mi.dx = 0
-            up_input.union.mi.dy = 0
-            up_input.union.mi.mouseData = 0
-            up_input.union.mi.dwFlags = up_flag
-            up_input.union.mi.time = 0
-            up_input.union.mi.dwExtraInfo = None
-
             # 發送事件
-            self._send_input(up_input)
-            self.logger.debug(f"釋放滑鼠 {button} 鍵")
+            self._send_input("mouse", button, True)
+            self.logger.debug("釋放滑鼠 %s 鍵", button)
         except Exception as e:
             self.logger.error(f"滑鼠釋放失敗: {e}")
 
+    def flush(self, timeout: float | None = None):
+        """
+        等待所有輸入完成（同步發送，無需等待）
+
+        Args:
+            timeout: 最長等待時間（秒）
+        """
+
     def get_mouse_position(self) -> tuple[int, int]:
         """
         獲取當前滑鼠位置
@@ -453,3 +446,12 @@ class WinAPIInputController:
         point = wintypes.POINT()
         self.GetCursorPos(ctypes.byref(point))
         return point.x, point.y
+
+    def last_emit_time(self) -> float | None:
+        """
+        取得目前線程最近一次輸入操作第一次呼叫 SendInput 的時間
+
+        Returns:
+            perf_counter 時間，此線程尚未發送時返回 None
+        """
+        return getattr(self._emit_local, "time", None)
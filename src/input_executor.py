@@ -0,0 +1,218 @@
+"""
+非同步輸入執行模組
+"""
+
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+from src.input_backend import InputBackend, InputBatch
+from src.tracing import span
+
+
+class InputFuture(Future):
+    """輸入操作的 Future（記錄執行線程開始執行與實際發送輸入的時間）"""
+
+    start_time: float | None = None
+    emit_time: float | None = None
+
+
+class InputExecutor:
+    """
+    輸入執行器
+
+    在獨立線程中依序執行輸入操作，呼叫端取得 Future 後即可繼續檢測與控制，
+    不會因點擊前的隨機延遲或滑鼠平滑移動而停頓。
+    """
+
+    def __init__(self, controller: InputBackend):
+        """
+        初始化輸入執行器
+
+        Args:
+            controller: 實際發送輸入的控制器
+        """
+        self.controller = controller
+        self.logger = logging.getLogger("FishingBot.InputExecutor")
+
+        self._queue: queue.Queue = queue.Queue()
+        self._stats_lock = threading.Lock()
+        self._latency_count = 0
+        self._latency_total = 0.0
+        self._latency_max = 0.0
+        self._latency_last = 0.0
+
+        self._thread = threading.Thread(
+            target=self._worker, name="InputExecutorThread", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, method: str, *args, **kwargs) -> Future:
+        """
+        排入輸入操作
+
+        Args:
+            method: 控制器的方法名稱
+            *args: 方法參數
+            **kwargs: 方法關鍵字參數
+
+        Returns:
+            操作完成時設定結果的 Future
+        """
+        future = InputFuture()
+        self._queue.put((future, method, args, kwargs, time.perf_counter()))
+        return future
+
+    def flush(self, timeout: float | None = None):
+        """
+        等待所有已排入的輸入操作完成
+
+        Args:
+            timeout: 最長等待時間（秒），None 表示無限等待
+        """
+        if not self._thread.is_alive():
+            return
+
+        future: Future = Future()
+        self._queue.put((future, None, (), {}, time.perf_counter()))
+        future.result(timeout)
+
+    def shutdown(self, timeout: float | None = 1.0):
+        """
+        停止執行器（已排入的操作會先執行完畢）
+
+        Args:
+            timeout: 等待線程結束的時間（秒）
+        """
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+    def get_statistics(self) -> dict:
+        """
+        取得輸入佇列延遲統計（從排入到開始執行的時間）
+
+        Returns:
+            統計資料字典，時間單位為毫秒
+        """
+        with self._stats_lock:
+            count = self._latency_count
+            return {
+                "count": count,
+                "pending": self._queue.qsize(),
+                "mean_ms": (
+                    self._latency_total / count * 1000 if count else 0.0
+                ),
+                "max_ms": self._latency_max * 1000,
+                "last_ms": self._latency_last * 1000,
+            }
+
+    def _worker(self):
+        """執行線程：依序取出並執行輸入操作"""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+
+            future, method, args, kwargs, submit_time = item
+            if not future.set_running_or_notify_cancel():
+                continue
+
+            # flush() 的標記，前面的操作都已完成
+            if method is None:
+                future.set_result(None)
+                continue
+
+            future.start_time = time.perf_counter()
+            latency = future.start_time - submit_time
+            with self._stats_lock:
+                self._latency_count += 1
+                self._latency_total += latency
+                self._latency_max = max(self._latency_max, latency)
+                self._latency_last = latency
+
+            try:
+                with span(method, "input.emit"):
+                    result = getattr(self.controller, method)(*args, **kwargs)
+                # 控制器在此線程實際發送的時間（未發送時保持 None）
+                emit_time = self.controller.last_emit_time()
+                if emit_time is not None and emit_time >= future.start_time:
+                    future.emit_time = emit_time
+                future.set_result(result)
+            except Exception as e:
+                self.logger.error("輸入操作 %s 失敗: %s", method, e)
+                future.set_exception(e)
+
+
+class AsyncInputController:
+    """
+    非同步輸入控制器
+
+    提供與輸入控制器相同的介面，操作交給 InputExecutor 執行並返回 Future。
+    需要確認輸入已送達時（例如點擊後要檢測畫面變化）呼叫 flush()。
+    """
+
+    def __init__(self, executor: InputExecutor):
+        """
+        初始化非同步輸入控制器
+
+        Args:
+            executor: 輸入執行器
+        """
+        self.executor = executor
+
+    def move_to(self, x: int, y: int, duration: float = 0.5) -> Future:
+        """移動滑鼠到指定位置"""
+        return self.executor.submit("move_to", x, y, duration)
+
+    def click(
+        self, x: int, y: int, button: str = "left", move_duration: float = 0.0
+    ) -> Future:
+        """點擊指定位置"""
+        return self.executor.submit("click", x, y, button, move_duration)
+
+    def press_key(self, key: str, duration: float = 0.1) -> Future:
+        """按下按鍵"""
+        return self.executor.submit("press_key", key, duration)
+
+    def key_down(self, key: str) -> Future:
+        """按下按鍵（不釋放）"""
+        return self.executor.submit("key_down", key)
+
+    def key_up(self, key: str) -> Future:
+        """釋放按鍵"""
+        return self.executor.submit("key_up", key)
+
+    def mouse_down(self, button: str = "left") -> Future:
+        """按下滑鼠按鈕（不釋放）"""
+        return self.executor.submit("mouse_down", button)
+
+    def mouse_up(self, button: str = "left") -> Future:
+        """釋放滑鼠按鈕"""
+        return self.executor.submit("mouse_up", button)
+
+    def send_batch(self, events: list[tuple[str, str, bool]]) -> Future:
+        """以單次輸入發送多個事件"""
+        return self.executor.submit("send_batch", events)
+
+    def batch(self) -> InputBatch:
+        """建立批次輸入，離開 with 區塊時一次排入"""
+        return InputBatch(self)
+
+    def flush(self, timeout: float | None = None):
+        """等待所有已排入的輸入操作完成"""
+        self.executor.flush(timeout)
+
+    def get_mouse_position(self) -> tuple[int, int]:
+        """取得當前滑鼠位置（直接查詢，不經過佇列）"""
+        return self.controller.get_mouse_position()
+
+    def last_emit_time(self) -> float | None:
+        """非同步發送的時間記錄在各操作的 Future（InputFuture.emit_time）"""
+        return None
+
+    @property
+    def controller(self):
+        """實際發送輸入的控制器"""
+        return self.executor.controller
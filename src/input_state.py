@@ -0,0 +1,258 @@
+"""
+輸入狀態管理模組
+"""
+
+import contextlib
+import logging
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable
+
+from src.input_backend import InputBackend, InputBatch
+from src.reaction_latency import ReactionTracker
+from src.tracing import traced
+
+
+class InputStateManager:
+    """
+    按鍵與滑鼠按鈕狀態管理器
+
+    包裝輸入後端並持有唯一的「已按下」集合，所有控制線程共用。
+    已按下時再按下、未按下時釋放的事件不會發送（計入被抑制事件），
+    release_all() 在階段結束時一次釋放所有仍按住的按鍵與按鈕，
+    即使控制線程中途異常結束也不會留下卡住的按鍵。
+    """
+
+    def __init__(
+        self, backend: InputBackend, reaction: ReactionTracker | None = None
+    ):
+        """
+        初始化輸入狀態管理器
+
+        Args:
+            backend: 實際發送輸入的後端
+            reaction: 反應延遲追蹤器（可選）
+        """
+        self.backend = backend
+        self.reaction = reaction
+        self.logger = logging.getLogger("FishingBot.InputStateManager")
+
+        self._lock = threading.Lock()
+        self._pressed: set[tuple[str, str]] = set()
+        self.emitted_count = 0
+        self.suppressed_count = 0
+        # 依類型統計實際發送的事件（key、mouse、click、press_key、move）
+        self.event_counts: Counter[str] = Counter()
+
+    @staticmethod
+    def _normalize(kind: str, name: str) -> tuple[str, str]:
+        """統一按鍵名稱（按鍵不分大小寫）"""
+        return (kind, name.lower() if kind == "key" else name)
+
+    def _filter(
+        self, events: list[tuple[str, str, bool]]
+    ) -> list[tuple[str, str, bool]]:
+        """
+        過濾冗餘事件並更新已按下集合（呼叫端需持有鎖）
+
+        Args:
+            events: 事件列表，每個事件為 (類型, 名稱, 是否釋放)
+
+        Returns:
+            需要發送的事件
+        """
+        filtered = []
+        for kind, name, is_up in events:
+            state = self._normalize(kind, name)
+            if is_up == (state not in self._pressed):
+                self.suppressed_count += 1
+                continue
+
+            if is_up:
+                self._pressed.discard(state)
+            else:
+                self._pressed.add(state)
+            filtered.append((kind, name, is_up))
+            self.event_counts[kind] += 1
+
+        self.emitted_count += len(filtered)
+        return filtered
+
+    def _call(self, method: Callable, *args):
+        """呼叫後端發送輸入（決策中時記錄反應延遲）"""
+        reaction = self.reaction
+        if reaction is None:
+            return method(*args)
+        pending = reaction.emitting()
+        if pending is None:
+            return method(*args)
+
+        start = time.perf_counter()
+        result = method(*args)
+        # 以後端實際發送的時間為準（包含隨機延遲與點擊前的滑鼠移動），
+        # 此次呼叫沒有發送任何事件時以呼叫時間為準
+        emit_time = self.backend.last_emit_time()
+        if emit_time is None or emit_time < start:
+            emit_time = start
+        reaction.emitted(pending, result, emit_time)
+        return result
+
+    def reacting(
+        self, decision: str, frame_time: float | None
+    ) -> contextlib.AbstractContextManager:
+        """
+        標記區塊內第一個發送的輸入為對某張畫面的反應（未追蹤時不記錄）
+
+        Args:
+            decision: 決策類型（見 reaction_latency.DECISIONS）
+            frame_time: 觸發決策的畫面開始截取的時間
+        """
+        if self.reaction is None:
+            return contextlib.nullcontext()
+        return self.reaction.decision(decision, frame_time)
+
+    def _send(self, kind: str, name: str, is_up: bool):
+        """發送單一按下或釋放事件（冗餘時略過）"""
+        with self._lock:
+            if not self._filter([(kind, name, is_up)]):
+                return
+            if kind == "key":
+                method = (
+                    self.backend.key_up if is_up else self.backend.key_down
+                )
+            elif is_up:
+                method = self.backend.mouse_up
+            else:
+                method = self.backend.mouse_down
+            self._call(method, name)
+
+    @traced("key_down", "input")
+    def key_down(self, key: str):
+        """按下按鍵（已按下時略過）"""
+        self._send("key", key, False)
+
+    @traced("key_up", "input")
+    def key_up(self, key: str):
+        """釋放按鍵（未按下時略過）"""
+        self._send("key", key, True)
+
+    @traced("mouse_down", "input")
+    def mouse_down(self, button: str = "left"):
+        """按下滑鼠按鈕（已按下時略過）"""
+        self._send("mouse", button, False)
+
+    @traced("mouse_up", "input")
+    def mouse_up(self, button: str = "left"):
+        """釋放滑鼠按鈕（未按下時略過）"""
+        self._send("mouse", button, True)
+
+    @traced("send_batch", "input")
+    def send_batch(self, events: list[tuple[str, str, bool]]):
+        """以單次輸入發送多個事件（冗餘事件會被移除）"""
+        with self._lock:
+            filtered = self._filter(events)
+            if filtered:
+                self._call(self.backend.send_batch, filtered)
+
+    def batch(self) -> InputBatch:
+        """建立批次輸入，離開 with 區塊時發送"""
+        return InputBatch(self)
+
+    @traced("move_to", "input")
+    def move_to(self, x: int, y: int, duration: float = 0.5):
+        """移動滑鼠到指定位置"""
+        with self._lock:
+            self.event_counts["move"] += 1
+        return self.backend.move_to(x, y, duration)
+
+    @traced("click", "input")
+    def click(
+        self, x: int, y: int, button: str = "left", move_duration: float = 0.0
+    ):
+        """點擊指定位置（點擊以釋放結束，按鈕視為未按下）"""
+        with self._lock:
+            self._pressed.discard(("mouse", button))
+            self.emitted_count += 2
+            self.event_counts["click"] += 1
+        return self._call(self.backend.click, x, y, button, move_duration)
+
+    @traced("press_key", "input")
+    def press_key(self, key: str, duration: float = 0.1):
+        """按下按鍵（按鍵以釋放結束，視為未按下）"""
+        with self._lock:
+            self._pressed.discard(self._normalize("key", key))
+            self.emitted_count += 2
+            self.event_counts["press_key"] += 1
+        return self._call(self.backend.press_key, key, duration)
+
+    def flush(self, timeout: float | None = None):
+        """等待所有輸入完成"""
+        self.backend.flush(timeout)
+
+    def get_mouse_position(self) -> tuple[int, int]:
+        """取得當前滑鼠位置"""
+        return self.backend.get_mouse_position()
+
+    def last_emit_time(self) -> float | None:
+        """取得目前線程最近一次輸入操作實際發送的時間"""
+        return self.backend.last_emit_time()
+
+    def is_pressed(self, kind: str, name: str) -> bool:
+        """
+        檢查按鍵或滑鼠按鈕是否按下
+
+        Args:
+            kind: 類型（key 或 mouse）
+            name: 按鍵名稱或滑鼠按鈕
+
+        Returns:
+            是否按下
+        """
+        with self._lock:
+            return self._normalize(kind, name) in self._pressed
+
+    def pressed(self) -> list[tuple[str, str]]:
+        """
+        取得所有已按下的按鍵與按鈕
+
+        Returns:
+            (類型, 名稱) 列表
+        """
+        with self._lock:
+            return sorted(self._pressed)
+
+    @traced("release_all", "input")
+    def release_all(self):
+        """以單次輸入釋放所有已按下的按鍵與按鈕"""
+        with self._lock:
+            events = [(kind, name, True) for kind, name in self._pressed]
+            filtered = self._filter(events)
+            if not filtered:
+                return
+            self.backend.send_batch(filtered)
+
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "釋放所有按鍵: %s",
+                ", ".join(name for _, name, _ in filtered),
+            )
+
+    def get_statistics(self) -> dict:
+        """
+        取得輸入事件統計
+
+        Returns:
+            統計資料字典
+        """
+        with self._lock:
+            total = self.emitted_count + self.suppressed_count
+            return {
+                "emitted": self.emitted_count,
+                "suppressed": self.suppressed_count,
+                "suppressed_ratio": (
+                    self.suppressed_count / total if total else 0.0
+                ),
+                "pressed": [name for _, name in sorted(self._pressed)],
+                "events": dict(self.event_counts),
+            }
@@ -0,0 +1,264 @@
+"""
+輸入延遲校準模組
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Self
+
+import numpy as np
+
+from src.clock import SYSTEM_CLOCK, Clock
+from src.config_manager import ConfigManager
+from src.image_detector import ImageDetector
+from src.region_registry import RegionRegistry
+from src.window_manager import WindowManagerLike
+
+# 校準動作：名稱 -> (輸入類型, 觀察區域的配置鍵)
+CALIBRATION_ACTIONS = {
+    "key": ("key", "detection.fish_splash.region"),
+    "mouse": ("mouse", "detection.red_tension.region"),
+}
+
+# 等待畫面變化時兩次截圖之間的間隔（秒），避免佔滿一個 CPU 核心
+POLL_INTERVAL = 0.002
+
+
+class LatencyProfile:
+    """輸入到畫面反應的延遲分佈"""
+
+    def __init__(self, samples: dict[str, list[float]] | None = None):
+        """
+        初始化延遲分佈
+
+        Args:
+            samples: 各動作的延遲樣本（秒）
+        """
+        self.samples = samples or {}
+
+    def percentile(self, action: str, q: float) -> float | None:
+        """
+        取得指定動作延遲的百分位數
+
+        Args:
+            action: 動作名稱（key 或 mouse）
+            q: 百分位（0-100）
+
+        Returns:
+            延遲（秒），沒有樣本時返回 None
+        """
+        values = self.samples.get(action)
+        if not values:
+            return None
+        return float(np.percentile(values, q))
+
+    def save(self, path: str | Path):
+        """
+        保存延遲分佈為 JSON 檔案
+
+        Args:
+            path: 檔案路徑
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        summary = {
+            action: {
+                "p50": self.percentile(action, 50),
+                "p95": self.percentile(action, 95),
+            }
+            for action in self.samples
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"samples": self.samples, "summary": summary}, f, indent=2
+            )
+
+    @classmethod
+    def load(cls, path: str | Path) -> Self:
+        """
+        從 JSON 檔案載入延遲分佈，檔案不存在時返回空分佈
+
+        Args:
+            path: 檔案路徑
+
+        Returns:
+            延遲分佈
+        """
+        path = Path(path)
+        if not path.exists():
+            return cls()
+
+        with open(path, encoding="utf-8") as f:
+            return cls(json.load(f).get("samples", {}))
+
+
+class LatencyCalibrator:
+    """
+    輸入延遲校準器
+
+    發送已知輸入後逐幀截取觀察區域，以畫面與輸入前的平均像素差
+    超過閾值的時間點作為輸入生效的時間。
+    """
+
+    def __init__(
+        self,
+        config: ConfigManager,
+        window_manager: WindowManagerLike,
+        input_controller,
+        image_detector: ImageDetector,
+        regions: RegionRegistry | None = None,
+        clock: Clock | None = None,
+    ):
+        """
+        初始化延遲校準器
+
+        延遲的計時與逐幀等待都經由時鐘：實際時鐘測量硬體延遲，
+        虛擬時鐘可對模擬器測量其設定的反應延遲。
+
+        Args:
+            config: 配置管理器
+            window_manager: 視窗管理器
+            input_controller: 輸入控制器
+            image_detector: 圖像檢測器（其截圖後端可為回放或模擬）
+            regions: 檢測區域註冊表（可選，預設依視窗管理器建立）
+            clock: 時鐘（可選，預設使用實際時間）
+        """
+        self.config = config
+        self.window_manager = window_manager
+        self.input_controller = input_controller
+        self.image_detector = image_detector
+        self.regions = regions or RegionRegistry(config, window_manager)
+        self.clock = clock or SYSTEM_CLOCK
+        self.logger = logging.getLogger("FishingBot.LatencyCalibrator")
+
+    def calibrate(self) -> LatencyProfile:
+        """
+        對所有校準動作測量延遲並保存結果
+
+        Returns:
+            測量到的延遲分佈
+        """
+        calibration_config = self.config.settings.calibration
+        trials = calibration_config.trials
+        output_file = calibration_config.output_file
+
+        profile = LatencyProfile()
+        for action in CALIBRATION_ACTIONS:
+            samples = self.measure(action, trials)
+            profile.samples[action] = samples
+            p50 = profile.percentile(action, 50)
+            p95 = profile.percentile(action, 95)
+            if p50 is None or p95 is None:
+                self.logger.warning("動作 %s 沒有有效的延遲樣本", action)
+            else:
+                self.logger.info(
+                    "動作 %s: %s/%s 次有效，p50 %.1f ms，p95 %.1f ms",
+                    action,
+                    len(samples),
+                    trials,
+                    p50 * 1000,
+                    p95 * 1000,
+                )
+
+        profile.save(output_file)
+        self.logger.info("延遲分佈已保存: %s", output_file)
+        return profile
+
+    def measure(self, action: str, trials: int) -> list[float]:
+        """
+        測量指定動作的延遲
+
+        Args:
+            action: 動作名稱（key 或 mouse）
+            trials: 測量次數
+
+        Returns:
+            有效的延遲樣本（秒），逾時的測量不計入
+        """
+        calibration_config = self.config.settings.calibration
+        timeout = calibration_config.timeout
+        settle_time = calibration_config.settle_time
+        diff_threshold = calibration_config.diff_threshold
+
+        region = self._get_region(CALIBRATION_ACTIONS[action][1])
+        if region is None:
+            self.logger.error("無法取得視窗位置，校準失敗")
+            return []
+
+        samples = []
+        for trial in range(trials):
+            baseline = self.image_detector.capture_screen(region)
+            if baseline is None:
+                continue
+
+            start_time = self.clock.monotonic()
+            self._press(action)
+            try:
+                latency = self._wait_for_change(
+                    region, baseline, start_time, timeout, diff_threshold
+                )
+            finally:
+                self._release(action)
+
+            if latency is None:
+                self.logger.debug("%s 第 %s 次測量逾時", action, trial + 1)
+            else:
+                samples.append(latency)
+                self.logger.debug(
+                    "%s 第 %s 次延遲: %.1f ms",
+                    action,
+                    trial + 1,
+                    latency * 1000,
+                )
+
+            # 等待畫面回到靜止狀態
+            self.clock.sleep(settle_time)
+
+        return samples
+
+    def _wait_for_change(
+        self,
+        region: tuple[int, int, int, int],
+        baseline: np.ndarray,
+        start_time: float,
+        timeout: float,
+        diff_threshold: float,
+    ) -> float | None:
+        """
+        逐幀截圖直到畫面與基準畫面的差異超過閾值
+
+        Returns:
+            從發送輸入到截取到變化畫面的時間（秒），逾時返回 None
+        """
+        reference = baseline.astype(np.int16)
+        while self.clock.monotonic() - start_time < timeout:
+            frame = self.image_detector.capture_screen(region)
+            captured_time = self.clock.monotonic()
+            if frame is not None and frame.shape == baseline.shape:
+                diff = float(np.abs(frame.astype(np.int16) - reference).mean())
+                if diff >= diff_threshold:
+                    return captured_time - start_time
+            self.clock.sleep(POLL_INTERVAL)
+        return None
+
+    def _press(self, action: str):
+        """發送校準輸入"""
+        if CALIBRATION_ACTIONS[action][0] == "key":
+            key = self.config.settings.fishing.fish_tracking.right_key
+            self.input_controller.key_down(key)
+        else:
+            self.input_controller.mouse_down("left")
+
+    def _release(self, action: str):
+        """撤銷校準輸入"""
+        if CALIBRATION_ACTIONS[action][0] == "key":
+            key = self.config.settings.fishing.fish_tracking.right_key
+            self.input_controller.key_up(key)
+        else:
+            self.input_controller.mouse_up("left")
+
+    def _get_region(self, region_key: str) -> tuple[int, int, int, int] | None:
+        """取得觀察區域的螢幕座標"""
+        region = self.regions.region(region_key)
+        return None if region is None else region.rect
@@ -2,24 +2,52 @@
 日誌模組
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
 
+# 背景寫入線程（setup_logger 建立，stop_logger 停止）
+_listener: logging.handlers.QueueListener | None = None
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    不格式化就放入佇列的佇列處理器
+
+    預設的 QueueHandler.prepare() 會在呼叫端線程格式化訊息（為了能跨程序
+    傳遞記錄），佇列只在同一程序內使用，因此直接放入原始記錄，
+    由背景線程的處理器格式化。參數在寫入前不應被修改。
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
 
 def setup_logger(
-    level: str = "INFO", log_file: str | None = None
+    level: str = "INFO",
+    log_file: str | None = None,
+    thread_name: bool = False,
 ) -> logging.Logger:
     """
     設置日誌紀錄器
 
+    控制線程只把日誌記錄放入佇列，格式化與寫入控制台、檔案
+    由背景線程完成，避免 I/O 阻塞檢測與控制迴圈。
+
     Args:
         level: 日誌級別
         log_file: 日誌檔案路徑
+        thread_name: 是否在每行加上線程名稱（多視窗模式用以區分視窗）
 
     Returns:
         配置好的日誌紀錄器
     """
+    # 停止先前的背景寫入線程（會先寫完佇列中的記錄）
+    stop_logger()
+
     # 創建日誌紀錄器
     logger = logging.getLogger("FishingBot")
     logger.setLevel(getattr(logging, level.upper()))
@@ -28,15 +56,16 @@ def setup_logger(
     logger.handlers.clear()
 
     # 創建格式化器
+    thread = " - %(threadName)s" if thread_name else ""
     formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        f"%(asctime)s{thread} - %(name)s - %(levelname)s - %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
     )
 
     # 控制台處理器
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    handlers: list[logging.Handler] = [console_handler]
 
     # 檔案處理器
     if log_file:
@@ -44,6 +73,32 @@ def setup_logger(
         log_path.parent.mkdir(parents=True, exist_ok=True)
         file_handler = logging.FileHandler(log_file, encoding="utf-8")
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    # 佇列處理器：呼叫端只負責放入佇列
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    logger.addHandler(_DeferredQueueHandler(log_queue))
+
+    global _listener
+    _listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    _listener.start()
 
     return logger
+
+
+def stop_logger():
+    """停止背景寫入線程，寫完佇列中剩餘的記錄並關閉處理器"""
+    global _listener
+    listener, _listener = _listener, None
+    if listener is None:
+        return
+
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+# 程式結束時寫完剩餘的日誌
+atexit.register(stop_logger)
@@ -0,0 +1,286 @@
+"""
+執行指標模組
+"""
+
+import bisect
+import contextlib
+import functools
+import math
+import threading
+import time
+from collections.abc import Callable, Generator
+
+from src.clock import SYSTEM_CLOCK, Clock
+
+# 直方圖的預設桶上限（秒）：10 微秒到約 170 秒，每個桶為前一個的 2^(1/4) 倍，
+# 以桶內線性內插估計的百分位數誤差在 19% 以內
+DEFAULT_BOUNDS = tuple(1e-5 * 2 ** (i / 4) for i in range(97))
+
+# 摘要中輸出的百分位數
+SUMMARY_PERCENTILES = (50, 95, 99)
+
+
+class Histogram:
+    """
+    固定桶的串流直方圖
+
+    只保存各桶的計數、總和與最小最大值，記憶體固定，
+    記錄一個值只需一次二分搜尋，可在控制線程中常駐使用。
+    """
+
+    def __init__(self, bounds: tuple[float, ...] = DEFAULT_BOUNDS):
+        """
+        初始化直方圖
+
+        Args:
+            bounds: 遞增的桶上限，超過最後一個上限的值計入溢出桶
+        """
+        self.bounds = bounds
+        self._counts = [0] * (len(bounds) + 1)
+        self._lock = threading.Lock()
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def observe(self, value: float):
+        """
+        記錄一個值
+
+        Args:
+            value: 數值
+        """
+        index = bisect.bisect_left(self.bounds, value)
+        with self._lock:
+            self._counts[index] += 1
+            self.count += 1
+            self.sum += value
+            if value < self.min:
+                self.min = value
+            if value > self.max:
+                self.max = value
+
+    def percentile(self, q: float) -> float | None:
+        """
+        估計百分位數
+
+        Args:
+            q: 百分位（0-100）
+
+        Returns:
+            估計值，沒有記錄時返回 None
+        """
+        with self._lock:
+            return self._percentile(q)
+
+    def _percentile(self, q: float) -> float | None:
+        """估計百分位數（呼叫端需持有鎖）"""
+        if self.count == 0:
+            return None
+
+        rank = q / 100 * self.count
+        cumulative = 0
+        for index, count in enumerate(self._counts):
+            if count and cumulative + count >= rank:
+                # 在桶的上下限之間依排名線性內插，並限制在實際最小最大值內
+                lower = self.bounds[index - 1] if index > 0 else self.min
+                upper = (
+                    self.bounds[index]
+                    if index < len(self.bounds)
+                    else self.max
+                )
+                lower = max(lower, self.min)
+                upper = min(upper, self.max)
+                fraction = (rank - cumulative) / count
+                return lower + (upper - lower) * fraction
+            cumulative += count
+        return self.max
+
+    def buckets(self) -> list[tuple[float, int]]:
+        """
+        取得累計的桶計數
+
+        Returns:
+            (桶上限, 小於等於上限的記錄數) 列表，最後一項的上限為 inf
+        """
+        with self._lock:
+            counts = list(self._counts)
+        cumulative = 0
+        result = []
+        for bound, count in zip((*self.bounds, math.inf), counts, strict=True):
+            cumulative += count
+            result.append((bound, cumulative))
+        return result
+
+    def summary(self) -> dict:
+        """
+        取得摘要
+
+        Returns:
+            記錄數、總和、平均、最小最大值與 p50/p95/p99
+        """
+        with self._lock:
+            if self.count == 0:
+                return {"count": 0}
+            summary = {
+                "count": self.count,
+                "sum": self.sum,
+                "mean": self.sum / self.count,
+                "min": self.min,
+                "max": self.max,
+            }
+            for q in SUMMARY_PERCENTILES:
+                summary[f"p{q}"] = self._percentile(q)
+            return summary
+
+
+class Metrics:
+    """
+    執行指標註冊表
+
+    以名稱區分的計數器與直方圖，首次使用時建立。
+    時間長度以秒為單位記錄到直方圖。
+    """
+
+    def __init__(self, clock: Clock | None = None):
+        """
+        初始化指標註冊表
+
+        Args:
+            clock: 時鐘（運行時間與階段計時，預設使用實際時間）
+        """
+        self.clock = clock or SYSTEM_CLOCK
+        self.start_time = self.clock.monotonic()
+        self._lock = threading.Lock()
+        self._counters: dict[str, int] = {}
+        self._histograms: dict[str, Histogram] = {}
+
+    def uptime(self) -> float:
+        """自建立以來經過的時間（秒）"""
+        return self.clock.monotonic() - self.start_time
+
+    def increment(self, name: str, value: int = 1):
+        """
+        增加計數器
+
+        Args:
+            name: 計數器名稱
+            value: 增加量
+        """
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def counter(self, name: str) -> int:
+        """取得計數器的值"""
+        with self._lock:
+            return self._counters.get(name, 0)
+
+    def rate(self, name: str) -> float:
+        """
+        取得每秒發生次數（計數器的值，或直方圖的記錄數，除以運行時間）
+
+        Args:
+            name: 計數器或直方圖名稱
+
+        Returns:
+            每秒次數，尚未經過時間時為 0
+        """
+        uptime = self.uptime()
+        if uptime <= 0:
+            return 0.0
+        histogram = self._histograms.get(name)
+        count = self.counter(name) if histogram is None else histogram.count
+        return count / uptime
+
+    def histogram(self, name: str) -> Histogram:
+        """
+        取得直方圖（不存在時建立）
+
+        Args:
+            name: 直方圖名稱
+
+        Returns:
+            直方圖
+        """
+        histogram = self._histograms.get(name)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(name, Histogram())
+        return histogram
+
+    def observe(self, name: str, value: float):
+        """
+        記錄一個值到直方圖
+
+        Args:
+            name: 直方圖名稱
+            value: 數值
+        """
+        self.histogram(name).observe(value)
+
+    @contextlib.contextmanager
+    def timer(self, name: str) -> Generator[None]:
+        """
+        以時鐘測量區塊的持續時間並記錄到直方圖
+
+        Args:
+            name: 直方圖名稱
+        """
+        start = self.clock.monotonic()
+        try:
+            yield
+        finally:
+            self.observe(name, self.clock.monotonic() - start)
+
+    def counters(self) -> dict[str, int]:
+        """取得所有計數器"""
+        with self._lock:
+            return dict(self._counters)
+
+    def histograms(self) -> dict[str, Histogram]:
+        """取得所有直方圖"""
+        with self._lock:
+            return dict(self._histograms)
+
+    def snapshot(self) -> dict:
+        """
+        取得所有指標的摘要
+
+        Returns:
+            運行時間、計數器與各直方圖的摘要
+        """
+        return {
+            "uptime": self.uptime(),
+            "counters": self.counters(),
+            "histograms": {
+                name: histogram.summary()
+                for name, histogram in sorted(self.histograms().items())
+            },
+        }
+
+
+def timed(name: str) -> Callable:
+    """
+    以 perf_counter 測量方法耗時的裝飾器
+
+    記錄到實例的 metrics 屬性（Metrics），metrics 為 None 時不測量。
+
+    Args:
+        name: 直方圖名稱
+    """
+
+    def decorator(method: Callable) -> Callable:
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            metrics = self.metrics
+            if metrics is None:
+                return method(self, *args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                metrics.observe(name, time.perf_counter() - start)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,243 @@
+"""
+Prometheus 指標端點模組
+"""
+
+import logging
+import threading
+from collections.abc import Callable, Iterable
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+from src.metrics import Metrics
+
+# 名稱為「類別.項目」的指標輸出為同一個指標族，項目作為標籤，
+# 此表指定各類別使用的標籤名稱（未列出的使用 name）
+LABEL_NAMES = {
+    "phase": "phase",
+    "detector": "method",
+    "failures": "reason",
+    "input_events": "kind",
+    "reaction": "decision",
+    "reaction_over_budget": "decision",
+}
+
+# 輸出的直方圖桶：每 4 個內部桶取一個，即 10 微秒起每次加倍的上限，
+# 這些上限與內部桶邊界重合，累計數準確
+BUCKET_STEP = 4
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _split_name(name: str) -> tuple[str, dict[str, str]]:
+    """
+    將指標名稱拆分為指標族與標籤
+
+    Args:
+        name: 指標名稱（例如 phase.cast）
+
+    Returns:
+        (指標族, 標籤字典)
+    """
+    family, _, item = name.partition(".")
+    family = family.replace("-", "_")
+    if not item:
+        return family, {}
+    return family, {LABEL_NAMES.get(family, "name"): item}
+
+
+def _format_labels(labels: dict[str, str], extra: str = "") -> str:
+    """格式化標籤（extra 為已格式化的附加標籤）"""
+    parts = [
+        key + '="' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+        for key, value in labels.items()
+    ]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def render_prometheus(
+    metrics: Metrics,
+    prefix: str = "fishing_bot",
+    state: str | None = None,
+    states: Iterable[str] = (),
+    counters: dict[str, int] | None = None,
+) -> str:
+    """
+    以 Prometheus 文字格式輸出指標
+
+    Args:
+        metrics: 指標註冊表
+        prefix: 指標名稱前綴
+        state: 目前狀態名稱（None 時不輸出狀態）
+        states: 所有狀態名稱（每個狀態輸出一個 0/1 值）
+        counters: 額外的計數器（名稱規則與 Metrics 相同）
+
+    Returns:
+        指標文字
+    """
+    lines = [
+        f"# HELP {prefix}_uptime_seconds 自啟動以來經過的時間",
+        f"# TYPE {prefix}_uptime_seconds gauge",
+        f"{prefix}_uptime_seconds {metrics.uptime():.3f}",
+    ]
+
+    if state is not None:
+        lines.append(f"# HELP {prefix}_state 目前的釣魚狀態（1 表示目前狀態）")
+        lines.append(f"# TYPE {prefix}_state gauge")
+        for name in states:
+            lines.append(
+                f'{prefix}_state{{state="{name}"}} {int(name == state)}'
+            )
+
+    # 計數器依指標族分組輸出
+    families: dict[str, list[str]] = {}
+    all_counters = metrics.counters()
+    if counters:
+        all_counters.update(counters)
+    for name, value in sorted(all_counters.items()):
+        family, labels = _split_name(name)
+        families.setdefault(family, []).append(
+            f"{prefix}_{family}_total{_format_labels(labels)} {value}"
+        )
+    for family, samples in families.items():
+        lines.append(f"# TYPE {prefix}_{family}_total counter")
+        lines.extend(samples)
+
+    # 直方圖（耗時，秒）
+    families = {}
+    for name, histogram in sorted(metrics.histograms().items()):
+        family, labels = _split_name(name)
+        metric = f"{prefix}_{family}_seconds"
+        buckets = histogram.buckets()
+        exported = buckets[: len(buckets) - 1 : BUCKET_STEP] + [buckets[-1]]
+        samples = families.setdefault(family, [])
+        for bound, count in exported:
+            le = "+Inf" if bound == float("inf") else f"{bound:.6g}"
+            bucket_labels = _format_labels(labels, 'le="' + le + '"')
+            samples.append(f"{metric}_bucket{bucket_labels} {count}")
+        label_text = _format_labels(labels)
+        samples.append(f"{metric}_sum{label_text} {histogram.sum:.9g}")
+        samples.append(f"{metric}_count{label_text} {buckets[-1][1]}")
+    for family, samples in families.items():
+        lines.append(f"# TYPE {prefix}_{family}_seconds histogram")
+        lines.extend(samples)
+
+    lines.append("")
+    return "\n".join(lines)
+
+
+class MetricsExporter:
+    """
+    Prometheus 指標 HTTP 端點
+
+    在獨立的背景線程中以標準函式庫的 HTTPServer 回應 /metrics，
+    指標在每次抓取時才格式化，控制線程只負責更新計數器與直方圖，不會被阻塞。
+    """
+
+    def __init__(
+        self,
+        metrics: Metrics,
+        host: str = "127.0.0.1",
+        port: int = 9464,
+        state: Callable[[], str] | None = None,
+        states: Iterable[str] = (),
+        counters: Callable[[], dict[str, int]] | None = None,
+    ):
+        """
+        初始化指標端點
+
+        Args:
+            metrics: 指標註冊表
+            host: 綁定的位址
+            port: 綁定的埠號（0 表示自動選擇）
+            state: 取得目前狀態名稱的函數（可選）
+            states: 所有狀態名稱
+            counters: 取得額外計數器的函數（可選）
+        """
+        self.metrics = metrics
+        self.host = host
+        self.port = port
+        self.state = state
+        self.states = tuple(states)
+        self.counters = counters
+        self.logger = logging.getLogger("FishingBot.MetricsExporter")
+
+        self.scrape_count = 0
+        self._server: HTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    def render(self) -> str:
+        """以 Prometheus 文字格式輸出目前的指標"""
+        return render_prometheus(
+            self.metrics,
+            state=self.state() if self.state is not None else None,
+            states=self.states,
+            counters=self.counters() if self.counters is not None else None,
+        )
+
+    def start(self) -> bool:
+        """
+        綁定埠號並啟動服務線程
+
+        Returns:
+            是否成功啟動（埠號被佔用時返回 False）
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return True
+
+        exporter = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?", 1)[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                try:
+                    body = exporter.render().encode("utf-8")
+                except Exception as e:
+                    exporter.logger.error("輸出指標失敗: %s", e)
+                    self.send_error(500)
+                    return
+                exporter.scrape_count += 1
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                exporter.logger.debug(
+                    "%s - %s", self.address_string(), format % args
+                )
+
+        try:
+            self._server = HTTPServer((self.host, self.port), Handler)
+        except OSError as e:
+            self.logger.error(
+                "無法啟動指標端點 %s:%s: %s", self.host, self.port, e
+            )
+            return False
+
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            kwargs={"poll_interval": 0.5},
+            name="MetricsExporterThread",
+            daemon=True,
+        )
+        self._thread.start()
+        self.logger.info(
+            "指標端點: http://%s:%s/metrics", self.host, self.port
+        )
+        return True
+
+    def stop(self):
+        """停止服務線程並關閉埠號"""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._server = None
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
@@ -0,0 +1,201 @@
+"""
+多視窗釣魚模組
+"""
+
+import logging
+import threading
+
+from src.capture_backend import ScreenCaptureBackend
+from src.capture_scheduler import CaptureScheduler
+from src.clock import SYSTEM_CLOCK, Clock
+from src.config_manager import ConfigManager
+from src.fishing_bot import FishingBot, FishingState
+from src.hotkey import HotkeyListener
+from src.image_detector import ImageDetector, TemplateCache
+from src.input_arbiter import InputArbiter
+from src.input_backend import create_input_backend
+from src.window_manager import WindowManager
+
+# 不限制截圖頻率的時間關鍵狀態（咬鉤後的反應與拉力控制）
+TIME_CRITICAL_STATES = (
+    FishingState.BITING,
+    FishingState.REELING,
+    FishingState.TENSION,
+)
+
+
+class MultiWindowBot:
+    """
+    多視窗釣魚機器人
+
+    在同一個程序中為每個標題相符的遊戲視窗建立一個 FishingBot，
+    各自在獨立線程中執行釣魚循環。所有視窗共用模板快取、截圖線程
+    （依各視窗的釣魚狀態排程截圖頻率）與輸入仲裁器；拉力階段期間
+    該視窗持有輸入租約，其他視窗的輸入等到拉力階段結束。
+    """
+
+    def __init__(self, config: ConfigManager, clock: Clock | None = None):
+        """
+        初始化多視窗釣魚機器人
+
+        Args:
+            config: 設定管理器（第一個視窗使用，其他視窗各自載入同一個設定檔）
+            clock: 時鐘，None 時使用實際時間
+        """
+        self.config = config
+        self.clock = clock or SYSTEM_CLOCK
+        self.logger = logging.getLogger("FishingBot.MultiWindow")
+
+        multi = config.settings.multi_window
+        self.templates = TemplateCache()
+        self.capture_scheduler = CaptureScheduler(
+            ScreenCaptureBackend(), self.clock
+        )
+        self.input_arbiter = InputArbiter(multi.switch_delay, self.clock)
+
+        self.bots: list[FishingBot] = []
+        self._threads: list[threading.Thread] = []
+
+        # 遙測保存熱鍵只註冊一次，保存所有視窗的遙測
+        self.hotkeys = HotkeyListener()
+        telemetry = config.settings.telemetry
+        if telemetry.enabled and telemetry.dump_hotkey:
+            self.hotkeys.register(telemetry.dump_hotkey, self.dump_telemetry)
+
+    def find_game_windows(self) -> bool:
+        """
+        尋找所有遊戲視窗並為每個視窗建立機器人
+
+        Returns:
+            是否至少找到一個視窗
+        """
+        settings = self.config.settings
+        handles = WindowManager.list_handles(settings.game.window_title)
+        max_windows = settings.multi_window.max_windows
+        if max_windows:
+            handles = handles[:max_windows]
+
+        for handle in handles:
+            bot = self._create_bot(len(self.bots), handle)
+            if bot is not None:
+                self.bots.append(bot)
+
+        if not self.bots:
+            self.logger.warning(
+                "未找到標題包含 '%s' 的視窗", settings.game.window_title
+            )
+            return False
+
+        self.logger.info("找到 %s 個遊戲視窗", len(self.bots))
+        return True
+
+    def _create_bot(self, instance: int, handle: int) -> FishingBot | None:
+        """
+        為單一視窗建立機器人
+
+        Args:
+            instance: 視窗編號
+            handle: 視窗代碼
+
+        Returns:
+            機器人，視窗已關閉時返回 None
+        """
+        # 每個視窗各自載入設定檔，熱重載的暫存與套用互不干擾
+        config = (
+            self.config
+            if instance == 0
+            else ConfigManager(str(self.config.config_path))
+        )
+        settings = config.settings
+
+        window_manager = WindowManager(
+            settings.game.window_title,
+            settings.game.window_rect_ttl,
+            self.clock,
+            handle,
+        )
+        if not window_manager.find_window():
+            return None
+
+        name = f"window{instance + 1}"
+        capture = self.capture_scheduler.client(name)
+        input_backend = self.input_arbiter.client(
+            create_input_backend(config, self.clock), window_manager
+        )
+        bot = FishingBot(
+            config,
+            window_manager,
+            input_backend,
+            ImageDetector(
+                settings.detection.threshold, capture, self.templates
+            ),
+            self.clock,
+            instance,
+        )
+
+        multi = settings.multi_window
+        capture.rate = lambda: self._capture_rate(bot.state, multi)
+        capture.metrics = bot.metrics
+        # 整個拉力階段持有輸入租約，方向鍵與左鍵短暫全部放開時也不切換視窗
+        bot.state_listeners.append(
+            lambda state: input_backend.lease(state == FishingState.TENSION)
+        )
+        return bot
+
+    @staticmethod
+    def _capture_rate(state: FishingState, multi) -> float:
+        """依釣魚狀態決定每秒最多截圖次數（0 表示不限制）"""
+        if state in TIME_CRITICAL_STATES:
+            return 0.0
+        if state == FishingState.WAITING:
+            return multi.waiting_fps
+        return multi.background_fps
+
+    def dump_telemetry(self):
+        """保存所有視窗的控制週期遙測（熱鍵觸發）"""
+        for bot in self.bots:
+            bot.dump_telemetry("hotkey")
+
+    def start(self):
+        """在各自的線程中開始所有視窗的釣魚循環，直到全部結束"""
+        self.hotkeys.start()
+        for bot in self.bots:
+            thread = threading.Thread(
+                target=bot.start, name=f"FishingBot-{bot.name}", daemon=True
+            )
+            self._threads.append(thread)
+            thread.start()
+
+        try:
+            for thread in self._threads:
+                while thread.is_alive():
+                    thread.join(0.5)
+        except KeyboardInterrupt:
+            self.logger.info("檢測到中斷信號，停止所有視窗")
+        finally:
+            self.stop()
+
+    def stop(self, timeout: float = 5.0):
+        """
+        停止所有視窗並輸出統計
+
+        Args:
+            timeout: 等待各視窗結束目前循環的時間（秒）
+        """
+        self.hotkeys.stop()
+        for bot in self.bots:
+            if bot.running:
+                bot.stop()
+        for thread in self._threads:
+            thread.join(timeout)
+        self.capture_scheduler.close()
+
+        for name, stats in self.capture_scheduler.get_statistics().items():
+            self.logger.info(
+                "%s: 截圖 %s 次，平均等待 %.1f ms，最長等待 %.1f ms",
+                name,
+                stats["captures"],
+                stats["mean_wait_ms"],
+                stats["max_wait_ms"],
+            )
+        self.logger.info("輸入視窗切換 %s 次", self.input_arbiter.switch_count)
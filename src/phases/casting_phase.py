@@ -3,11 +3,13 @@
 """
 
 import logging
-import time
 
+from src.clock import SYSTEM_CLOCK, Clock
 from src.config_manager import ConfigManager
-from src.input_controller_winapi import WinAPIInputController
-from src.window_manager import WindowManager
+from src.input_backend import InputBackend
+from src.region_registry import RegionRegistry
+from src.tracing import traced
+from src.window_manager import WindowManagerLike
 
 
 class CastingPhase:
@@ -16,8 +18,10 @@ class CastingPhase:
     def __init__(
         self,
         config: ConfigManager,
-        window_manager: WindowManager,
-        input_controller: WinAPIInputController,
+        window_manager: WindowManagerLike,
+        input_controller: InputBackend,
+        regions: RegionRegistry | None = None,
+        clock: Clock | None = None,
     ):
         """
         初始化拋竿階段處理器
@@ -26,56 +30,53 @@ class CastingPhase:
             config: 配置管理器
             window_manager: 視窗管理器
             input_controller: 輸入控制器
+            regions: 檢測區域註冊表（可選，預設依視窗管理器建立）
+            clock: 時鐘（可選，預設使用實際時間）
         """
         self.config = config
         self.window_manager = window_manager
         self.input_controller = input_controller
+        self.regions = regions or RegionRegistry(config, window_manager)
+        self.clock = clock or SYSTEM_CLOCK
         self.logger = logging.getLogger("FishingBot.CastingPhase")
 
+    @traced("cast", "phase")
     def execute(self):
         """執行拋竿操作"""
         self.logger.debug("開始拋竿")
 
         # 執行拋竿操作
-        cast_type = self.config.get("fishing.cast_type", "key")
-        if cast_type == "click":
+        fishing = self.config.settings.fishing
+        if fishing.cast_type == "click":
             self._cast_by_click()
         else:
             self._cast_by_key()
 
+        # 確認拋竿輸入已送達後才開始計算動畫時間
+        self.input_controller.flush()
+
         # 等待拋竿動畫
-        cast_delay = self.config.get("fishing.cast_delay", 2)
-        time.sleep(cast_delay)
+        self.clock.sleep(fishing.cast_delay)
 
         self.logger.debug("拋竿完成")
 
     def _cast_by_click(self):
         """滑鼠點擊拋竿"""
-        window_rect = self.window_manager.get_window_rect()
-        if not window_rect:
+        click_pos = self.regions.point("fishing.cast_click_pos")
+        if click_pos is None:
             self.logger.error("無法取得視窗位置，拋竿失敗")
             return
 
-        x, y, w, h = window_rect
-        click_pos = self.config.get(
-            "fishing.cast_click_pos", {"x": 0.5, "y": 0.5}
-        )
-        click_x = int(x + w * click_pos["x"])
-        click_y = int(y + h * click_pos["y"])
+        click_x, click_y = click_pos
 
         # 讀取滑鼠移動時間配置
-        move_duration = self.config.get(
-            "anti_detection.mouse_move_duration", 0.0
-        )
+        move_duration = self.config.settings.anti_detection.mouse_move_duration
 
-        self.logger.info(
-            f"執行點擊拋竿: 視窗({x},{y},{w}x{h}), 點擊位置({click_x},{click_y})"
-        )
+        self.logger.info("執行點擊拋竿: 點擊位置(%s,%s)", click_x, click_y)
         self.input_controller.click(
             click_x, click_y, button="left", move_duration=move_duration
         )
 
     def _cast_by_key(self):
         """鍵盤按鍵拋竿"""
-        cast_key = self.config.get("fishing.cast_key", "e")
-        self.input_controller.press_key(cast_key)
+        self.input_controller.press_key(self.config.settings.fishing.cast_key)
@@ -3,13 +3,15 @@
 """
 
 import logging
-import time
 
+from src.clock import SYSTEM_CLOCK, Clock
 from src.config_manager import ConfigManager
 from src.image_detector import ImageDetector
-from src.input_controller_winapi import WinAPIInputController
+from src.input_backend import InputBackend
+from src.region_registry import RegionRegistry
+from src.tracing import traced
 from src.utils import get_resource_path
-from src.window_manager import WindowManager
+from src.window_manager import WindowManagerLike
 
 
 class CompletionPhase:
@@ -18,9 +20,11 @@ class CompletionPhase:
     def __init__(
         self,
         config: ConfigManager,
-        window_manager: WindowManager,
-        input_controller: WinAPIInputController,
+        window_manager: WindowManagerLike,
+        input_controller: InputBackend,
         image_detector: ImageDetector,
+        regions: RegionRegistry | None = None,
+        clock: Clock | None = None,
     ):
         """
         初始化完成階段處理器
@@ -30,56 +34,52 @@ class CompletionPhase:
             window_manager: 視窗管理器
             input_controller: 輸入控制器
             image_detector: 圖像檢測器
+            regions: 檢測區域註冊表（可選，預設依視窗管理器建立）
+            clock: 時鐘（可選，預設使用實際時間）
         """
         self.config = config
         self.window_manager = window_manager
         self.input_controller = input_controller
         self.image_detector = image_detector
+        self.regions = regions or RegionRegistry(config, window_manager)
+        self.clock = clock or SYSTEM_CLOCK
         self.logger = logging.getLogger("FishingBot.CompletionPhase")
 
-    def reset_and_continue(self):
-        """重置狀態，點擊"再來一次"按鈕繼續釣魚"""
+    @traced("completion", "phase")
+    def reset_and_continue(self) -> bool:
+        """
+        重置狀態，點擊"再來一次"按鈕繼續釣魚
+
+        Returns:
+            是否找到並點擊了按鈕
+        """
         self.logger.debug("開始尋找'再來一次'按鈕")
 
         # 獲取配置
-        retry_config = self.config.get("detection.retry_button", {})
-        wait_time = retry_config.get("wait_time", 2)
-        search_timeout = retry_config.get("search_timeout", 5)
-        check_interval = retry_config.get("check_interval", 0.5)
-        template_path = get_resource_path(
-            retry_config.get("template", "templates/retry_button.png")
-        )
+        retry_config = self.config.settings.detection.retry_button
+        wait_time = retry_config.wait_time
+        search_timeout = retry_config.search_timeout
+        check_interval = retry_config.check_interval
+        template_path = get_resource_path(retry_config.template)
 
         # 等待按鈕出現
-        time.sleep(wait_time)
+        self.clock.sleep(wait_time)
 
-        # 獲取視窗信息
-        window_rect = self.window_manager.get_window_rect()
-        if not window_rect:
+        # 獲取搜索區域
+        region = self.regions.region("detection.retry_button.region")
+        if region is None:
             self.logger.warning("無法獲取視窗位置，跳過重置")
-            return
-
-        x, y, w, h = window_rect
-        region_config = retry_config.get(
-            "region", {"x": 0.0, "y": 0.0, "width": 1.0, "height": 1.0}
-        )
-
-        region = (
-            int(x + w * region_config["x"]),
-            int(y + h * region_config["y"]),
-            int(w * region_config["width"]),
-            int(h * region_config["height"]),
-        )
+            return False
 
         # 嘗試查找按鈕
-        start_time = time.time()
+        start_time = self.clock.monotonic()
         found = False
 
-        while time.time() - start_time < search_timeout:
+        while self.clock.monotonic() - start_time < search_timeout:
             try:
-                screen = self.image_detector.capture_screen(region)
+                screen = self.image_detector.capture_screen(region.rect)
                 if screen is None:
-                    time.sleep(check_interval)
+                    self.clock.sleep(check_interval)
                     continue
 
                 position = self.image_detector.find_template(
@@ -87,18 +87,18 @@ class CompletionPhase:
                 )
 
                 if position is not None:
-                    click_x = region[0] + position[0]
-                    click_y = region[1] + position[1]
+                    click_x = region.x + position[0]
+                    click_y = region.y + position[1]
 
                     self.logger.info(
                         f"找到'再來一次'按鈕，位置: ({click_x}, {click_y})"
                     )
 
                     # 讀取滑鼠移動時間配置
-                    move_duration = self.config.get(
-                        "anti_detection.mouse_move_duration", 0.0
+                    move_duration = (
+                        self.config.settings.anti_detection.mouse_move_duration
                     )
-                    time.sleep(0.5)
+                    self.clock.sleep(0.5)
 
                     self.input_controller.click(
                         click_x,
@@ -107,17 +107,18 @@ class CompletionPhase:
                         move_duration=move_duration,
                     )
 
+                    self.input_controller.flush()
                     self.logger.info("已點擊'再來一次'按鈕")
                     found = True
                     break
             except Exception as e:
                 self.logger.debug(f"搜尋按鈕失敗: {e}")
 
-            time.sleep(check_interval)
+            self.clock.sleep(check_interval)
 
         if not found:
             self.logger.warning("未找到'再來一次'按鈕，可能需要手動操作")
-            time.sleep(1)
+            self.clock.sleep(1)
         else:
-            response_delay = retry_config.get("response_delay", 1)
-            time.sleep(response_delay)
+            self.clock.sleep(retry_config.response_delay)
+        return found
@@ -3,22 +3,26 @@
 """
 
 import logging
-import time
 
+from src.clock import SYSTEM_CLOCK, Clock
 from src.config_manager import ConfigManager
 from src.image_detector import ImageDetector
-from src.input_controller_winapi import WinAPIInputController
+from src.input_backend import InputBackend
+from src.region_registry import RegionRegistry
+from src.tracing import traced
 from src.utils import get_resource_path
-from src.window_manager import WindowManager
+from src.window_manager import WindowManagerLike
 
 
 class PreparationPhase:
     def __init__(
         self,
         config: ConfigManager,
-        window_manager: WindowManager,
-        input_controller: WinAPIInputController,
+        window_manager: WindowManagerLike,
+        input_controller: InputBackend,
         image_detector: ImageDetector,
+        regions: RegionRegistry | None = None,
+        clock: Clock | None = None,
     ):
         """
         初始化準備階段處理器
@@ -28,58 +32,49 @@ class PreparationPhase:
             window_manager: 視窗管理器
             input_controller: 輸入控制器
             image_detector: 圖像檢測器
+            regions: 檢測區域註冊表（可選，預設依視窗管理器建立）
+            clock: 時鐘（可選，預設使用實際時間）
         """
         self.config = config
         self.window_manager = window_manager
         self.input_controller = input_controller
         self.image_detector = image_detector
+        self.regions = regions or RegionRegistry(config, window_manager)
+        self.clock = clock or SYSTEM_CLOCK
         self.logger = logging.getLogger("FishingBot.PreparationPhase")
 
+    @traced("preparation", "phase")
     def check_and_replace_rod(self):
         """檢查魚竿耐久度是否耗盡，如果耗盡則點擊更換"""
         self.logger.debug("檢查魚竿耐久度")
 
         # 取得配置
-        rod_config = self.config.get("detection.rod_durability", {})
-        wait_time = rod_config.get("wait_time", 0.1)
-        search_timeout = rod_config.get("search_timeout", 0.4)
-        template_path = get_resource_path(
-            rod_config.get("template", "templates/rod_depleted.png")
-        )
-        click_delay = rod_config.get("click_delay", 0.5)
-        response_delay = rod_config.get("response_delay", 0.1)
-        check_interval = rod_config.get("check_interval", 0.1)
+        rod_config = self.config.settings.detection.rod_durability
+        wait_time = rod_config.wait_time
+        search_timeout = rod_config.search_timeout
+        template_path = get_resource_path(rod_config.template)
+        click_delay = rod_config.click_delay
+        response_delay = rod_config.response_delay
+        check_interval = rod_config.check_interval
 
         # 等待提示出現
-        time.sleep(wait_time)
+        self.clock.sleep(wait_time)
 
-        # 取得視窗資訊
-        window_rect = self.window_manager.get_window_rect()
-        if not window_rect:
+        # 取得搜索區域
+        region = self.regions.region("detection.rod_durability.region")
+        if region is None:
             self.logger.warning("無法取得視窗位置，跳過耐久度檢查")
             return
 
-        x, y, w, h = window_rect
-        region_config = rod_config.get(
-            "region", {"x": 0.0, "y": 0.0, "width": 1.0, "height": 1.0}
-        )
-
-        region = (
-            int(x + w * region_config["x"]),
-            int(y + h * region_config["y"]),
-            int(w * region_config["width"]),
-            int(h * region_config["height"]),
-        )
-
         # 嘗試查找耐久度耗盡提示
-        start_time = time.time()
+        start_time = self.clock.monotonic()
         found = False
 
-        while time.time() - start_time < search_timeout:
+        while self.clock.monotonic() - start_time < search_timeout:
             try:
-                screen = self.image_detector.capture_screen(region)
+                screen = self.image_detector.capture_screen(region.rect)
                 if screen is None:
-                    time.sleep(check_interval)
+                    self.clock.sleep(check_interval)
                     continue
 
                 position = self.image_detector.find_template(
@@ -92,28 +87,29 @@ class PreparationPhase:
             except Exception as e:
                 self.logger.debug(f"搜尋耐久度提示失敗: {e}")
 
-            time.sleep(check_interval)
+            self.clock.sleep(check_interval)
 
         if found:
-            # 取得點擊位置配置
-            first_click_pos = rod_config.get(
-                "first_click_pos", {"x": 0.5, "y": 0.5}
+            # 取得點擊位置
+            first_click_pos = self.regions.point(
+                "detection.rod_durability.first_click_pos"
             )
-            first_click_x = int(x + w * first_click_pos["x"])
-            first_click_y = int(y + h * first_click_pos["y"])
-
-            second_click_pos = rod_config.get(
-                "second_click_pos", {"x": 0.5, "y": 0.6}
+            second_click_pos = self.regions.point(
+                "detection.rod_durability.second_click_pos"
             )
-            second_click_x = int(x + w * second_click_pos["x"])
-            second_click_y = int(y + h * second_click_pos["y"])
+            if first_click_pos is None or second_click_pos is None:
+                self.logger.warning("無法取得視窗位置，跳過更換魚竿")
+                return
+
+            first_click_x, first_click_y = first_click_pos
+            second_click_x, second_click_y = second_click_pos
 
             self.logger.info("開始更換魚竿")
 
             try:
                 # 讀取滑鼠移動時間配置
-                move_duration = self.config.get(
-                    "anti_detection.mouse_move_duration", 0.0
+                move_duration = (
+                    self.config.settings.anti_detection.mouse_move_duration
                 )
 
                 # 按下 Alt 鍵
@@ -132,7 +128,7 @@ class PreparationPhase:
                 )
                 self.logger.debug("第一次點擊完成")
 
-                time.sleep(click_delay)
+                self.clock.sleep(click_delay)
 
                 # 第二次點擊
                 self.logger.info(
@@ -148,10 +144,11 @@ class PreparationPhase:
             finally:
                 # 確保釋放 Alt 鍵
                 self.input_controller.key_up("alt")
+                self.input_controller.flush()
                 self.logger.debug("釋放 Alt 鍵")
                 self.logger.info("魚竿已更換")
 
             # 等待界面響應
-            time.sleep(response_delay)
+            self.clock.sleep(response_delay)
         else:
             self.logger.debug("魚竿耐久度正常")
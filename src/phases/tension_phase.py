@@ -3,14 +3,30 @@
 """
 
 import logging
-import threading
+import math
 import time
+from pathlib import Path
 
+from src.clock import SYSTEM_CLOCK, Clock
 from src.config_manager import ConfigManager
 from src.image_detector import ImageDetector
-from src.input_controller_winapi import WinAPIInputController
+from src.input_state import InputStateManager
+from src.latency_calibration import LatencyProfile
+from src.region_registry import RegionRegistry
+from src.steering_controller import (
+    SteeringController,
+    SteeringTrace,
+)
+from src.telemetry import (
+    HELD_LEFT_KEY,
+    HELD_MOUSE_LEFT,
+    HELD_RIGHT_KEY,
+    PHASE_CODES,
+    TelemetryRing,
+)
+from src.tracing import active_tracer, traced
 from src.utils import get_resource_path
-from src.window_manager import WindowManager
+from src.window_manager import WindowManagerLike
 
 
 class TensionPhase:
@@ -19,9 +35,13 @@ class TensionPhase:
     def __init__(
         self,
         config: ConfigManager,
-        window_manager: WindowManager,
-        input_controller: WinAPIInputController,
+        window_manager: WindowManagerLike,
+        input_controller: InputStateManager,
         image_detector: ImageDetector,
+        latency_profile: LatencyProfile | None = None,
+        regions: RegionRegistry | None = None,
+        telemetry: TelemetryRing | None = None,
+        clock: Clock | None = None,
     ):
         """
         初始化拉力計階段處理器
@@ -31,13 +51,22 @@ class TensionPhase:
             window_manager: 視窗管理器
             input_controller: 輸入控制器
             image_detector: 圖像檢測器
+            latency_profile: 校準測得的輸入延遲分佈（可選）
+            regions: 檢測區域註冊表（可選，預設依視窗管理器建立）
+            telemetry: 控制週期遙測緩衝區（可選）
+            clock: 時鐘（可選，預設使用實際時間）
         """
         self.config = config
         self.window_manager = window_manager
         self.input_controller = input_controller
         self.image_detector = image_detector
+        self.latency_profile = latency_profile or LatencyProfile()
+        self.regions = regions or RegionRegistry(config, window_manager)
+        self.clock = clock or SYSTEM_CLOCK
+        self.telemetry = telemetry
         self.logger = logging.getLogger("FishingBot.TensionPhase")
 
+    @traced("detect_tension_bar", "phase")
     def detect_tension_bar(self) -> bool:
         """
         檢測是否出現拉力計
@@ -45,115 +74,109 @@ class TensionPhase:
         Returns:
             是否檢測到拉力計
         """
-        window_rect = self.window_manager.get_window_rect()
-        if not window_rect:
+        region = self.regions.region("detection.tension_bar.region")
+        if region is None:
             return False
 
-        x, y, w, h = window_rect
-        tension_config = self.config.get("detection.tension_bar", {})
-        region_config = tension_config.get(
-            "region", {"x": 0.25, "y": 0.7, "width": 0.4, "height": 0.2}
-        )
-
-        region = (
-            int(x + w * region_config["x"]),
-            int(y + h * region_config["y"]),
-            int(w * region_config["width"]),
-            int(h * region_config["height"]),
-        )
-
         template_path = get_resource_path(
-            tension_config.get("template", "templates/tension_bar.png")
+            self.config.settings.detection.tension_bar.template
         )
         try:
-            screen = self.image_detector.capture_screen(region)
+            screen = self.image_detector.capture_screen(region.rect)
             position = self.image_detector.find_template(screen, template_path)
             if position is not None:
-                self.logger.debug(f"在 {position} 檢測到拉力計")
+                self.logger.debug("在 %s 檢測到拉力計", position)
                 return True
         except Exception as e:
-            self.logger.debug(f"拉力計模板匹配失敗: {e}")
+            self.logger.debug("拉力計模板匹配失敗: %s", e)
 
         return False
 
-    def handle_tension_phase(self):
-        """處理拉力計階段（收竿後的魚追蹤和QTE）"""
+    @traced("tension", "phase")
+    def handle_tension_phase(self) -> bool:
+        """
+        處理拉力計階段（收竿後的魚追蹤和QTE）
+
+        Returns:
+            拉力計是否在時限內消失（False 表示逾時）
+        """
         self.logger.info("開始處理拉力計階段")
 
         # 取得配置
-        tension_duration = self.config.get(
-            "fishing.tension_phase.duration", 180
-        )
+        tension_duration = self.config.settings.fishing.tension_phase.duration
 
         # 共享狀態變量
         self.stop_threads = False
-        self.start_time = time.time()
+        self.start_time = self.clock.monotonic()
 
-        # 創建並啟動兩個獨立線程
-        mouse_thread = threading.Thread(
-            target=self._mouse_control_thread, name="MouseControlThread"
+        # 創建並啟動兩個獨立線程（經由時鐘啟動，虛擬時鐘才能追蹤兩個線程）
+        mouse_thread = self.clock.start_thread(
+            self._mouse_control_thread, "MouseControlThread"
         )
-        movement_thread = threading.Thread(
-            target=self._movement_control_thread, name="MovementControlThread"
+        movement_thread = self.clock.start_thread(
+            self._movement_control_thread, "MovementControlThread"
         )
 
-        # 啟動線程
-        mouse_thread.start()
-        movement_thread.start()
-
+        completed = False
         try:
             # 主循環：監控拉力計是否還存在
-            while time.time() - self.start_time < tension_duration:
+            while self.clock.monotonic() - self.start_time < tension_duration:
                 if not self.detect_tension_bar():
                     self.logger.info("拉力計消失，結束追蹤階段")
+                    completed = True
                     break
-                time.sleep(0.5)
+                self.clock.sleep(0.5)
+            else:
+                self.logger.warning("拉力計階段超時 (%s秒)", tension_duration)
         finally:
             # 通知線程停止
             self.stop_threads = True
 
             # 等待線程結束
-            mouse_thread.join(timeout=1.0)
-            movement_thread.join(timeout=1.0)
+            self.clock.join(mouse_thread, timeout=1.0)
+            self.clock.join(movement_thread, timeout=1.0)
+
+            # 線程異常結束時也不留下按住的按鍵
+            self.input_controller.release_all()
 
             self.logger.info("拉力計階段完成")
 
+        return completed
+
     def _mouse_control_thread(self):
         """左鍵控制線程"""
         # 取得配置
-        red_tension_intermittent_hold_threshold = self.config.get(
-            "fishing.tension_phase.red_tension_intermittent_hold_threshold", 50
-        )
-        intermittent_hold_duration = self.config.get(
-            "fishing.tension_phase.intermittent_hold_duration", 0.2
-        )
-        intermittent_release_duration = self.config.get(
-            "fishing.tension_phase.intermittent_release_duration", 0.2
+        tension_config = self.config.settings.fishing.tension_phase
+        red_tension_intermittent_hold_threshold = (
+            tension_config.red_tension_intermittent_hold_threshold
         )
-        red_tension_max_threshold = self.config.get(
-            "fishing.tension_phase.red_tension_max_threshold", 100
+        intermittent_hold_duration = tension_config.intermittent_hold_duration
+        intermittent_release_duration = (
+            tension_config.intermittent_release_duration
         )
-        max_tension_release_duration = self.config.get(
-            "fishing.tension_phase.max_tension_release_duration", 0.3
-        )
-        check_interval = self.config.get(
-            "fishing.tension_phase.check_interval", 0.05
+        red_tension_max_threshold = tension_config.red_tension_max_threshold
+        max_tension_release_duration = (
+            tension_config.max_tension_release_duration
         )
+        check_interval = tension_config.check_interval
+        telemetry = self.telemetry
+        tracer = active_tracer()
 
-        is_holding_mouse = False
         click_hold_release_time = None
 
         # 開始時先按住左鍵
         self.input_controller.mouse_down("left")
-        is_holding_mouse = True
         self.logger.info("開始按住滑鼠左鍵")
 
         try:
             while not self.stop_threads:
+                tick_start = time.perf_counter_ns()
+
                 # 檢測紅色張力狀態
+                detect_start = time.perf_counter()
                 tension_value = self._detect_red_tension_color()
                 if tension_value is not None:
-                    self.logger.debug(f"張力值: {tension_value}")
+                    self.logger.debug("張力值: %s", tension_value)
                 else:
                     self.logger.debug("張力值識別失敗")
                     is_red_high = self._detect_red_tension_template()
@@ -162,9 +185,14 @@ class TensionPhase:
                         tension_value = 101  # 強制視為過高
                     else:
                         tension_value = 0
+                detect_time = time.perf_counter() - detect_start
+                frame_time = self.image_detector.last_capture_time()
 
                 # 控制左鍵
-                current_time = time.time()
+                is_holding_mouse = self.input_controller.is_pressed(
+                    "mouse", "left"
+                )
+                current_time = self.clock.monotonic()
                 elapsed_since_time = None
                 if click_hold_release_time is not None:
                     elapsed_since_time = current_time - click_hold_release_time
@@ -176,11 +204,14 @@ class TensionPhase:
                     ):
                         # 張力過高，釋放滑鼠左鍵
                         if is_holding_mouse:
-                            self.input_controller.mouse_up("left")
-                            is_holding_mouse = False
+                            with self.input_controller.reacting(
+                                "tension_release", frame_time
+                            ):
+                                self.input_controller.mouse_up("left")
                             click_hold_release_time = current_time
                             self.logger.info(
-                                f"拉力過高！釋放滑鼠左鍵並保持{max_tension_release_duration}秒"
+                                "拉力過高！釋放滑鼠左鍵並保持%s秒",
+                                max_tension_release_duration,
                             )
                 elif tension_value >= red_tension_intermittent_hold_threshold:
                     # 張力較高，間歇點擊滑鼠左鍵
@@ -189,8 +220,10 @@ class TensionPhase:
                             elapsed_since_time is None
                             or elapsed_since_time >= intermittent_hold_duration
                         ):
-                            self.input_controller.mouse_up("left")
-                            is_holding_mouse = False
+                            with self.input_controller.reacting(
+                                "tension_release", frame_time
+                            ):
+                                self.input_controller.mouse_up("left")
                             click_hold_release_time = current_time
                     else:
                         if (
@@ -199,231 +232,208 @@ class TensionPhase:
                             >= intermittent_release_duration
                         ):
                             self.input_controller.mouse_down("left")
-                            is_holding_mouse = True
                             click_hold_release_time = current_time
                 else:
                     if not is_holding_mouse:
                         self.input_controller.mouse_down("left")
-                        is_holding_mouse = True
 
-                time.sleep(check_interval)
+                if telemetry is not None:
+                    telemetry.record(
+                        PHASE_CODES["tension"],
+                        tension=tension_value,
+                        held=self._get_held_bits(),
+                        detect_time=detect_time,
+                    )
+                if tracer is not None:
+                    tracer.record("tension_tick", "control", tick_start)
+
+                self.clock.sleep(check_interval)
 
         finally:
             # 確保釋放滑鼠左鍵
-            if is_holding_mouse:
+            if self.input_controller.is_pressed("mouse", "left"):
                 self.input_controller.mouse_up("left")
                 self.logger.info("釋放滑鼠左鍵")
 
     def _movement_control_thread(self):
         """AD 方向鍵控制線程"""
-        tracking_enabled = self.config.get(
-            "fishing.fish_tracking.enabled", True
-        )
+        tracking_config = self.config.settings.fishing.fish_tracking
 
-        if not tracking_enabled:
+        if not tracking_config.enabled:
             self.logger.info("魚追蹤已禁用，移動控制線程退出")
             return
 
         # 取得配置
-        check_interval = self.config.get(
-            "fishing.fish_tracking.check_interval", 0.05
-        )
-        hold_rate = (
-            2.8  # 因為左右魚桿比放開還慢N倍，這個參數用來補償這個時間差
-        )
-        fish_speed_rate = (
-            1.7  # 因為左右魚桿和魚的速度不同，這個參數用來調整追蹤速度
-        )
         max_no_detection = 100
-
-        left_key = self.config.get("fishing.fish_tracking.left_key", "a")
-        right_key = self.config.get("fishing.fish_tracking.right_key", "d")
-        center_threshold_max = self.config.get(
-            "fishing.fish_tracking.center_threshold_max", 0.10
-        )
-
-        is_holding_left = False
-        is_holding_right = False
-        last_fish_position = None
-        pre_fish_position = ("center", 0.0)
+        left_key = tracking_config.left_key
+        right_key = tracking_config.right_key
+        record_sessions = tracking_config.record_sessions
+
+        controller = self._create_steering_controller()
+        period = controller.period
+        trace = SteeringTrace() if record_sessions else None
+        telemetry = self.telemetry
+        tracer = active_tracer()
+
+        # 方向：-1 為左、1 為右、0 為不按鍵
+        keys = {-1: left_key, 1: right_key}
+        last_offset = None
         no_detection_count = 0
 
         try:
             while not self.stop_threads:
-                # 魚追蹤
-                fish_direction, offset_ratio = self._get_fish_position()
+                period_start = self.clock.monotonic()
+                tick_start = time.perf_counter_ns()
 
-                if fish_direction is not None:
-                    last_fish_position = (fish_direction, offset_ratio)
+                # 魚追蹤
+                detect_start = time.perf_counter()
+                offset = self._get_fish_offset()
+                detect_time = time.perf_counter() - detect_start
+                frame_time = self.image_detector.last_capture_time()
+                detected_offset = math.nan if offset is None else offset
+
+                if offset is not None:
+                    last_offset = offset
                     no_detection_count = 0
                 else:
                     no_detection_count += 1
                     if (
                         no_detection_count <= max_no_detection
-                        and last_fish_position is not None
+                        and last_offset is not None
                     ):
-                        fish_direction, offset_ratio = last_fish_position
+                        offset = last_offset
                         self.logger.debug(
-                            f"未檢測到魚 ({no_detection_count}/{max_no_detection})，保持原動作: {fish_direction} ({offset_ratio:.3f})"
+                            "未檢測到魚 (%d/%d)，保持原偏移: %.3f",
+                            no_detection_count,
+                            max_no_detection,
+                            offset,
                         )
                     else:
                         if no_detection_count == max_no_detection + 1:
                             self.logger.warning(
-                                f"連續{max_no_detection}次未檢測到魚，重置按鍵"
-                            )
-                        fish_direction = "center"
-                        offset_ratio = 0.0
-
-                # 控制方向鍵
-                if fish_direction == "center":
-                    # 魚在中心區域，釋放所有方向鍵
-                    if is_holding_left:
-                        self.input_controller.key_up(left_key)
-                        is_holding_left = False
-                        self.logger.debug(f"魚在中心，釋放 {left_key} 鍵")
-                    if is_holding_right:
-                        self.input_controller.key_up(right_key)
-                        is_holding_right = False
-                        self.logger.debug(f"魚在中心，釋放 {right_key} 鍵")
-                    time.sleep(check_interval)
-                elif offset_ratio >= center_threshold_max:
-                    # 偏移量超過最大閾值，完全壓住按鍵
-                    if fish_direction == "left":
-                        if not is_holding_left:
-                            if is_holding_right:
-                                self.input_controller.key_up(right_key)
-                                is_holding_right = False
-                            self.input_controller.key_down(left_key)
-                            is_holding_left = True
-                            self.logger.debug(
-                                f"魚在左側(完全)，按住 {left_key} 鍵"
+                                "連續%d次未檢測到魚，重置按鍵",
+                                max_no_detection,
                             )
-                    else:  # right
-                        if not is_holding_right:
-                            if is_holding_left:
-                                self.input_controller.key_up(left_key)
-                                is_holding_left = False
-                            self.input_controller.key_down(right_key)
-                            is_holding_right = True
-                            self.logger.debug(
-                                f"魚在右側(完全)，按住 {right_key} 鍵"
-                            )
-                    time.sleep(check_interval)
-                else:
-                    pre_fish_direction, pre_offset_ratio = pre_fish_position
-
-                    if fish_direction == "left":
-                        if is_holding_right:
-                            self.input_controller.key_up(right_key)
-                            is_holding_right = False
-
-                        if pre_fish_direction == fish_direction:
-                            ratio_diff = offset_ratio - pre_offset_ratio
-                            if ratio_diff > 0:
-                                if not is_holding_left:
-                                    self.input_controller.key_down(left_key)
-                                    is_holding_left = True
-                            elif ratio_diff < 0:
-                                if is_holding_left:
-                                    self.input_controller.key_up(left_key)
-                                    is_holding_left = False
-                            else:  # ratio_diff == 0
-                                if is_holding_left:
-                                    self.input_controller.key_up(left_key)
-                                    is_holding_left = False
-                                else:
-                                    self.input_controller.key_down(left_key)
-                                    is_holding_left = True
-                            if is_holding_left:
-                                press_duration = (
-                                    abs(ratio_diff)
-                                    * fish_speed_rate
-                                    * hold_rate
-                                )
-                            else:
-                                press_duration = (
-                                    abs(ratio_diff) * fish_speed_rate
-                                )
-                            time.sleep(
-                                min(check_interval * 10, press_duration)
-                            )
-                        else:
-                            if not is_holding_left:
-                                self.input_controller.key_down(left_key)
-                                is_holding_left = True
-                                time.sleep(check_interval * hold_rate)
-
-                    else:  # right
-                        if is_holding_left:
-                            self.input_controller.key_up(left_key)
-                            is_holding_left = False
-                        if pre_fish_direction == fish_direction:
-                            ratio_diff = offset_ratio - pre_offset_ratio
-                            if ratio_diff > 0:
-                                if not is_holding_right:
-                                    self.input_controller.key_down(right_key)
-                                    is_holding_right = True
-                            elif ratio_diff < 0:
-                                if is_holding_right:
-                                    self.input_controller.key_up(right_key)
-                                    is_holding_right = False
-                            else:  # ratio_diff == 0
-                                if is_holding_right:
-                                    self.input_controller.key_up(right_key)
-                                    is_holding_right = False
-                                else:
-                                    self.input_controller.key_down(right_key)
-                                    is_holding_right = True
-                            if is_holding_right:
-                                press_duration = (
-                                    abs(ratio_diff)
-                                    * fish_speed_rate
-                                    * hold_rate
-                                )
-                            else:
-                                press_duration = (
-                                    abs(ratio_diff) * fish_speed_rate
-                                )
-                            time.sleep(
-                                min(check_interval * 10, press_duration)
-                            )
-                        else:
-                            if not is_holding_right:
-                                self.input_controller.key_down(right_key)
-                                is_holding_right = True
-                                time.sleep(check_interval * hold_rate)
-
-                pre_fish_position = (fish_direction, offset_ratio)
+                        offset = 0.0
+
+                output = controller.update(offset, period_start)
+                hold_time = controller.hold_time(output)
+                direction = (output > 0) - (output < 0) if hold_time else 0
+                if trace is not None:
+                    trace.append(period_start, offset, output)
+
+                # 切換方向鍵（釋放反方向與按下新方向在同一次輸入中發送）
+                held_direction = self._get_held_direction(keys)
+                if direction != held_direction:
+                    with (
+                        self.input_controller.reacting(
+                            "offset_steer", frame_time
+                        ),
+                        self.input_controller.batch() as batch,
+                    ):
+                        if held_direction:
+                            batch.key_up(keys[held_direction])
+                        if direction:
+                            batch.key_down(keys[direction])
+                    if direction:
+                        self.logger.debug(
+                            "偏移 %+.3f，輸出 %+.2f，按住 %s 鍵",
+                            offset,
+                            output,
+                            keys[direction],
+                        )
+                    held_direction = direction
+
+                if telemetry is not None:
+                    telemetry.record(
+                        PHASE_CODES["steering"],
+                        offset=detected_offset,
+                        output=output,
+                        held=self._get_held_bits(),
+                        detect_time=detect_time,
+                    )
+                if tracer is not None:
+                    tracer.record("steering_tick", "control", tick_start)
+
+                # 未滿週期的佔空比：按住指定時間後釋放
+                if held_direction and hold_time < period:
+                    self.clock.sleep(hold_time)
+                    self.input_controller.key_up(keys[held_direction])
+
+                # 等待至下一個控制週期
+                remaining = period - (self.clock.monotonic() - period_start)
+                if remaining > 0:
+                    self.clock.sleep(remaining)
 
         finally:
             # 確保釋放所有方向鍵
-            if is_holding_left:
-                self.input_controller.key_up(left_key)
-                self.logger.info(f"釋放 {left_key} 鍵")
-            if is_holding_right:
-                self.input_controller.key_up(right_key)
-                self.logger.info(f"釋放 {right_key} 鍵")
+            held_direction = self._get_held_direction(keys)
+            if held_direction:
+                self.input_controller.key_up(keys[held_direction])
+                self.logger.info("釋放 %s 鍵", keys[held_direction])
+            if trace is not None and len(trace) > 0:
+                self._save_steering_trace(trace)
+
+    def _get_held_direction(self, keys: dict[int, str]) -> int:
+        """
+        取得目前按住的方向
 
-    def _detect_red_tension_color(self) -> int | None:
-        """取得拉力計中紅色區域的比例，失敗時回傳 None"""
-        window_rect = self.window_manager.get_window_rect()
-        if not window_rect:
-            return None
+        Args:
+            keys: 方向對應的按鍵
 
-        x, y, w, h = window_rect
-        tension_config = self.config.get("detection.red_tension", {})
-        region_config = tension_config.get(
-            "region", {"x": 0.25, "y": 0.7, "width": 0.4, "height": 0.2}
+        Returns:
+            -1 為左、1 為右、0 為不按鍵
+        """
+        for direction, key in keys.items():
+            if self.input_controller.is_pressed("key", key):
+                return direction
+        return 0
+
+    def _get_held_bits(self) -> int:
+        """
+        取得目前按住的滑鼠左鍵與方向鍵
+
+        Returns:
+            HELD_* 位元組合
+        """
+        tracking_config = self.config.settings.fishing.fish_tracking
+        is_pressed = self.input_controller.is_pressed
+        held = 0
+        if is_pressed("mouse", "left"):
+            held |= HELD_MOUSE_LEFT
+        if is_pressed("key", tracking_config.left_key):
+            held |= HELD_LEFT_KEY
+        if is_pressed("key", tracking_config.right_key):
+            held |= HELD_RIGHT_KEY
+        return held
+
+    def _create_steering_controller(self) -> SteeringController:
+        """依配置建立方向控制器"""
+        # 以校準測得的按鍵延遲中位數作為預測時間
+        lookahead = self.latency_profile.percentile("key", 50) or 0.0
+        return SteeringController.from_settings(
+            self.config.settings.fishing.fish_tracking, lookahead=lookahead
         )
 
-        region = (
-            int(x + w * region_config["x"]),
-            int(y + h * region_config["y"]),
-            int(w * region_config["width"]),
-            int(h * region_config["height"]),
+    def _save_steering_trace(self, trace: SteeringTrace):
+        """保存方向控制記錄"""
+        record_dir = self.config.settings.fishing.fish_tracking.record_dir
+        path = (
+            Path(record_dir) / f"steering_{time.strftime('%Y%m%d_%H%M%S')}.npz"
         )
+        try:
+            trace.save(path)
+            self.logger.info("方向控制記錄已保存: %s", path)
+        except Exception as e:
+            self.logger.error("保存方向控制記錄失敗: %s", e)
+
+    def _detect_red_tension_color(self) -> int | None:
+        """取得拉力計中紅色區域的比例，失敗時回傳 None"""
+        region = self.regions.region("detection.red_tension.region")
+        if region is None:
+            return None
 
-        screen = self.image_detector.capture_screen(region)
+        screen = self.image_detector.capture_screen(region.rect)
         if screen is None:
             return None
 
@@ -431,37 +441,16 @@ class TensionPhase:
 
     def _detect_red_tension_template(self) -> bool:
         """使用模板匹配檢測紅色張力狀態"""
-        window_rect = self.window_manager.get_window_rect()
-        if not window_rect:
+        region = self.regions.region("detection.red_tension_template.region")
+        if region is None:
             return False
 
-        x, y, w, h = window_rect
-        red_tension_config = self.config.get(
-            "detection.red_tension_template", {}
-        )
-        region_config = red_tension_config.get(
-            "region", {"x": 0.33, "y": 0.8, "width": 0.34, "height": 0.06}
-        )
-
-        region = (
-            int(x + w * region_config["x"]),
-            int(y + h * region_config["y"]),
-            int(w * region_config["width"]),
-            int(h * region_config["height"]),
-        )
-
-        red_template_path = get_resource_path(
-            self.config.get(
-                "fishing.tension_phase.red_template",
-                "templates/red_tension.png",
-            )
-        )
-        red_template_threshold = self.config.get(
-            "fishing.tension_phase.red_template_threshold", 0.8
-        )
+        tension_config = self.config.settings.fishing.tension_phase
+        red_template_path = get_resource_path(tension_config.red_template)
+        red_template_threshold = tension_config.red_template_threshold
 
         try:
-            screen = self.image_detector.capture_screen(region)
+            screen = self.image_detector.capture_screen(region.rect)
             if screen is None:
                 return False
 
@@ -470,61 +459,36 @@ class TensionPhase:
             )
             return position is not None
         except Exception as e:
-            self.logger.debug(f"紅色張力模板檢測失敗: {e}")
+            self.logger.debug("紅色張力模板檢測失敗: %s", e)
             return False
 
-    def _get_fish_position(self):
+    def _get_fish_offset(self) -> float | None:
         """
-        取得魚的位置狀態
+        取得魚相對中心點的偏移
 
         Returns:
-            tuple: (direction, offset_ratio) 其中 direction 是 'left', 'right', 'center' 或 None
-                   offset_ratio 是偏移量佔視窗寬度的比例（絕對值）
+            帶符號的偏移比例（偏移量佔視窗寬度的比例，負值表示魚在左側，
+            正值表示魚在右側），未檢測到魚返回 None
         """
-        window_rect = self.window_manager.get_window_rect()
-        if not window_rect:
-            return None, 0.0
-
-        x, y, w, h = window_rect
-        splash_config = self.config.get("detection.fish_splash", {})
-        region_config = splash_config.get(
-            "region", {"x": 0.2, "y": 0.3, "width": 0.6, "height": 0.3}
-        )
-
-        region = (
-            int(x + w * region_config["x"]),
-            int(y + h * region_config["y"]),
-            int(w * region_config["width"]),
-            int(h * region_config["height"]),
-        )
+        window = self.regions.window()
+        region = self.regions.region("detection.fish_splash.region")
+        if window is None or region is None:
+            return None
 
-        white_threshold = splash_config.get("white_threshold", 200)
-        min_area = splash_config.get("min_area", 50)
+        splash_config = self.config.settings.detection.fish_splash
         splash_pos = self.image_detector.find_white_splash(
-            region, white_threshold, min_area
+            region.rect, splash_config.white_threshold, splash_config.min_area
         )
 
         if not splash_pos:
-            return None, 0.0
+            return None
 
         splash_x, splash_y = splash_pos
 
         # 讀取中心點偏移配置
-        center_offset = self.config.get(
-            "fishing.fish_tracking.center_offset", 0
-        )
-        window_center_x = x + w / 2 + center_offset
-
-        center_threshold_min = self.config.get(
-            "fishing.fish_tracking.center_threshold_min", 0.05
+        center_offset = (
+            self.config.settings.fishing.fish_tracking.center_offset
         )
+        window_center_x = window.x + window.width / 2 + center_offset
 
-        offset = splash_x - window_center_x
-        offset_ratio = abs(offset) / w  # 偏移量佔視窗寬度的比例
-
-        if offset_ratio < center_threshold_min:
-            return "center", offset_ratio
-        elif offset < 0:
-            return "left", offset_ratio
-        else:
-            return "right", offset_ratio
+        return (splash_x - window_center_x) / window.width
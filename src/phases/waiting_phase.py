@@ -3,12 +3,37 @@
 """
 
 import logging
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import NamedTuple
 
+import numpy as np
+
+from src.clock import SYSTEM_CLOCK, Clock
 from src.config_manager import ConfigManager
 from src.image_detector import ImageDetector
+from src.latency_calibration import LatencyProfile
+from src.region_registry import RegionRegistry
+from src.telemetry import PHASE_CODES, TelemetryRing
+from src.tracing import traced
 from src.utils import get_resource_path
-from src.window_manager import WindowManager
+from src.window_manager import WindowManagerLike
+
+
+class ColorRange(NamedTuple):
+    """顏色範圍檢測參數（依序對應 detect_color_in_range 的參數）"""
+
+    color_min: tuple[int, int, int]
+    color_max: tuple[int, int, int]
+    min_pixel_ratio: float
+
+
+# 咬鉤指示器的橙色範圍 (BGR)，至少 3% 的像素符合顏色範圍
+BITE_COLOR_RANGE = ColorRange((1, 70, 246), (29, 195, 254), 0.03)
+
+# 咬鉤檢測器名稱，順序即 shared 模式下的檢測順序
+BITE_DETECTOR_NAMES = {"color": "顏色檢測", "template": "模板匹配"}
 
 
 class WaitingPhase:
@@ -17,8 +42,12 @@ class WaitingPhase:
     def __init__(
         self,
         config: ConfigManager,
-        window_manager: WindowManager,
+        window_manager: WindowManagerLike,
         image_detector: ImageDetector,
+        latency_profile: LatencyProfile | None = None,
+        regions: RegionRegistry | None = None,
+        telemetry: TelemetryRing | None = None,
+        clock: Clock | None = None,
     ):
         """
         初始化等待咬鉤階段處理器
@@ -27,12 +56,31 @@ class WaitingPhase:
             config: 配置管理器
             window_manager: 視窗管理器
             image_detector: 圖像檢測器
+            latency_profile: 校準測得的輸入延遲分佈（可選）
+            regions: 檢測區域註冊表（可選，預設依視窗管理器建立）
+            telemetry: 控制週期遙測緩衝區（可選）
+            clock: 時鐘（可選，預設使用實際時間）
         """
         self.config = config
         self.window_manager = window_manager
         self.image_detector = image_detector
+        self.latency_profile = latency_profile or LatencyProfile()
+        self.regions = regions or RegionRegistry(config, window_manager)
+        self.clock = clock or SYSTEM_CLOCK
+        self.telemetry = telemetry
         self.logger = logging.getLogger("FishingBot.WaitingPhase")
 
+        # 並行檢測用的線程池（首次使用時建立）
+        self._executor: ThreadPoolExecutor | None = None
+
+        # 各檢測器命中統計
+        self._stats_lock = threading.Lock()
+        self.bite_detector_wins = dict.fromkeys(BITE_DETECTOR_NAMES, 0)
+        self.bite_detector_hits = dict.fromkeys(BITE_DETECTOR_NAMES, 0)
+        # 檢測到咬鉤的畫面截取時間（收竿反應延遲的起點）
+        self.bite_frame_time: float | None = None
+
+    @traced("bite_wait", "phase")
     def wait_for_bite(self) -> bool:
         """
         等待咬鉤
@@ -41,16 +89,24 @@ class WaitingPhase:
             是否檢測到咬鉤
         """
         self.logger.debug("等待魚兒咬鉤...")
-        timeout = self.config.get("fishing.bite_timeout", 30)
-        check_interval = self.config.get("detection.check_interval", 0.1)
-        start_time = time.time()
+        timeout = self.config.settings.fishing.bite_timeout
+        check_interval = self.config.settings.detection.check_interval
+        start_time = self.clock.monotonic()
 
-        while time.time() - start_time < timeout:
-            if self._detect_bite_indicator():
+        while self.clock.monotonic() - start_time < timeout:
+            detect_start = time.perf_counter()
+            detected = self._detect_bite_indicator()
+            if self.telemetry is not None:
+                self.telemetry.record(
+                    PHASE_CODES["waiting"],
+                    detect_time=time.perf_counter() - detect_start,
+                )
+            if detected:
+                self.bite_frame_time = self.image_detector.last_capture_time()
                 return True
-            time.sleep(check_interval)
+            self.clock.sleep(check_interval)
 
-        self.logger.warning(f"等待咬鉤超時 ({timeout}秒)")
+        self.logger.warning("等待咬鉤超時 (%s秒)", timeout)
         return False
 
     def _detect_bite_indicator(self) -> bool:
@@ -60,47 +116,157 @@ class WaitingPhase:
         Returns:
             是否檢測到咬鉤
         """
-        window_rect = self.window_manager.get_window_rect()
-        if not window_rect:
+        region = self.regions.region("detection.region")
+        if region is None:
             return False
 
-        x, y, w, h = window_rect
-        region_config = self.config.get("detection.region")
+        mode = self.config.settings.detection.bite_detection_mode
+        if mode == "sequential":
+            detector = self._detect_bite_sequential(region.rect)
+        else:
+            # 共用同一張截圖，避免顏色與模板檢測各自截圖
+            screen = self.image_detector.capture_screen(region.rect)
+            if screen is None:
+                return False
 
-        region = (
-            int(x + w * region_config["x"]),
-            int(y + h * region_config["y"]),
-            int(w * region_config["width"]),
-            int(h * region_config["height"]),
-        )
+            if mode == "parallel":
+                detector = self._detect_bite_parallel(screen)
+            else:
+                detector = self._detect_bite_shared(screen)
 
-        # 優先使用顏色檢測
-        # 咬鉤指示器的橙色範圍
-        color_detected = self.image_detector.detect_color_in_range(
-            region,
-            color_min=(1, 70, 246),
-            color_max=(29, 195, 254),
-            min_pixel_ratio=0.03,  # 至少 3% 的像素符合顏色範圍
-        )
+        if detector is None:
+            return False
+
+        with self._stats_lock:
+            self.bite_detector_wins[detector] += 1
+        self.logger.info("檢測到咬鉤（%s）！", BITE_DETECTOR_NAMES[detector])
+        return True
 
-        if color_detected:
-            self.logger.info("檢測到咬鉤（顏色檢測）！")
-            return True
+    def _detect_bite_sequential(
+        self, region: tuple[int, int, int, int]
+    ) -> str | None:
+        """
+        依序檢測咬鉤，顏色檢測與模板匹配各自截圖
+
+        Args:
+            region: 檢測區域 (x, y, width, height)
+
+        Returns:
+            命中的檢測器名稱，未檢測到返回 None
+        """
+        # 優先使用顏色檢測
+        if self.image_detector.detect_color_in_range(
+            region, *BITE_COLOR_RANGE
+        ):
+            with self._stats_lock:
+                self.bite_detector_hits["color"] += 1
+            return "color"
 
         # 如果顏色檢測失敗，使用模板匹配作為備用
         screen = self.image_detector.capture_screen(region)
         if screen is None:
-            return False
+            return None
 
+        if self._match_bite_template(screen):
+            with self._stats_lock:
+                self.bite_detector_hits["template"] += 1
+            return "template"
+
+        return None
+
+    def _detect_bite_shared(self, screen: np.ndarray) -> str | None:
+        """
+        在同一張截圖上依序執行顏色檢測與模板匹配
+
+        Args:
+            screen: 咬鉤檢測區域的截圖
+
+        Returns:
+            命中的檢測器名稱，未檢測到返回 None
+        """
+        for detector in BITE_DETECTOR_NAMES:
+            if self._run_bite_detector(detector, screen):
+                return detector
+        return None
+
+    def _detect_bite_parallel(self, screen: np.ndarray) -> str | None:
+        """
+        在同一張截圖上並行執行顏色檢測與模板匹配，先命中者為準
+
+        Args:
+            screen: 咬鉤檢測區域的截圖
+
+        Returns:
+            命中的檢測器名稱，未檢測到返回 None
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=len(BITE_DETECTOR_NAMES),
+                thread_name_prefix="BiteDetector",
+            )
+
+        futures = {
+            self._executor.submit(
+                self._run_bite_detector, detector, screen
+            ): detector
+            for detector in BITE_DETECTOR_NAMES
+        }
+
+        # 依完成順序檢查結果，第一個命中即返回（其餘檢測器在背景完成並計入命中次數）
+        for future in as_completed(futures):
+            if future.result():
+                return futures[future]
+        return None
+
+    def _run_bite_detector(self, detector: str, screen: np.ndarray) -> bool:
+        """
+        執行單一咬鉤檢測器並記錄命中次數
+
+        Args:
+            detector: 檢測器名稱（color 或 template）
+            screen: 咬鉤檢測區域的截圖
+
+        Returns:
+            是否命中
+        """
+        if detector == "color":
+            hit = self.image_detector.detect_color_in_screen(
+                screen, *BITE_COLOR_RANGE
+            )
+        else:
+            hit = self._match_bite_template(screen)
+
+        if hit:
+            with self._stats_lock:
+                self.bite_detector_hits[detector] += 1
+        return hit
+
+    def _match_bite_template(self, screen: np.ndarray) -> bool:
+        """在截圖中匹配咬鉤指示器模板"""
         template_path = get_resource_path("templates/bite_indicator.png")
         position = self.image_detector.find_template(screen, template_path)
+        return position is not None
 
-        if position is not None:
-            self.logger.info("檢測到咬鉤（模板匹配）！")
-            return True
+    def shutdown(self):
+        """停止並行檢測用的線程池（未建立時略過）"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
 
-        return False
+    def get_bite_detector_stats(self) -> dict:
+        """
+        取得各咬鉤檢測器的命中統計
 
+        Returns:
+            統計資料字典，wins 為率先命中（決定結果）的次數，hits 為命中的總次數
+        """
+        with self._stats_lock:
+            return {
+                "wins": dict(self.bite_detector_wins),
+                "hits": dict(self.bite_detector_hits),
+            }
+
+    @traced("reel", "phase")
     def reel_in(self, input_controller):
         """
         收竿操作
@@ -110,36 +276,38 @@ class WaitingPhase:
         """
         self.logger.debug("開始收竿")
 
-        reel_type = self.config.get("fishing.reel_type", "key")
-        if reel_type == "click":
-            self._reel_by_click(input_controller)
-        else:
-            self._reel_by_key(input_controller)
+        fishing = self.config.settings.fishing
+        with input_controller.reacting("bite_reel", self.bite_frame_time):
+            if fishing.reel_type == "click":
+                self._reel_by_click(input_controller)
+            else:
+                self._reel_by_key(input_controller)
 
-        # 等待收竿動畫
-        reel_delay = self.config.get("fishing.reel_delay", 0.1)
-        time.sleep(reel_delay)
+        # 確認收竿輸入已送達，之後才會檢測拉力計
+        input_controller.flush()
+
+        # 等待收竿動畫，至少等待校準測得的收竿輸入（點擊或按鍵）延遲，
+        # 避免在遊戲反應前檢測拉力計
+        reel_delay = fishing.reel_delay
+        action = "mouse" if fishing.reel_type == "click" else "key"
+        reel_latency = self.latency_profile.percentile(action, 95)
+        if reel_latency is not None:
+            reel_delay = max(reel_delay, reel_latency)
+        self.clock.sleep(reel_delay)
 
         self.logger.debug("收竿完成")
 
     def _reel_by_click(self, input_controller):
         """滑鼠點擊收竿"""
-        window_rect = self.window_manager.get_window_rect()
-        if not window_rect:
+        click_pos = self.regions.point("fishing.reel_click_pos")
+        if click_pos is None:
             self.logger.error("無法取得視窗位置，收竿失敗")
             return
 
-        x, y, w, h = window_rect
-        click_pos = self.config.get(
-            "fishing.reel_click_pos", {"x": 0.5, "y": 0.5}
-        )
-        click_x = int(x + w * click_pos["x"])
-        click_y = int(y + h * click_pos["y"])
+        click_x, click_y = click_pos
 
         # 讀取滑鼠移動時間配置
-        move_duration = self.config.get(
-            "anti_detection.mouse_move_duration", 0.0
-        )
+        move_duration = self.config.settings.anti_detection.mouse_move_duration
 
         input_controller.click(
             click_x, click_y, button="left", move_duration=move_duration
@@ -147,5 +315,4 @@ class WaitingPhase:
 
     def _reel_by_key(self, input_controller):
         """鍵盤按鍵收竿"""
-        reel_key = self.config.get("fishing.reel_key", "e")
-        input_controller.press_key(reel_key)
+        input_controller.press_key(self.config.settings.fishing.reel_key)
@@ -0,0 +1,130 @@
+"""
+反應延遲追蹤模組
+"""
+
+import contextlib
+import logging
+import threading
+from collections.abc import Generator
+from concurrent.futures import Future
+
+from src.metrics import Metrics
+
+# 追蹤的決策類型
+DECISIONS = ("bite_reel", "tension_release", "offset_steer")
+
+
+class ReactionTracker:
+    """
+    畫面到輸入的反應延遲追蹤器
+
+    控制線程做出決策時以 decision() 標記觸發決策的畫面截取時間，
+    區塊內第一個實際發送的輸入即為該決策的反應，從截圖開始到輸入後端
+    實際發送第一個事件（SendInput）的時間記錄到 reaction.<決策> 直方圖，
+    包含防偵測隨機延遲與點擊前的滑鼠移動，不含按鍵按住時間；
+    超過預算時計入 reaction_over_budget.<決策>。
+    """
+
+    def __init__(self, metrics: Metrics, budgets: dict[str, float]):
+        """
+        初始化反應延遲追蹤器
+
+        Args:
+            metrics: 指標註冊表
+            budgets: 各決策的延遲預算（秒）
+        """
+        self.metrics = metrics
+        self.budgets = budgets
+        self.logger = logging.getLogger("FishingBot.ReactionTracker")
+        self._local = threading.local()
+
+    @contextlib.contextmanager
+    def decision(self, name: str, frame_time: float | None) -> Generator[None]:
+        """
+        標記區塊內的輸入為對某張畫面的反應
+
+        Args:
+            name: 決策類型（DECISIONS）
+            frame_time: 觸發決策的畫面開始截取的時間（perf_counter），
+                None 時不追蹤
+        """
+        if frame_time is None:
+            yield
+            return
+
+        self._local.pending = (name, frame_time)
+        try:
+            yield
+        finally:
+            self._local.pending = None
+
+    def emitting(self) -> tuple[str, float] | None:
+        """
+        取出目前線程等待中的決策（每個決策只記錄第一個輸入）
+
+        Returns:
+            (決策類型, 畫面時間)，沒有等待中的決策時返回 None
+        """
+        pending = getattr(self._local, "pending", None)
+        if pending is not None:
+            self._local.pending = None
+        return pending
+
+    def emitted(
+        self, pending: tuple[str, float], result: object, emit_time: float
+    ):
+        """
+        記錄輸入已發送
+
+        Args:
+            pending: emitting() 取出的決策
+            result: 輸入後端的返回值（非同步輸入為 Future）
+            emit_time: 同步發送時後端實際發送的時間（perf_counter）
+        """
+        if isinstance(result, Future):
+            result.add_done_callback(
+                lambda future: self.record(
+                    *pending, _future_emit_time(future, emit_time)
+                )
+            )
+        else:
+            self.record(*pending, emit_time)
+
+    def record(self, name: str, frame_time: float, emit_time: float):
+        """
+        記錄一次反應延遲
+
+        Args:
+            name: 決策類型
+            frame_time: 畫面開始截取的時間
+            emit_time: 輸入開始發送的時間
+        """
+        latency = emit_time - frame_time
+        self.metrics.observe(f"reaction.{name}", latency)
+
+        budget = self.budgets.get(name)
+        if budget is not None and latency > budget:
+            self.metrics.increment(f"reaction_over_budget.{name}")
+            self.logger.debug(
+                "反應延遲超過預算: %s %.1f ms（預算 %.1f ms）",
+                name,
+                latency * 1000,
+                budget * 1000,
+            )
+
+
+def _future_emit_time(future: Future, default: float) -> float:
+    """
+    取得非同步輸入實際發送的時間
+
+    沒有發送任何事件時以執行線程開始執行的時間為準。
+
+    Args:
+        future: 輸入操作的 Future（InputFuture）
+        default: 兩者皆未記錄時使用的時間
+    """
+    for name in ("emit_time", "start_time"):
+        value = getattr(future, name, None)
+        if value is not None:
+            return value
+    return default
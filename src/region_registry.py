@@ -0,0 +1,300 @@
+"""
+檢測區域註冊模組
+"""
+
+import dataclasses
+import logging
+import threading
+from typing import NamedTuple
+
+from src.config_manager import ConfigManager
+from src.settings import PositionConfig, RegionConfig, Settings
+from src.window_manager import WindowManagerLike
+
+# 收集區域與點擊位置的配置區段
+CLICK_POSITION_SECTIONS = ("fishing", "detection")
+
+
+class Region(NamedTuple):
+    """
+    解析後的檢測區域
+
+    x、y 為螢幕座標；rows、cols 為相對於視窗左上角的切片，
+    可直接從整個視窗的截圖取出區域畫面（frame[region.rows, region.cols]）。
+    """
+
+    x: int
+    y: int
+    width: int
+    height: int
+    rows: slice
+    cols: slice
+
+    @property
+    def rect(self) -> tuple[int, int, int, int]:
+        """螢幕座標 (x, y, width, height)"""
+        return (self.x, self.y, self.width, self.height)
+
+
+# 解析結果：(整個視窗區域, 區域字典, 點擊位置字典)
+ResolvedRegions = tuple[Region, dict[str, Region], dict[str, tuple[int, int]]]
+
+
+class RegionRegistry:
+    """
+    檢測區域與點擊位置註冊表
+
+    將配置中所有 detection.*.region 與 *_pos 點擊位置在視窗位置或配置改變時
+    一次換算為像素座標，之後每次查詢只需比對視窗的幾何版本號。
+    """
+
+    def __init__(
+        self, config: ConfigManager, window_manager: WindowManagerLike
+    ):
+        """
+        初始化區域註冊表
+
+        Args:
+            config: 配置管理器
+            window_manager: 視窗管理器
+        """
+        self.config = config
+        self.window_manager = window_manager
+        self.logger = logging.getLogger("FishingBot.RegionRegistry")
+
+        self._lock = threading.Lock()
+        self._version: int | None = None
+        self._settings: Settings | None = None
+        self._window: Region | None = None
+        self._regions: dict[str, Region] = {}
+        self._points: dict[str, tuple[int, int]] = {}
+        self._prepared: tuple[int, Settings, ResolvedRegions] | None = None
+
+    @staticmethod
+    def _collect(
+        settings: Settings,
+    ) -> tuple[dict[str, RegionConfig], dict[str, PositionConfig]]:
+        """
+        從配置收集所有區域與點擊位置
+
+        Args:
+            settings: 配置
+
+        Returns:
+            (區域配置, 點擊位置配置)，鍵為點號分隔的配置鍵
+        """
+        regions: dict[str, RegionConfig] = {}
+        points: dict[str, PositionConfig] = {}
+
+        def walk(prefix: str, value: object):
+            if not dataclasses.is_dataclass(value):
+                return
+            for item in dataclasses.fields(value):
+                child = getattr(value, item.name)
+                path = f"{prefix}.{item.name}"
+                if isinstance(child, RegionConfig):
+                    regions[path] = child
+                elif isinstance(child, PositionConfig):
+                    points[path] = child
+                else:
+                    walk(path, child)
+
+        for section in CLICK_POSITION_SECTIONS:
+            walk(section, getattr(settings, section))
+        return regions, points
+
+    @classmethod
+    def _resolve(
+        cls, window_rect: tuple[int, int, int, int], settings: Settings
+    ) -> ResolvedRegions:
+        """
+        將配置中所有比例區域與點擊位置換算為像素座標
+
+        Args:
+            window_rect: 視窗位置 (x, y, width, height)
+            settings: 配置
+
+        Returns:
+            (整個視窗區域, 區域字典, 點擊位置字典)
+        """
+        x, y, w, h = window_rect
+        region_configs, point_configs = cls._collect(settings)
+
+        regions = {}
+        for key, value in region_configs.items():
+            left = int(w * value.x)
+            top = int(h * value.y)
+            width = int(w * value.width)
+            height = int(h * value.height)
+            regions[key] = Region(
+                x + left,
+                y + top,
+                width,
+                height,
+                slice(top, top + height),
+                slice(left, left + width),
+            )
+        points = {
+            key: (int(x + w * value.x), int(y + h * value.y))
+            for key, value in point_configs.items()
+        }
+        window = Region(x, y, w, h, slice(0, h), slice(0, w))
+        return window, regions, points
+
+    def prepare(self, settings: Settings):
+        """
+        預先以新配置解析區域（供配置重載線程呼叫）
+
+        換算在呼叫端線程完成，新配置套用後的第一次查詢只需替換結果，
+        控制線程不必重新換算。視窗幾何在此之後改變時會照常重新解析。
+
+        Args:
+            settings: 尚未套用的新配置
+        """
+        window_rect = self.window_manager.get_window_rect()
+        if not window_rect:
+            return
+
+        version = self.window_manager.geometry_version
+        resolved = self._resolve(window_rect, settings)
+        with self._lock:
+            self._prepared = (version, settings, resolved)
+
+    def _refresh(self) -> bool:
+        """
+        視窗幾何版本或配置改變時重新解析所有區域
+
+        Returns:
+            是否取得視窗位置
+        """
+        window_rect = self.window_manager.get_window_rect()
+        if not window_rect:
+            return False
+
+        version = self.window_manager.geometry_version
+        settings = self.config.settings
+        if version == self._version and settings is self._settings:
+            return True
+
+        prepared = self._prepared
+        if (
+            prepared is not None
+            and prepared[0] == version
+            and prepared[1] is settings
+        ):
+            resolved = prepared[2]
+        else:
+            resolved = self._resolve(window_rect, settings)
+        self._prepared = None
+
+        self._window, self._regions, self._points = resolved
+        self._version = version
+        self._settings = settings
+        self.logger.debug(
+            "已解析 %s 個區域與 %s 個點擊位置",
+            len(self._regions),
+            len(self._points),
+        )
+        return True
+
+    def invalidate(self):
+        """清除解析結果，下次查詢時依目前配置重新解析"""
+        with self._lock:
+            self._version = None
+
+    def window(self) -> Region | None:
+        """
+        取得整個視窗的區域
+
+        Returns:
+            區域，無法取得視窗位置時返回 None
+        """
+        with self._lock:
+            if not self._refresh():
+                return None
+            return self._window
+
+    def region(self, key: str) -> Region | None:
+        """
+        取得檢測區域
+
+        Args:
+            key: 區域的配置鍵，如 "detection.fish_splash.region"
+
+        Returns:
+            區域，無法取得視窗位置時返回 None
+        """
+        with self._lock:
+            if not self._refresh():
+                return None
+            return self._regions[key]
+
+    def point(self, key: str) -> tuple[int, int] | None:
+        """
+        取得點擊位置
+
+        Args:
+            key: 點擊位置的配置鍵，如 "fishing.cast_click_pos"
+
+        Returns:
+            螢幕座標，無法取得視窗位置時返回 None
+        """
+        with self._lock:
+            if not self._refresh():
+                return None
+            return self._points[key]
+
+    def regions(self) -> dict[str, Region]:
+        """
+        取得所有已解析的區域
+
+        Returns:
+            配置鍵到區域的字典，無法取得視窗位置時為空
+        """
+        with self._lock:
+            if not self._refresh():
+                return {}
+            return dict(self._regions)
+
+    def points(self) -> dict[str, tuple[int, int]]:
+        """
+        取得所有已解析的點擊位置
+
+        Returns:
+            配置鍵到螢幕座標的字典，無法取得視窗位置時為空
+        """
+        with self._lock:
+            if not self._refresh():
+                return {}
+            return dict(self._points)
+
+
+def union_regions(regions: list[Region]) -> Region:
+    """
+    計算包含所有區域的最小區域
+
+    Args:
+        regions: 區域列表（需屬於同一視窗）
+
+    Returns:
+        合併後的區域
+    """
+    if not regions:
+        raise ValueError("區域列表不可為空")
+
+    left = min(region.x for region in regions)
+    top = min(region.y for region in regions)
+    right = max(region.x + region.width for region in regions)
+    bottom = max(region.y + region.height for region in regions)
+
+    # 以任一區域的切片換算視窗左上角的螢幕座標
+    origin_x = regions[0].x - regions[0].cols.start
+    origin_y = regions[0].y - regions[0].rows.start
+    return Region(
+        left,
+        top,
+        right - left,
+        bottom - top,
+        slice(top - origin_y, bottom - origin_y),
+        slice(left - origin_x, right - origin_x),
+    )
@@ -0,0 +1,190 @@
+"""
+取樣分析器模組
+"""
+
+import logging
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from types import CodeType, FrameType
+
+# 每個堆疊最多保存的框架數（超過時保留最內層的框架）
+MAX_STACK_DEPTH = 128
+
+
+class SamplingProfiler:
+    """
+    堆疊取樣分析器
+
+    在獨立線程中以固定頻率經由 sys._current_frames() 讀取所有線程的堆疊，
+    依「線程名稱 + 呼叫鏈」累計取樣數，停止時輸出 collapsed stack 格式
+    （每行為以分號分隔的框架與取樣數），可直接交給 flamegraph.pl、
+    speedscope 或 Perfetto 產生火焰圖。不需要修改被分析的程式碼，
+    也可以在打包後的執行檔中使用。
+    """
+
+    def __init__(self, rate: float = 100.0, output_dir: str = "profiles"):
+        """
+        初始化取樣分析器
+
+        Args:
+            rate: 每秒取樣次數
+            output_dir: 輸出目錄
+        """
+        if rate <= 0:
+            raise ValueError("rate 必須大於 0")
+
+        self.interval = 1.0 / rate
+        self.output_dir = output_dir
+        self.logger = logging.getLogger("FishingBot.SamplingProfiler")
+
+        # 以 (線程名稱, 程式碼物件元組) 為鍵累計，取樣時不格式化文字
+        self._stacks: Counter[tuple[str, tuple[CodeType, ...]]] = Counter()
+        self._labels: dict[CodeType, str] = {}
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self.sample_count = 0
+        self.cpu_time = 0.0
+        self.start_time = 0.0
+
+    @property
+    def running(self) -> bool:
+        """是否正在取樣"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """開始取樣（清除之前的結果）"""
+        with self._lock:
+            if self.running:
+                return
+
+            self._stacks.clear()
+            self.sample_count = 0
+            self.cpu_time = 0.0
+            self.start_time = time.perf_counter()
+            self._stop_event.clear()
+            self._thread = threading.Thread(
+                target=self._worker, name="SamplingProfilerThread", daemon=True
+            )
+            self._thread.start()
+        self.logger.info("開始取樣分析（%.0f 次/秒）", 1 / self.interval)
+
+    def stop(self, reason: str = "stop") -> Path | None:
+        """
+        停止取樣並輸出結果
+
+        Args:
+            reason: 觸發原因（加入檔名）
+
+        Returns:
+            輸出的檔案路徑，未在取樣或沒有結果時返回 None
+        """
+        with self._lock:
+            if self._thread is None:
+                return None
+            self._stop_event.set()
+            self._thread.join()
+            self._thread = None
+
+        elapsed = time.perf_counter() - self.start_time
+        self.logger.info(
+            "停止取樣分析：%.1f 秒內取樣 %d 次，分析器 CPU 時間 %.0f ms（%.2f%%）",
+            elapsed,
+            self.sample_count,
+            self.cpu_time * 1000,
+            self.cpu_time / max(elapsed, 1e-9) * 100,
+        )
+        return self.write(reason)
+
+    def toggle(self):
+        """切換取樣狀態（熱鍵用，停止時輸出結果）"""
+        if self.running:
+            self.stop("hotkey")
+        else:
+            self.start()
+
+    def _worker(self):
+        """取樣線程：定期讀取所有線程的堆疊"""
+        own_id = threading.get_ident()
+        cpu_start = time.thread_time()
+        while not self._stop_event.wait(self.interval):
+            names = {
+                thread.ident: thread.name for thread in threading.enumerate()
+            }
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                name = names.get(thread_id, str(thread_id))
+                self._stacks[(name, self._stack(frame))] += 1
+            self.sample_count += 1
+            self.cpu_time = time.thread_time() - cpu_start
+
+    @staticmethod
+    def _stack(frame: FrameType | None) -> tuple[CodeType, ...]:
+        """取得由外到內的呼叫鏈（程式碼物件）"""
+        codes = []
+        while frame is not None and len(codes) < MAX_STACK_DEPTH:
+            codes.append(frame.f_code)
+            frame = frame.f_back
+        codes.reverse()
+        return tuple(codes)
+
+    def _label(self, code: CodeType) -> str:
+        """框架標籤：模組名稱:函數限定名稱（裝飾器的包裝函數為空字串）"""
+        label = self._labels.get(code)
+        if label is None:
+            if code.co_qualname.endswith("<locals>.wrapper"):
+                label = ""
+            else:
+                module = Path(code.co_filename).stem
+                label = f"{module}:{code.co_qualname}".replace(";", ":")
+            self._labels[code] = label
+        return label
+
+    def collapsed(self) -> list[str]:
+        """
+        以 collapsed stack 格式輸出結果
+
+        Returns:
+            每行為「線程;框架;...;框架 取樣數」，依取樣數由多到少排列
+        """
+        # 略去包裝函數後可能有相同的呼叫鏈，先合併再排序
+        stacks: Counter[str] = Counter()
+        for (name, codes), count in self._stacks.items():
+            frames = [name.replace(";", ":")]
+            frames.extend(
+                label for code in codes if (label := self._label(code))
+            )
+            stacks[";".join(frames)] += count
+        return [f"{stack} {count}" for stack, count in stacks.most_common()]
+
+    def write(self, reason: str) -> Path | None:
+        """
+        將結果寫入 .folded 檔案
+
+        Args:
+            reason: 觸發原因（加入檔名）
+
+        Returns:
+            輸出的檔案路徑，沒有結果或寫入失敗時返回 None
+        """
+        lines = self.collapsed()
+        if not lines:
+            return None
+
+        try:
+            path = Path(self.output_dir)
+            path.mkdir(parents=True, exist_ok=True)
+            file = path / (
+                time.strftime("%Y%m%d_%H%M%S") + f"_{reason}.folded"
+            )
+            file.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        except Exception as e:
+            self.logger.error("保存取樣結果失敗: %s", e)
+            return None
+
+        self.logger.info("取樣結果已保存: %s", file)
+        return file
@@ -0,0 +1,589 @@
+"""
+釣魚流程錄製與回放模組
+"""
+
+import bisect
+import collections
+import json
+import logging
+import queue
+import threading
+import zipfile
+from collections.abc import Callable
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+from src.clock import SYSTEM_CLOCK, Clock
+from src.input_backend import InputBackend, InputBatch, RecordingInputBackend
+from src.window_manager import WindowManagerLike
+
+# 錄製檔內的事件與配置檔名
+EVENTS_FILE = "events.jsonl"
+CONFIG_FILE = "config.yaml"
+
+
+class SessionRecorder:
+    """
+    流程錄製器
+
+    將整個視窗的畫面、所有發送的輸入與階段切換加上時間戳寫入單一 zip：
+    frames/000000.png ... 為畫面，events.jsonl 為依時間排序的事件，
+    config.yaml 為錄製時使用的配置。PNG 編碼與寫檔在背景線程中進行。
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        clock: Clock | None = None,
+        config_text: str | None = None,
+    ):
+        """
+        初始化錄製器並開始錄製
+
+        Args:
+            path: 錄製檔路徑（.zip）
+            clock: 時鐘（時間戳相對於開始錄製的時間）
+            config_text: 錄製時使用的配置檔內容
+        """
+        self.path = Path(path)
+        self.clock = clock or SYSTEM_CLOCK
+        self.logger = logging.getLogger("FishingBot.SessionRecorder")
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._zip = zipfile.ZipFile(self.path, "w", zipfile.ZIP_STORED)
+        if config_text is not None:
+            self._zip.writestr(CONFIG_FILE, config_text)
+
+        self._lock = threading.Lock()
+        self._events: list[dict] = []
+        self.frame_count = 0
+        self.start_time = self.clock.monotonic()
+
+        self._queue: queue.Queue = queue.Queue()
+        self._thread = threading.Thread(
+            target=self._writer, name="SessionWriterThread", daemon=True
+        )
+        self._thread.start()
+
+    def elapsed(self) -> float:
+        """自開始錄製經過的時間（秒）"""
+        return self.clock.monotonic() - self.start_time
+
+    def _writer(self):
+        """寫檔線程：編碼並寫入畫面"""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            index, frame = item
+            try:
+                ok, data = cv2.imencode(
+                    ".png", frame, [cv2.IMWRITE_PNG_COMPRESSION, 1]
+                )
+                if ok:
+                    self._zip.writestr(f"frames/{index:06d}.png", data)
+            except Exception as e:
+                self.logger.error("寫入錄製畫面失敗: %s", e)
+
+    def record_event(self, event_type: str, **data):
+        """
+        記錄事件
+
+        Args:
+            event_type: 事件類型（frame、input、phase 等）
+            **data: 事件內容（需可序列化為 JSON）
+        """
+        event = {"t": self.elapsed(), "type": event_type, **data}
+        with self._lock:
+            self._events.append(event)
+
+    def record_frame(
+        self, frame: np.ndarray, window_rect: tuple[int, int, int, int]
+    ) -> int:
+        """
+        記錄整個視窗的畫面
+
+        Args:
+            frame: 畫面（BGR格式）
+            window_rect: 畫面對應的視窗位置 (x, y, width, height)
+
+        Returns:
+            畫面編號
+        """
+        with self._lock:
+            index = self.frame_count
+            self.frame_count += 1
+        self._queue.put((index, frame))
+        self.record_event("frame", index=index, window=list(window_rect))
+        return index
+
+    def record_input(
+        self, kind: str, name: str, action: str, x: int = 0, y: int = 0
+    ):
+        """記錄輸入事件（欄位同 InputEvent）"""
+        self.record_event(
+            "input", kind=kind, name=name, action=action, x=x, y=y
+        )
+
+    def record_call(self, method: str, duration: float):
+        """
+        記錄一次會阻塞的輸入呼叫實際花費的時間
+
+        包含輸入後端的防偵測隨機延遲、滑鼠移動與按鍵持續時間，
+        回放時依此重現錄製時的時序。
+
+        Args:
+            method: 輸入後端的方法名稱（move_to、click、press_key）
+            duration: 花費的秒數
+        """
+        self.record_event("call", method=method, duration=duration)
+
+    def record_phase(self, phase: str):
+        """記錄階段切換"""
+        self.record_event("phase", phase=phase)
+
+    def close(self):
+        """結束錄製，寫完所有畫面並寫入事件"""
+        self._queue.put(None)
+        self._thread.join()
+        with self._lock:
+            lines = [
+                json.dumps(event, ensure_ascii=False) for event in self._events
+            ]
+        self._zip.writestr(EVENTS_FILE, "\n".join(lines) + "\n")
+        self._zip.close()
+        self.logger.info(
+            "流程錄製已保存（%s 張畫面）: %s", self.frame_count, self.path
+        )
+
+
+class SessionCaptureRecorder:
+    """
+    錄製截圖的截圖後端包裝
+
+    錄製中時每次截取整個視窗並記錄，再裁切出要求的區域；
+    距離上一張畫面不到 1 / max_fps 秒時直接裁切上一張畫面，
+    因此檢測實際看到的畫面與錄製檔完全一致，回放時可逐像素重現。
+    未錄製時直接使用內部後端截取區域。
+    """
+
+    def __init__(
+        self,
+        backend,
+        window_manager: WindowManagerLike,
+        max_fps: float = 10.0,
+        clock: Clock | None = None,
+    ):
+        """
+        初始化錄製截圖後端
+
+        Args:
+            backend: 實際截圖後端
+            window_manager: 視窗管理器（取得整個視窗的位置）
+            max_fps: 每秒最多截取的整個視窗畫面數
+            clock: 時鐘
+        """
+        self.backend = backend
+        self.window_manager = window_manager
+        self.max_fps = max_fps
+        self.clock = clock or SYSTEM_CLOCK
+        self.recorder: SessionRecorder | None = None
+
+        self._lock = threading.Lock()
+        self._frame: np.ndarray | None = None
+        self._frame_rect: tuple[int, int, int, int] | None = None
+        self._frame_time = 0.0
+
+    def __getattr__(self, name: str):
+        # 其他屬性（例如回放後端的 capture_times）轉交內部後端
+        if name == "backend":
+            raise AttributeError(name)
+        return getattr(self.backend, name)
+
+    def attach(self, recorder: SessionRecorder | None):
+        """
+        開始或停止錄製
+
+        Args:
+            recorder: 錄製器，None 表示停止錄製
+        """
+        with self._lock:
+            self.recorder = recorder
+            self._frame = None
+            self._frame_rect = None
+
+    def capture(
+        self, region: tuple[int, int, int, int] | None = None
+    ) -> np.ndarray:
+        """
+        截取指定區域
+
+        Args:
+            region: 截取區域 (x, y, width, height)
+
+        Returns:
+            截圖（BGR格式）
+        """
+        with self._lock:
+            recorder = self.recorder
+            window_rect = (
+                self.window_manager.get_window_rect() if recorder else None
+            )
+            if recorder is None or not window_rect:
+                return self.backend.capture(region)
+
+            now = self.clock.monotonic()
+            if (
+                self._frame is None
+                or window_rect != self._frame_rect
+                or now - self._frame_time >= 1.0 / self.max_fps
+            ):
+                self._frame = self.backend.capture(window_rect)
+                self._frame_rect = window_rect
+                self._frame_time = now
+                recorder.record_frame(self._frame, window_rect)
+
+            return crop_region(self._frame, window_rect, region)
+
+
+class SessionInputRecorder:
+    """
+    錄製輸入的輸入後端包裝
+
+    將每個實際發送的輸入轉交內部後端並記錄到錄製器（未錄製時只轉交）。
+    輸入事件的時間為呼叫當下；move_to、click、press_key 另外記錄
+    呼叫花費的時間（內部後端的隨機延遲等），供回放時重現。
+    """
+
+    def __init__(self, backend: InputBackend):
+        """
+        初始化錄製輸入後端
+
+        Args:
+            backend: 實際發送輸入的後端
+        """
+        self.backend = backend
+        self.recorder: SessionRecorder | None = None
+
+    def _record(
+        self, kind: str, name: str, action: str, x: int = 0, y: int = 0
+    ):
+        """記錄輸入事件（未錄製時略過）"""
+        recorder = self.recorder
+        if recorder is not None:
+            recorder.record_input(kind, name, action, x, y)
+
+    def _timed(self, method: str, call: Callable[[], object]):
+        """
+        執行會阻塞的輸入呼叫並記錄花費的時間（未錄製時只執行）
+
+        Args:
+            method: 方法名稱
+            call: 呼叫內部後端的函數
+
+        Returns:
+            內部後端的返回值
+        """
+        recorder = self.recorder
+        if recorder is None:
+            return call()
+        start = recorder.elapsed()
+        try:
+            return call()
+        finally:
+            recorder.record_call(method, recorder.elapsed() - start)
+
+    def move_to(self, x: int, y: int, duration: float = 0.5):
+        """移動滑鼠到指定位置"""
+        self._record("move", "", "move", x, y)
+        return self._timed(
+            "move_to", lambda: self.backend.move_to(x, y, duration)
+        )
+
+    def click(
+        self, x: int, y: int, button: str = "left", move_duration: float = 0.0
+    ):
+        """點擊指定位置"""
+        self._record("mouse", button, "down", x, y)
+        self._record("mouse", button, "up", x, y)
+        return self._timed(
+            "click", lambda: self.backend.click(x, y, button, move_duration)
+        )
+
+    def press_key(self, key: str, duration: float = 0.1):
+        """按下按鍵"""
+        self._record("key", key.lower(), "down")
+        self._record("key", key.lower(), "up")
+        return self._timed(
+            "press_key", lambda: self.backend.press_key(key, duration)
+        )
+
+    def key_down(self, key: str):
+        """按下按鍵（不釋放）"""
+        self._record("key", key.lower(), "down")
+        return self.backend.key_down(key)
+
+    def key_up(self, key: str):
+        """釋放按鍵"""
+        self._record("key", key.lower(), "up")
+        return self.backend.key_up(key)
+
+    def mouse_down(self, button: str = "left"):
+        """按下滑鼠按鈕（不釋放）"""
+        self._record("mouse", button, "down")
+        return self.backend.mouse_down(button)
+
+    def mouse_up(self, button: str = "left"):
+        """釋放滑鼠按鈕"""
+        self._record("mouse", button, "up")
+        return self.backend.mouse_up(button)
+
+    def send_batch(self, events: list[tuple[str, str, bool]]):
+        """發送多個事件"""
+        for kind, name, is_up in events:
+            if kind == "key":
+                name = name.lower()
+            self._record(kind, name, "up" if is_up else "down")
+        return self.backend.send_batch(events)
+
+    def batch(self) -> InputBatch:
+        """建立批次輸入"""
+        return InputBatch(self)
+
+    def flush(self, timeout: float | None = None):
+        """等待所有輸入完成"""
+        self.backend.flush(timeout)
+
+    def get_mouse_position(self) -> tuple[int, int]:
+        """取得當前滑鼠位置"""
+        return self.backend.get_mouse_position()
+
+    def last_emit_time(self) -> float | None:
+        """取得目前線程最近一次輸入操作實際發送的時間"""
+        return self.backend.last_emit_time()
+
+
+def crop_region(
+    frame: np.ndarray,
+    window_rect: tuple[int, int, int, int],
+    region: tuple[int, int, int, int] | None,
+) -> np.ndarray:
+    """
+    從整個視窗的畫面裁切出螢幕座標區域
+
+    Args:
+        frame: 整個視窗的畫面
+        window_rect: 畫面對應的視窗位置 (x, y, width, height)
+        region: 螢幕座標區域 (x, y, width, height)，None 表示整個畫面
+
+    Returns:
+        裁切後的畫面
+    """
+    if region is None:
+        return frame
+    x, y, width, height = region
+    left = max(x - window_rect[0], 0)
+    top = max(y - window_rect[1], 0)
+    return frame[top : top + height, left : left + width]
+
+
+class RecordedSession:
+    """已錄製的流程"""
+
+    def __init__(self, path: str | Path):
+        """
+        讀取錄製檔（畫面在使用時才解碼）
+
+        Args:
+            path: 錄製檔路徑
+        """
+        self.path = Path(path)
+        self._zip = zipfile.ZipFile(self.path)
+        names = set(self._zip.namelist())
+
+        text = self._zip.read(EVENTS_FILE).decode("utf-8")
+        self.events: list[dict] = [
+            json.loads(line) for line in text.splitlines() if line
+        ]
+        self.config_text = (
+            self._zip.read(CONFIG_FILE).decode("utf-8")
+            if CONFIG_FILE in names
+            else None
+        )
+
+        frames = [event for event in self.events if event["type"] == "frame"]
+        self.frame_times = [event["t"] for event in frames]
+        self.frame_indices = [event["index"] for event in frames]
+        self.frame_windows = [tuple(event["window"]) for event in frames]
+
+        self._lock = threading.Lock()
+        self._cached_index: int | None = None
+        self._cached_frame: np.ndarray | None = None
+
+    @property
+    def duration(self) -> float:
+        """錄製時長（秒）"""
+        return self.events[-1]["t"] if self.events else 0.0
+
+    def inputs(self) -> list[dict]:
+        """取得所有輸入事件"""
+        return [event for event in self.events if event["type"] == "input"]
+
+    def call_durations(self) -> dict[str, list[float]]:
+        """
+        取得各輸入方法每次呼叫花費的時間
+
+        Returns:
+            方法名稱 -> 依呼叫順序的秒數列表（舊錄製檔沒有此記錄時為空）
+        """
+        durations: dict[str, list[float]] = collections.defaultdict(list)
+        for event in self.events:
+            if event["type"] == "call":
+                durations[event["method"]].append(event["duration"])
+        return dict(durations)
+
+    def phases(self) -> list[dict]:
+        """取得所有階段切換事件"""
+        return [event for event in self.events if event["type"] == "phase"]
+
+    def frame(self, index: int) -> np.ndarray:
+        """
+        取得畫面（快取最近一張）
+
+        Args:
+            index: 畫面在錄製順序中的位置
+
+        Returns:
+            畫面（BGR格式）
+        """
+        with self._lock:
+            frame = self._cached_frame
+            if index != self._cached_index or frame is None:
+                name = f"frames/{self.frame_indices[index]:06d}.png"
+                data = np.frombuffer(self._zip.read(name), dtype=np.uint8)
+                frame = cv2.imdecode(data, cv2.IMREAD_COLOR)
+                if frame is None:
+                    raise ValueError(f"無法解碼錄製畫面: {name}")
+                self._cached_frame = frame
+                self._cached_index = index
+            return frame
+
+    def frame_at(self, t: float) -> int | None:
+        """
+        取得指定時間當時顯示的畫面位置
+
+        Args:
+            t: 相對於錄製開始的時間（秒）
+
+        Returns:
+            畫面位置，該時間之前沒有畫面時返回 None
+        """
+        position = bisect.bisect_right(self.frame_times, t)
+        return position - 1 if position else None
+
+    def close(self):
+        """關閉錄製檔"""
+        self._zip.close()
+
+
+class SessionReplayCaptureBackend:
+    """
+    回放錄製流程的截圖後端
+
+    依時鐘的目前時間取出錄製時當下顯示的畫面並裁切區域，
+    配合虛擬時鐘即可以錄製時的時序加速回放。
+    """
+
+    def __init__(self, session: RecordedSession, clock: Clock):
+        """
+        初始化回放截圖後端
+
+        Args:
+            session: 錄製的流程
+            clock: 時鐘（時間 0 對應錄製開始）
+        """
+        if not session.frame_times:
+            raise ValueError("錄製檔沒有畫面")
+
+        self.session = session
+        self.clock = clock
+
+    def capture(
+        self, region: tuple[int, int, int, int] | None = None
+    ) -> np.ndarray:
+        """
+        截取當前畫面的指定區域
+
+        Args:
+            region: 截取區域 (x, y, width, height)
+
+        Returns:
+            截圖（BGR格式）
+        """
+        index = self.session.frame_at(self.clock.monotonic())
+        if index is None:
+            index = 0
+        frame = self.session.frame(index)
+        return crop_region(frame, self.session.frame_windows[index], region)
+
+
+class SessionReplayInputBackend(RecordingInputBackend):
+    """
+    回放錄製流程的輸入後端
+
+    與 RecordingInputBackend 同樣只記錄輸入事件，並依錄製檔重現每次
+    move_to、click、press_key 實際花費的時間（包含防偵測隨機延遲），
+    事件時間與錄製時同樣取呼叫當下。錄製檔沒有該次呼叫的記錄時
+    （舊錄製檔或回放已分歧）行為同 RecordingInputBackend。
+    """
+
+    def __init__(self, session: RecordedSession, clock: Clock):
+        """
+        初始化回放輸入後端
+
+        Args:
+            session: 錄製的流程
+            clock: 時鐘（時間 0 對應錄製開始）
+        """
+        super().__init__(clock)
+        self._durations = {
+            method: collections.deque(durations)
+            for method, durations in session.call_durations().items()
+        }
+
+    def _next_duration(self, method: str) -> float | None:
+        """取出該方法下一次呼叫錄製時花費的時間"""
+        durations = self._durations.get(method)
+        return durations.popleft() if durations else None
+
+    def move_to(self, x: int, y: int, duration: float = 0.5):
+        """移動滑鼠到指定位置"""
+        recorded = self._next_duration("move_to")
+        super().move_to(x, y, duration)
+        if recorded is not None:
+            self.clock.sleep(recorded)
+
+    def click(
+        self, x: int, y: int, button: str = "left", move_duration: float = 0.0
+    ):
+        """點擊指定位置"""
+        recorded = self._next_duration("click")
+        # 不經由 move_to()，避免取用錄製時 move_to 的記錄
+        self.position = (x, y)
+        self._record("move", "", "move")
+        self._record("mouse", button, "down")
+        self._record("mouse", button, "up")
+        if recorded is not None:
+            self.clock.sleep(recorded)
+
+    def press_key(self, key: str, duration: float = 0.1):
+        """按下按鍵"""
+        recorded = self._next_duration("press_key")
+        if recorded is None:
+            super().press_key(key, duration)
+            return
+        self._record("key", key.lower(), "down")
+        self._record("key", key.lower(), "up")
+        self.clock.sleep(recorded)
@@ -0,0 +1,525 @@
+"""
+型別化配置模組
+
+將 config.yaml 一次驗證並編譯為不可變的資料類別，
+熱路徑直接讀取屬性，不再每次以字串路徑查詢巢狀字典。
+"""
+
+import dataclasses
+import difflib
+import functools
+import types
+import typing
+from dataclasses import dataclass, field
+from typing import Literal
+
+
+class ConfigError(ValueError):
+    """配置檔案內容錯誤"""
+
+
+@dataclass(frozen=True, slots=True)
+class RegionConfig:
+    """檢測區域（相對於遊戲視窗，比例 0-1）"""
+
+    x: float = 0.0
+    y: float = 0.0
+    width: float = 1.0
+    height: float = 1.0
+
+
+@dataclass(frozen=True, slots=True)
+class PositionConfig:
+    """點擊位置（相對於遊戲視窗，比例 0-1）"""
+
+    x: float = 0.5
+    y: float = 0.5
+
+
+@dataclass(frozen=True, slots=True)
+class GameConfig:
+    """遊戲配置"""
+
+    window_title: str = ""
+    window_rect_ttl: float = 0.5
+
+
+@dataclass(frozen=True, slots=True)
+class MultiWindowConfig:
+    """多視窗配置"""
+
+    enabled: bool = False
+    max_windows: int = 0
+    waiting_fps: float = 10.0
+    background_fps: float = 2.0
+    switch_delay: float = 0.05
+
+
+@dataclass(frozen=True, slots=True)
+class ControllerConfig:
+    """方向控制器配置"""
+
+    kp: float = 5.5
+    ki: float = 0.0
+    kd: float = 0.25
+    period: float = 0.1
+    integral_limit: float = 0.5
+    derivative_smoothing: float = 0.5
+    min_duty: float = 0.05
+
+
+@dataclass(frozen=True, slots=True)
+class FishTrackingConfig:
+    """魚追蹤配置"""
+
+    enabled: bool = True
+    left_key: str = "a"
+    right_key: str = "d"
+    center_threshold_min: float = 0.05
+    center_threshold_max: float = 0.10
+    center_offset: float = 0.0
+    key_press_duration: float = 0.15
+    controller: ControllerConfig = field(default_factory=ControllerConfig)
+    record_sessions: bool = False
+    record_dir: str = "sessions/steering"
+
+
+@dataclass(frozen=True, slots=True)
+class TensionPhaseConfig:
+    """拉力計階段配置"""
+
+    duration: float = 180.0
+    check_interval: float = 0.05
+    red_template: str = "templates/red_tension.png"
+    red_template_threshold: float = 0.8
+    red_tension_intermittent_hold_threshold: int = 50
+    intermittent_hold_duration: float = 0.2
+    intermittent_release_duration: float = 0.2
+    red_tension_max_threshold: int = 100
+    max_tension_release_duration: float = 0.3
+
+
+@dataclass(frozen=True, slots=True)
+class FishingConfig:
+    """釣魚配置"""
+
+    cast_type: Literal["key", "click"] = "key"
+    cast_key: str = "e"
+    cast_click_pos: PositionConfig = field(default_factory=PositionConfig)
+    reel_type: Literal["key", "click"] = "key"
+    reel_key: str = "e"
+    reel_click_pos: PositionConfig = field(default_factory=PositionConfig)
+    bite_timeout: float = 30.0
+    cast_delay: float = 2.0
+    reel_delay: float = 0.1
+    fish_tracking: FishTrackingConfig = field(
+        default_factory=FishTrackingConfig
+    )
+    tension_phase: TensionPhaseConfig = field(
+        default_factory=TensionPhaseConfig
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class FishSplashConfig:
+    """白色水花檢測配置"""
+
+    region: RegionConfig = field(
+        default_factory=lambda: RegionConfig(0.2, 0.3, 0.6, 0.3)
+    )
+    white_threshold: int = 200
+    min_area: int = 50
+
+
+@dataclass(frozen=True, slots=True)
+class TensionBarConfig:
+    """拉力計檢測配置"""
+
+    region: RegionConfig = field(
+        default_factory=lambda: RegionConfig(0.25, 0.7, 0.4, 0.2)
+    )
+    template: str = "templates/tension_bar.png"
+
+
+@dataclass(frozen=True, slots=True)
+class RedTensionConfig:
+    """紅色張力檢測配置"""
+
+    region: RegionConfig = field(
+        default_factory=lambda: RegionConfig(0.25, 0.7, 0.4, 0.2)
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class RedTensionTemplateConfig:
+    """紅色張力模板匹配配置"""
+
+    region: RegionConfig = field(
+        default_factory=lambda: RegionConfig(0.33, 0.8, 0.34, 0.06)
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class RedTensionOscConfig:
+    """紅色張力 OSC 配置"""
+
+    region: RegionConfig = field(
+        default_factory=lambda: RegionConfig(0.61, 0.77, 0.05, 0.04)
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class RetryButtonConfig:
+    """「再來一次」按鈕檢測配置"""
+
+    template: str = "templates/retry_button.png"
+    wait_time: float = 2.0
+    search_timeout: float = 5.0
+    response_delay: float = 1.0
+    check_interval: float = 0.5
+    region: RegionConfig = field(default_factory=RegionConfig)
+
+
+@dataclass(frozen=True, slots=True)
+class RodDurabilityConfig:
+    """魚竿耐久度檢測配置"""
+
+    template: str = "templates/rod_depleted.png"
+    wait_time: float = 0.1
+    search_timeout: float = 0.4
+    check_interval: float = 0.1
+    region: RegionConfig = field(default_factory=RegionConfig)
+    first_click_pos: PositionConfig = field(default_factory=PositionConfig)
+    second_click_pos: PositionConfig = field(
+        default_factory=lambda: PositionConfig(0.5, 0.6)
+    )
+    click_delay: float = 0.5
+    response_delay: float = 0.1
+
+
+@dataclass(frozen=True, slots=True)
+class DetectionConfig:
+    """圖像識別配置"""
+
+    region: RegionConfig = field(
+        default_factory=lambda: RegionConfig(0.45, 0.35, 0.1, 0.22)
+    )
+    threshold: float = 0.8
+    check_interval: float = 0.1
+    bite_detection_mode: Literal["sequential", "shared", "parallel"] = (
+        "sequential"
+    )
+    fish_splash: FishSplashConfig = field(default_factory=FishSplashConfig)
+    tension_bar: TensionBarConfig = field(default_factory=TensionBarConfig)
+    red_tension: RedTensionConfig = field(default_factory=RedTensionConfig)
+    red_tension_template: RedTensionTemplateConfig = field(
+        default_factory=RedTensionTemplateConfig
+    )
+    red_tension_osc: RedTensionOscConfig = field(
+        default_factory=RedTensionOscConfig
+    )
+    retry_button: RetryButtonConfig = field(default_factory=RetryButtonConfig)
+    rod_durability: RodDurabilityConfig = field(
+        default_factory=RodDurabilityConfig
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class AntiDetectionConfig:
+    """反檢測配置"""
+
+    random_delay_min: float = 0.1
+    random_delay_max: float = 0.5
+    rest_time_min: float = 1.0
+    rest_time_max: float = 3.0
+    mouse_move_duration: float = 0.0
+    mouse_move_profile: Literal["linear", "eased", "curved"] = "linear"
+    mouse_move_rate: float = 100.0
+
+
+@dataclass(frozen=True, slots=True)
+class InputConfig:
+    """輸入配置"""
+
+    backend: Literal["winapi", "pyautogui", "recording"] = "winapi"
+    async_worker: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class CalibrationConfig:
+    """輸入延遲校準配置"""
+
+    trials: int = 10
+    timeout: float = 1.0
+    settle_time: float = 0.5
+    diff_threshold: float = 8.0
+    output_file: str = "latency_profile.json"
+    apply: bool = True
+
+
+@dataclass(frozen=True, slots=True)
+class TelemetryConfig:
+    """控制週期遙測配置"""
+
+    enabled: bool = True
+    capacity: int = 4096
+    dump_dir: str = "telemetry"
+    dump_hotkey: str | None = "F9"
+
+
+@dataclass(frozen=True, slots=True)
+class FlightRecorderConfig:
+    """畫面飛行記錄器配置"""
+
+    enabled: bool = False
+    seconds: float = 10.0
+    fps: float = 5.0
+    max_size: int = 320
+    grayscale: bool = True
+    max_regions: int = 8
+    dir: str = "flight_recorder"
+
+
+@dataclass(frozen=True, slots=True)
+class MetricsExporterConfig:
+    """Prometheus 指標端點配置"""
+
+    enabled: bool = False
+    host: str = "127.0.0.1"
+    port: int = 9464
+
+
+@dataclass(frozen=True, slots=True)
+class ReactionBudgetConfig:
+    """反應延遲預算配置（秒）"""
+
+    bite_reel: float = 0.1
+    tension_release: float = 0.05
+    offset_steer: float = 0.05
+
+
+@dataclass(frozen=True, slots=True)
+class MetricsConfig:
+    """執行指標配置"""
+
+    enabled: bool = True
+    summary_interval: int = 10
+    reaction_budget: ReactionBudgetConfig = field(
+        default_factory=ReactionBudgetConfig
+    )
+    exporter: MetricsExporterConfig = field(
+        default_factory=MetricsExporterConfig
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class TracingConfig:
+    """執行區段追蹤配置"""
+
+    enabled: bool = False
+    capacity: int = 200_000
+    dump_dir: str = "traces"
+    dump_hotkey: str | None = "F10"
+
+
+@dataclass(frozen=True, slots=True)
+class ProfilerConfig:
+    """取樣分析器配置"""
+
+    enabled: bool = False
+    rate: float = 100.0
+    output_dir: str = "profiles"
+    hotkey: str | None = "F11"
+
+
+@dataclass(frozen=True, slots=True)
+class SessionRecordingConfig:
+    """流程錄製配置"""
+
+    enabled: bool = False
+    dir: str = "sessions/recordings"
+    max_fps: float = 10.0
+    keep: Literal["all", "failed"] = "failed"
+
+
+@dataclass(frozen=True, slots=True)
+class ConfigReloadConfig:
+    """配置熱重載配置"""
+
+    enabled: bool = False
+    interval: float = 1.0
+
+
+@dataclass(frozen=True, slots=True)
+class LoggingConfig:
+    """日誌配置"""
+
+    level: Literal["DEBUG", "INFO", "WARNING", "ERROR"] = "INFO"
+    file: str | None = "fishing_bot.log"
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """完整配置"""
+
+    game: GameConfig = field(default_factory=GameConfig)
+    multi_window: MultiWindowConfig = field(default_factory=MultiWindowConfig)
+    fishing: FishingConfig = field(default_factory=FishingConfig)
+    detection: DetectionConfig = field(default_factory=DetectionConfig)
+    anti_detection: AntiDetectionConfig = field(
+        default_factory=AntiDetectionConfig
+    )
+    input: InputConfig = field(default_factory=InputConfig)
+    calibration: CalibrationConfig = field(default_factory=CalibrationConfig)
+    telemetry: TelemetryConfig = field(default_factory=TelemetryConfig)
+    flight_recorder: FlightRecorderConfig = field(
+        default_factory=FlightRecorderConfig
+    )
+    metrics: MetricsConfig = field(default_factory=MetricsConfig)
+    tracing: TracingConfig = field(default_factory=TracingConfig)
+    profiler: ProfilerConfig = field(default_factory=ProfilerConfig)
+    session_recording: SessionRecordingConfig = field(
+        default_factory=SessionRecordingConfig
+    )
+    config_reload: ConfigReloadConfig = field(
+        default_factory=ConfigReloadConfig
+    )
+    logging: LoggingConfig = field(default_factory=LoggingConfig)
+
+
+@functools.cache
+def _field_types(cls: type) -> dict[str, object]:
+    """取得資料類別各欄位的型別"""
+    return typing.get_type_hints(cls)
+
+
+def _convert(path: str, hint: object, value: object, errors: list[str]):
+    """
+    依型別驗證並轉換單一配置值
+
+    Args:
+        path: 配置鍵（錯誤訊息用）
+        hint: 欄位型別
+        value: 配置值
+        errors: 錯誤訊息列表
+
+    Returns:
+        轉換後的值
+    """
+    if isinstance(hint, type) and dataclasses.is_dataclass(hint):
+        return _compile(hint, value, path, errors)
+
+    origin = typing.get_origin(hint)
+    if origin is Literal:
+        choices = typing.get_args(hint)
+        if value not in choices:
+            errors.append(
+                f"{path}: {value!r} 不是有效值，可選: "
+                + ", ".join(map(str, choices))
+            )
+        return value
+
+    if origin in (types.UnionType, typing.Union):
+        if value is None and type(None) in typing.get_args(hint):
+            return None
+        hint = next(
+            arg for arg in typing.get_args(hint) if arg is not type(None)
+        )
+
+    # bool 是 int 的子類別，數值欄位不接受 true/false
+    if not isinstance(value, bool):
+        if hint is float and isinstance(value, int | float):
+            return float(value)
+        if hint is int and isinstance(value, int):
+            return value
+    if hint is bool or hint is str:
+        if isinstance(value, hint):
+            return value
+
+    name = getattr(hint, "__name__", str(hint))
+    errors.append(f"{path}: 應為 {name}，實際為 {type(value).__name__}")
+    return value
+
+
+def _compile(cls: type, data: object, path: str, errors: list[str]):
+    """
+    將配置字典編譯為資料類別
+
+    Args:
+        cls: 資料類別
+        data: 配置字典（None 表示全部使用預設值）
+        path: 配置鍵前綴（錯誤訊息用）
+        errors: 錯誤訊息列表
+
+    Returns:
+        資料類別實例
+    """
+    if data is None:
+        return cls()
+    if not isinstance(data, dict):
+        errors.append(
+            f"{path or '配置'}: 應為字典，實際為 {type(data).__name__}"
+        )
+        return cls()
+
+    hints = _field_types(cls)
+    values = {}
+    for key, value in data.items():
+        key = str(key)
+        key_path = f"{path}.{key}" if path else key
+        if key not in hints:
+            # 拼寫錯誤的鍵會讓程式默默使用預設值，直接回報
+            suggestion = difflib.get_close_matches(key, hints, n=1)
+            hint = f"，是否為 {suggestion[0]}？" if suggestion else ""
+            errors.append(f"{key_path}: 未知的配置鍵{hint}")
+            continue
+        values[key] = _convert(key_path, hints[key], value, errors)
+    return cls(**values)
+
+
+def template_paths(settings: Settings) -> list[str]:
+    """
+    收集配置中所有模板圖像路徑
+
+    Args:
+        settings: 配置
+
+    Returns:
+        欄位名稱為 template 或以 _template 結尾的路徑（依出現順序，不重複）
+    """
+    paths: dict[str, None] = {}
+
+    def walk(value: object):
+        if not dataclasses.is_dataclass(value):
+            return
+        for item in dataclasses.fields(value):
+            child = getattr(value, item.name)
+            if isinstance(child, str) and (
+                item.name == "template" or item.name.endswith("_template")
+            ):
+                paths[child] = None
+            else:
+                walk(child)
+
+    walk(settings)
+    return list(paths)
+
+
+def compile_settings(data: dict | None) -> Settings:
+    """
+    驗證配置字典並編譯為不可變的配置
+
+    Args:
+        data: 從 config.yaml 讀取的配置字典
+
+    Returns:
+        編譯後的配置
+
+    Raises:
+        ConfigError: 配置包含未知的鍵或型別錯誤
+    """
+    errors: list[str] = []
+    settings = _compile(Settings, data, "", errors)
+    if errors:
+        raise ConfigError("配置檔案錯誤:\n  " + "\n  ".join(errors))
+    return settings
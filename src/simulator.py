@@ -0,0 +1,533 @@
+"""
+釣魚遊戲模擬器
+"""
+
+import logging
+import math
+import threading
+import time
+from dataclasses import dataclass
+
+import cv2
+import numpy as np
+
+from src.clock import SYSTEM_CLOCK, Clock
+from src.config_manager import ConfigManager
+from src.input_backend import RecordingInputBackend
+from src.region_registry import Region, RegionRegistry
+from src.utils import get_resource_path
+from src.window_manager import StaticWindowManager
+
+# 模擬的遊戲狀態
+IDLE = "idle"
+WAITING = "waiting"
+BITING = "biting"
+TENSION = "tension"
+RESULT = "result"
+
+# 畫面元素的顏色 (BGR)
+BITE_ORANGE = (15, 130, 250)  # 在 BITE_COLOR_RANGE 範圍內
+TENSION_RED = (20, 20, 240)  # 在 detect_red_ratio 的過高範圍內
+SPLASH_WHITE = (255, 255, 255)
+
+
+@dataclass(frozen=True)
+class SimulatorParams:
+    """模擬遊戲的動態參數（時間單位為秒，位置單位為視窗寬度比例）"""
+
+    bite_delay_min: float = 3.0  # 拋竿後到咬鉤的最短時間
+    bite_delay_max: float = 12.0  # 拋竿後到咬鉤的最長時間
+    bite_window: float = 1.5  # 咬鉤指示器顯示時間，逾時魚離開並重新等待
+    tension_rise: float = 40.0  # 按住左鍵時張力每秒上升量（0-100）
+    tension_fall: float = 60.0  # 放開左鍵時張力每秒下降量
+    break_time: float = 1.0  # 張力滿格持續超過此時間即斷線
+    reel_speed: float = 8.0  # 按住左鍵且張力未滿時每秒的收線進度（%）
+    fish_speed: float = 0.12  # 魚自行移動的最大速度
+    fish_jerk: float = 0.25  # 魚速度的隨機變化強度
+    steer_speed: float = 0.3  # 按住方向鍵時魚相對中心的移動速度
+    escape_offset: float = 0.35  # 魚偏離中心超過此比例即開始脫鉤
+    escape_time: float = 1.5  # 偏離超過 escape_offset 持續此時間即脫鉤
+    result_delay: float = 1.0  # 結束拉力階段後到出現"再來一次"按鈕的時間
+    rod_casts: int = 0  # 魚竿可拋竿次數，0 表示不會耗盡
+    input_delay: float = (
+        0.05  # 閒置時按住輸入到畫面出現反應的時間（延遲校準用）
+    )
+    step: float = 0.01  # 模擬步長
+
+
+class SimulatedGame:
+    """
+    閉迴路的釣魚遊戲模擬器
+
+    依配置中的檢測區域繪製機器人預期的畫面（咬鉤指示器、拉力計、
+    紅色張力條、白色水花、"再來一次"按鈕與耐久度耗盡提示），
+    並依收到的滑鼠與方向鍵輸入更新張力與魚的位置，
+    可在 Linux 上以任意控制邏輯執行完整的釣魚流程並統計結果。
+
+    同時作為截圖後端（capture）使用；輸入經由 SimulatedInputBackend 送入。
+    遊戲動態以固定步長積分到時鐘的目前時間，結果與截圖頻率無關。
+    """
+
+    def __init__(
+        self,
+        config: ConfigManager,
+        window_rect: tuple[int, int, int, int] = (0, 0, 1920, 1080),
+        params: SimulatorParams | None = None,
+        clock: Clock | None = None,
+        seed: int = 0,
+    ):
+        """
+        初始化模擬器
+
+        Args:
+            config: 配置管理器（決定畫面佈局與點擊位置）
+            window_rect: 模擬視窗的位置 (x, y, width, height)
+            params: 遊戲動態參數
+            clock: 時鐘
+            seed: 隨機種子
+        """
+        self.config = config
+        self.window_rect = window_rect
+        self.params = params or SimulatorParams()
+        self.clock = clock or SYSTEM_CLOCK
+        self.logger = logging.getLogger("FishingBot.Simulator")
+
+        self.window_manager = StaticWindowManager(window_rect)
+        self.regions = RegionRegistry(config, self.window_manager)
+        self._rng = np.random.default_rng(seed)
+        self._lock = threading.Lock()
+
+        _, _, width, height = window_rect
+        self._background = self._rng.integers(
+            20, 60, (height, width, 3), dtype=np.uint8
+        )
+        self._sprites = self._load_sprites()
+
+        # 遊戲狀態
+        self.state = IDLE
+        self._time = self.clock.monotonic()
+        self._state_time = self._time
+        self._bite_at = math.inf
+        # 按住的按鍵與滑鼠按鈕 -> 按下時的時間
+        self._held: dict[tuple[str, str], float] = {}
+        self._casts_left = self.params.rod_casts or math.inf
+        self.tension = 0.0
+        self.fish_offset = 0.0
+        self.progress = 0.0
+        self._fish_velocity = 0.0
+        self._overload_time = 0.0
+        self._escape_time = 0.0
+
+        # 統計
+        self.stats = dict.fromkeys(
+            (
+                "casts",
+                "bites",
+                "missed_bites",
+                "hooked",
+                "caught",
+                "line_broken",
+                "escaped",
+                "rod_replaced",
+            ),
+            0,
+        )
+        self.cpu_time = 0.0  # 模擬器本身（繪製與積分）耗用的 CPU 時間
+
+    def _load_sprites(self) -> dict[str, np.ndarray]:
+        """載入畫面元素使用的模板圖片（缺少時以色塊代替）"""
+        settings = self.config.settings
+        paths = {
+            "bite": "templates/bite_indicator.png",
+            "tension_bar": settings.detection.tension_bar.template,
+            "retry": settings.detection.retry_button.template,
+            "rod": settings.detection.rod_durability.template,
+        }
+        sprites = {}
+        for name, path in paths.items():
+            image = cv2.imread(get_resource_path(path))
+            if image is None:
+                self.logger.warning("模板檔案不存在，以色塊代替: %s", path)
+                image = np.full((40, 40, 3), 200, dtype=np.uint8)
+            sprites[name] = image
+        return sprites
+
+    # ------------------------------------------------------------------
+    # 遊戲動態
+    # ------------------------------------------------------------------
+
+    def _set_state(self, state: str):
+        """切換遊戲狀態（呼叫端需持有鎖）"""
+        self.state = state
+        self._state_time = self._time
+
+    def _schedule_bite(self):
+        """安排下一次咬鉤（呼叫端需持有鎖）"""
+        params = self.params
+        self._bite_at = self._time + self._rng.uniform(
+            params.bite_delay_min, params.bite_delay_max
+        )
+
+    def _advance(self):
+        """以固定步長積分到時鐘的目前時間（呼叫端需持有鎖）"""
+        now = self.clock.monotonic()
+        step = self.params.step
+        while self._time + step <= now:
+            self._time += step
+            self._step(step)
+
+    def _step(self, dt: float):
+        """推進一個模擬步長（呼叫端需持有鎖）"""
+        params = self.params
+        if self.state == WAITING and self._time >= self._bite_at:
+            self.stats["bites"] += 1
+            self._set_state(BITING)
+        elif self.state == BITING:
+            if self._time - self._state_time >= params.bite_window:
+                # 未及時收竿，魚離開後重新等待
+                self.stats["missed_bites"] += 1
+                self._set_state(WAITING)
+                self._schedule_bite()
+        elif self.state == TENSION:
+            self._step_tension(dt)
+
+    def _step_tension(self, dt: float):
+        """推進拉力階段（呼叫端需持有鎖）"""
+        params = self.params
+
+        # 張力與收線進度
+        if ("mouse", "left") in self._held:
+            self.tension = min(self.tension + params.tension_rise * dt, 100.0)
+            if self.tension < 100.0:
+                self.progress += params.reel_speed * dt
+        else:
+            self.tension = max(self.tension - params.tension_fall * dt, 0.0)
+
+        self._overload_time = (
+            self._overload_time + dt if self.tension >= 100.0 else 0.0
+        )
+        if self._overload_time >= params.break_time:
+            self._finish("line_broken")
+            return
+
+        # 魚的隨機移動與方向鍵修正
+        self._fish_velocity += (
+            self._rng.normal(0.0, params.fish_jerk) * dt**0.5
+        )
+        self._fish_velocity = float(
+            np.clip(self._fish_velocity, -params.fish_speed, params.fish_speed)
+        )
+        tracking = self.config.settings.fishing.fish_tracking
+        steer = 0.0
+        if ("key", tracking.left_key) in self._held:
+            steer += params.steer_speed
+        if ("key", tracking.right_key) in self._held:
+            steer -= params.steer_speed
+        self.fish_offset += (self._fish_velocity + steer) * dt
+
+        self._escape_time = (
+            self._escape_time + dt
+            if abs(self.fish_offset) > params.escape_offset
+            else 0.0
+        )
+        if self._escape_time >= params.escape_time:
+            self._finish("escaped")
+        elif self.progress >= 100.0:
+            self._finish("caught")
+
+    def _finish(self, outcome: str):
+        """結束拉力階段（呼叫端需持有鎖）"""
+        self.stats[outcome] += 1
+        self.logger.debug("模擬拉力階段結束: %s", outcome)
+        self._set_state(RESULT)
+
+    # ------------------------------------------------------------------
+    # 輸入
+    # ------------------------------------------------------------------
+
+    def _near(self, position: tuple[int, int], key: str) -> bool:
+        """位置是否在點擊位置附近（視窗寬度的 2% 內）"""
+        point = self.regions.point(key)
+        tolerance = self.window_rect[2] * 0.02
+        return point is not None and math.dist(position, point) <= tolerance
+
+    def handle_input(self, kind: str, name: str, action: str, x: int, y: int):
+        """
+        處理輸入事件
+
+        Args:
+            kind: key / mouse / move
+            name: 按鍵名稱或滑鼠按鈕
+            action: down / up / move
+            x, y: 事件當時的滑鼠位置
+        """
+        start = time.thread_time()
+        with self._lock:
+            self._advance()
+            if action == "up":
+                self._held.pop((kind, name), None)
+            elif action == "down":
+                self._held.setdefault((kind, name), self.clock.monotonic())
+                if kind == "mouse" and name == "left":
+                    self._on_click((x, y))
+                elif kind == "key":
+                    self._on_key(name)
+            self.cpu_time += time.thread_time() - start
+
+    def _on_click(self, position: tuple[int, int]):
+        """處理左鍵按下（呼叫端需持有鎖）"""
+        fishing = self.config.settings.fishing
+        if ("key", "alt") in self._held:
+            if self._casts_left <= 0 and self._near(
+                position, "detection.rod_durability.second_click_pos"
+            ):
+                self._casts_left = self.params.rod_casts or math.inf
+                self.stats["rod_replaced"] += 1
+            return
+
+        if self.state == RESULT:
+            if self._retry_visible() and self._inside_retry(position):
+                self._set_state(IDLE)
+        elif fishing.cast_type == "click" and self.state == IDLE:
+            if self._near(position, "fishing.cast_click_pos"):
+                self._cast()
+        elif fishing.reel_type == "click" and self.state in (WAITING, BITING):
+            if self._near(position, "fishing.reel_click_pos"):
+                self._reel()
+
+    def _on_key(self, key: str):
+        """處理按鍵按下（呼叫端需持有鎖）"""
+        fishing = self.config.settings.fishing
+        if fishing.cast_type == "key" and self.state == IDLE:
+            if key == fishing.cast_key:
+                self._cast()
+        elif fishing.reel_type == "key" and self.state in (WAITING, BITING):
+            if key == fishing.reel_key:
+                self._reel()
+
+    def _cast(self):
+        """拋竿（呼叫端需持有鎖）"""
+        if self._casts_left <= 0:
+            return
+        self._casts_left -= 1
+        self.stats["casts"] += 1
+        self._set_state(WAITING)
+        self._schedule_bite()
+
+    def _reel(self):
+        """收竿：咬鉤時進入拉力階段，否則收回空竿（呼叫端需持有鎖）"""
+        if self.state == WAITING:
+            self._set_state(IDLE)
+            return
+
+        self.stats["hooked"] += 1
+        self.tension = 30.0
+        self.progress = 0.0
+        self.fish_offset = float(self._rng.uniform(-0.1, 0.1))
+        self._fish_velocity = 0.0
+        self._overload_time = 0.0
+        self._escape_time = 0.0
+        self._set_state(TENSION)
+
+    # ------------------------------------------------------------------
+    # 畫面
+    # ------------------------------------------------------------------
+
+    def _retry_visible(self) -> bool:
+        """是否顯示"再來一次"按鈕（呼叫端需持有鎖）"""
+        return (
+            self.state == RESULT
+            and self._time - self._state_time >= self.params.result_delay
+        )
+
+    def _retry_rect(self) -> tuple[int, int, int, int]:
+        """ "再來一次"按鈕的位置（呼叫端需持有鎖）"""
+        return self._centered("detection.retry_button.region", "retry")
+
+    def _inside_retry(self, position: tuple[int, int]) -> bool:
+        """位置是否在"再來一次"按鈕內（呼叫端需持有鎖）"""
+        x, y, width, height = self._retry_rect()
+        return x <= position[0] < x + width and y <= position[1] < y + height
+
+    def _region(self, key: str) -> Region:
+        """取得檢測區域（模擬視窗位置固定，必定存在）"""
+        region = self.regions.region(key)
+        if region is None:
+            raise RuntimeError(f"無法取得檢測區域: {key}")
+        return region
+
+    def _centered(self, key: str, sprite: str) -> tuple[int, int, int, int]:
+        """將圖片置於區域（超出視窗的部分不計）中央的位置 (x, y, width, height)"""
+        region = self._region(key)
+        window_x, window_y, window_width, window_height = self.window_rect
+        left = max(region.x, window_x)
+        top = max(region.y, window_y)
+        right = min(region.x + region.width, window_x + window_width)
+        bottom = min(region.y + region.height, window_y + window_height)
+
+        height, width = self._sprites[sprite].shape[:2]
+        return (
+            left + (right - left - width) // 2,
+            top + (bottom - top - height) // 2,
+            width,
+            height,
+        )
+
+    def _elements(self) -> list[tuple[int, int, np.ndarray]]:
+        """
+        目前畫面上的元素（呼叫端需持有鎖）
+
+        Returns:
+            (x, y, 圖像) 列表，座標為螢幕座標
+        """
+        elements = []
+        sprites = self._sprites
+
+        if self._casts_left <= 0:
+            x, y, _, _ = self._centered(
+                "detection.rod_durability.region", "rod"
+            )
+            elements.append((x, y, sprites["rod"]))
+
+        if self.state == BITING:
+            region = self._region("detection.region")
+            orange = np.empty((region.height // 4, region.width, 3), np.uint8)
+            orange[:] = BITE_ORANGE
+            elements.append((region.x, region.y, orange))
+            x, y, _, _ = self._centered("detection.region", "bite")
+            elements.append((x, y, sprites["bite"]))
+
+        elif self.state == TENSION:
+            # 拉力計圖示置於張力條左側
+            bar = self._region("detection.tension_bar.region")
+            elements.append((bar.x + 8, bar.y, sprites["tension_bar"]))
+
+            strip = self._region("detection.red_tension.region")
+            filled = round(strip.width * self.tension / 100.0)
+            if filled > 0:
+                red = np.empty((strip.height, filled, 3), np.uint8)
+                red[:] = TENSION_RED
+                elements.append((strip.x, strip.y, red))
+
+            elements.append(self._splash())
+
+        elif self._retry_visible():
+            x, y, _, _ = self._retry_rect()
+            elements.append((x, y, sprites["retry"]))
+
+        elif self.state == IDLE:
+            elements.extend(self._input_responses())
+
+        return elements
+
+    def _input_responses(self) -> list[tuple[int, int, np.ndarray]]:
+        """
+        閒置時對按住的輸入的畫面反應（呼叫端需持有鎖）
+
+        按住右方向鍵 input_delay 秒後水花區域出現角色移動，按住左鍵
+        input_delay 秒後張力條區域出現蓄力條，與延遲校準觀察的區域一致。
+
+        Returns:
+            (x, y, 圖像) 列表，座標為螢幕座標
+        """
+        tracking = self.config.settings.fishing.fish_tracking
+        responses = (
+            (("key", tracking.right_key), "detection.fish_splash.region"),
+            (("mouse", "left"), "detection.red_tension.region"),
+        )
+        elements = []
+        for held, key in responses:
+            since = self._held.get(held)
+            if since is None or self._time < since + self.params.input_delay:
+                continue
+            region = self._region(key)
+            block = np.full(
+                (max(region.height // 2, 1), region.width, 3), 200, np.uint8
+            )
+            elements.append((region.x, region.y + region.height // 4, block))
+        return elements
+
+    def _splash(self) -> tuple[int, int, np.ndarray]:
+        """依魚的偏移繪製白色水花（呼叫端需持有鎖）"""
+        window_x, _, width, _ = self.window_rect
+        region = self._region("detection.fish_splash.region")
+        center_offset = (
+            self.config.settings.fishing.fish_tracking.center_offset
+        )
+        center_x = window_x + width / 2 + center_offset
+        splash_x = round(center_x + self.fish_offset * width)
+
+        axes = (max(region.width // 40, 4), max(region.height // 12, 3))
+        image = np.zeros((axes[1] * 2 + 1, axes[0] * 2 + 1, 3), np.uint8)
+        image[:] = self._background[0, 0]
+        cv2.ellipse(image, axes, axes, 0, 0, 360, SPLASH_WHITE, -1)
+
+        # 水花被限制在檢測區域內（魚跑出區域時仍顯示在邊緣）
+        x = int(
+            np.clip(
+                splash_x - axes[0],
+                region.x,
+                region.x + region.width - image.shape[1],
+            )
+        )
+        y = region.y + region.height // 2 - axes[1]
+        return (x, y, image)
+
+    def capture(
+        self, region: tuple[int, int, int, int] | None = None
+    ) -> np.ndarray:
+        """
+        截取模擬畫面
+
+        Args:
+            region: 截取區域 (x, y, width, height)，None 為整個視窗
+
+        Returns:
+            截圖（BGR格式）
+        """
+        start = time.thread_time()
+        with self._lock:
+            self._advance()
+            window_x, window_y, width, height = self.window_rect
+            if region is None:
+                region = self.window_rect
+            x, y, w, h = region
+            left = min(max(x - window_x, 0), width)
+            top = min(max(y - window_y, 0), height)
+            frame = self._background[top : top + h, left : left + w].copy()
+
+            # 只繪製與截取區域重疊的元素
+            for ex, ey, image in self._elements():
+                ex -= window_x + left
+                ey -= window_y + top
+                eh, ew = image.shape[:2]
+                x0, y0 = max(ex, 0), max(ey, 0)
+                x1 = min(ex + ew, frame.shape[1])
+                y1 = min(ey + eh, frame.shape[0])
+                if x0 < x1 and y0 < y1:
+                    frame[y0:y1, x0:x1] = image[
+                        y0 - ey : y1 - ey, x0 - ex : x1 - ex
+                    ]
+            self.cpu_time += time.thread_time() - start
+            return frame
+
+
+class SimulatedInputBackend(RecordingInputBackend):
+    """將輸入送入模擬器的記錄輸入後端"""
+
+    def __init__(self, game: SimulatedGame, clock: Clock | None = None):
+        """
+        初始化模擬輸入後端
+
+        Args:
+            game: 模擬器
+            clock: 時鐘
+        """
+        super().__init__(clock)
+        self.game = game
+
+    def _record(self, kind: str, name: str, action: str):
+        """記錄事件並送入模擬器"""
+        super()._record(kind, name, action)
+        x, y = self.position
+        self.game.handle_input(kind, name, action, x, y)
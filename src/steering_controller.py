@@ -0,0 +1,485 @@
+"""
+魚追蹤方向控制模組
+"""
+
+import itertools
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Self
+
+import numpy as np
+
+from src.settings import FishTrackingConfig
+
+
+@dataclass(frozen=True)
+class SteeringGains:
+    """方向控制器增益"""
+
+    kp: float = 5.5
+    ki: float = 0.0
+    kd: float = 0.25
+
+
+class SteeringController:
+    """
+    對稱的 PID 方向控制器
+
+    誤差為帶符號的偏移比例（魚相對中心點的偏移量佔視窗寬度的比例，
+    負值表示魚在左側，正值表示魚在右側）。輸出範圍為 -1.0 ~ 1.0，
+    符號表示方向，絕對值為一個控制週期內按住方向鍵的佔空比。
+    """
+
+    def __init__(
+        self,
+        gains: SteeringGains,
+        period: float = 0.1,
+        deadband: float = 0.03,
+        saturation: float = 0.18,
+        integral_limit: float = 0.5,
+        derivative_smoothing: float = 0.5,
+        min_duty: float = 0.05,
+        lookahead: float = 0.0,
+    ):
+        """
+        初始化方向控制器
+
+        Args:
+            gains: PID 增益
+            period: 控制週期（秒）
+            deadband: 死區（偏移比例），小於此值視為在中心，不輸出
+            saturation: 飽和閾值（偏移比例），超過此值完全壓住按鍵
+            integral_limit: 積分項上限（防止積分飽和）
+            derivative_smoothing: 微分項低通濾波係數（0-1，越大越平滑）
+            min_duty: 最小佔空比，低於此值不按鍵（避免過短的按鍵）
+            lookahead: 預測時間（秒），以誤差變化率外推誤差以補償輸入延遲
+        """
+        self.gains = gains
+        self.period = period
+        self.deadband = deadband
+        self.saturation = saturation
+        self.integral_limit = integral_limit
+        self.derivative_smoothing = derivative_smoothing
+        self.min_duty = min_duty
+        self.lookahead = lookahead
+        self.reset()
+
+    @classmethod
+    def from_settings(
+        cls,
+        tracking: FishTrackingConfig,
+        gains: SteeringGains | None = None,
+        lookahead: float = 0.0,
+    ) -> Self:
+        """
+        依魚追蹤配置建立方向控制器（拉力階段與增益調整共用）
+
+        Args:
+            tracking: 魚追蹤配置
+            gains: PID 增益，None 時使用配置的增益
+            lookahead: 預測時間（秒）
+
+        Returns:
+            方向控制器
+        """
+        controller = tracking.controller
+        if gains is None:
+            gains = SteeringGains(
+                kp=controller.kp, ki=controller.ki, kd=controller.kd
+            )
+        return cls(
+            gains,
+            period=controller.period,
+            deadband=tracking.center_threshold_min,
+            saturation=tracking.center_threshold_max,
+            integral_limit=controller.integral_limit,
+            derivative_smoothing=controller.derivative_smoothing,
+            min_duty=controller.min_duty,
+            lookahead=lookahead,
+        )
+
+    def reset(self):
+        """重置控制器內部狀態"""
+        self._integral = 0.0
+        self._derivative = 0.0
+        self._prev_error: float | None = None
+        self._prev_time: float | None = None
+
+    def update(self, error: float, now: float) -> float:
+        """
+        根據當前誤差計算控制輸出
+
+        Args:
+            error: 帶符號的偏移比例
+            now: 當前時間（秒）
+
+        Returns:
+            控制輸出（-1.0 ~ 1.0）
+        """
+        dt = None
+        if self._prev_time is not None:
+            dt = now - self._prev_time
+
+        # 微分項：誤差變化率，經低通濾波降低檢測雜訊
+        if self._prev_error is not None and dt:
+            raw_derivative = (error - self._prev_error) / dt
+            alpha = self.derivative_smoothing
+            self._derivative = (
+                alpha * self._derivative + (1 - alpha) * raw_derivative
+            )
+
+        self._prev_error = error
+        self._prev_time = now
+
+        # 在中心區域，不輸出並清空積分
+        if abs(error) < self.deadband:
+            self._integral = 0.0
+            return 0.0
+
+        # 超過飽和閾值，完全壓住按鍵
+        if abs(error) >= self.saturation:
+            return 1.0 if error > 0 else -1.0
+
+        # 比例項使用外推後的誤差，補償輸入到畫面反應的延遲
+        predicted_error = error + self._derivative * self.lookahead
+        output = (
+            self.gains.kp * predicted_error
+            + self.gains.ki * self._integral
+            + self.gains.kd * self._derivative
+        )
+
+        # 積分項：只在輸出未飽和時累加（防止積分飽和）
+        if dt and abs(output) < 1.0:
+            self._integral += error * dt
+            self._integral = max(
+                -self.integral_limit, min(self.integral_limit, self._integral)
+            )
+
+        return max(-1.0, min(1.0, output))
+
+    def applied_duty(self, output: float) -> float:
+        """
+        取得實際套用的帶符號佔空比（低於最小佔空比時不按鍵）
+
+        Args:
+            output: 控制輸出
+
+        Returns:
+            佔空比（-1.0 ~ 1.0），0 表示不按鍵
+        """
+        return 0.0 if abs(output) < self.min_duty else output
+
+    def hold_time(self, output: float) -> float:
+        """
+        取得一個控制週期內按住方向鍵的時間
+
+        Args:
+            output: 控制輸出
+
+        Returns:
+            按鍵時間（秒），0 表示不按鍵
+        """
+        return abs(self.applied_duty(output)) * self.period
+
+
+class SteeringTrace:
+    """拉力階段的方向控制記錄（供離線調整增益使用）"""
+
+    def __init__(self):
+        """初始化記錄"""
+        self.times: list[float] = []
+        self.errors: list[float] = []
+        self.outputs: list[float] = []
+
+    def append(self, now: float, error: float, output: float):
+        """
+        追加一筆控制記錄
+
+        Args:
+            now: 時間（秒）
+            error: 帶符號的偏移比例
+            output: 控制輸出
+        """
+        self.times.append(now)
+        self.errors.append(error)
+        self.outputs.append(output)
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def save(self, path: str | Path):
+        """
+        保存記錄為 .npz 檔案
+
+        Args:
+            path: 檔案路徑
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        np.savez(
+            path,
+            t=np.asarray(self.times, dtype=np.float64),
+            error=np.asarray(self.errors, dtype=np.float64),
+            output=np.asarray(self.outputs, dtype=np.float64),
+        )
+
+    @classmethod
+    def load(cls, path: str | Path) -> Self:
+        """
+        從 .npz 檔案載入記錄
+
+        Args:
+            path: 檔案路徑
+
+        Returns:
+            控制記錄
+        """
+        trace = cls()
+        with np.load(path) as data:
+            trace.times = data["t"].tolist()
+            trace.errors = data["error"].tolist()
+            trace.outputs = data["output"].tolist()
+        return trace
+
+
+@dataclass(frozen=True)
+class PlantModel:
+    """
+    魚追蹤的受控對象模型
+
+    de/dt = -gain * u(t - delay * dt) + drift，drift 取自擬合殘差
+    """
+
+    gain: float
+    delay: int
+    dt: float
+    residuals: np.ndarray
+
+
+@dataclass(frozen=True)
+class SimulationResult:
+    """閉迴路模擬結果"""
+
+    mean_abs_error: float
+    overshoots_per_second: float
+    key_events_per_second: float
+    cost: float
+
+
+def fit_plant_model(
+    traces: list[SteeringTrace], max_delay: int = 5, min_duty: float = 0.0
+) -> PlantModel:
+    """
+    以最小平方法從記錄擬合受控對象模型
+
+    對每個候選延遲步數擬合 de/dt = -gain * u[k - delay] + c，
+    選擇殘差最小者。u 為實際套用的佔空比：記錄的控制輸出低於
+    最小佔空比時並未按鍵，視為 0。
+
+    Args:
+        traces: 控制記錄列表
+        max_delay: 最大延遲步數
+        min_duty: 記錄時控制器的最小佔空比
+
+    Returns:
+        擬合的模型
+    """
+    best: tuple[float, PlantModel] | None = None
+    dts = []
+
+    for delay in range(max_delay + 1):
+        rates = []
+        inputs = []
+        for trace in traces:
+            t = np.asarray(trace.times)
+            e = np.asarray(trace.errors)
+            u = np.asarray(trace.outputs)
+            u = np.where(np.abs(u) < min_duty, 0.0, u)
+            if len(t) <= delay + 1:
+                continue
+            dt = np.diff(t)
+            valid = dt > 0
+            rate = np.diff(e)[valid] / dt[valid]
+            u_delayed = np.concatenate([np.zeros(delay), u])[: len(u) - 1]
+            rates.append(rate)
+            inputs.append(u_delayed[valid])
+            if delay == 0:
+                dts.append(dt[valid])
+
+        if not rates:
+            continue
+
+        rate = np.concatenate(rates)
+        u_delayed = np.concatenate(inputs)
+        design = np.column_stack([u_delayed, np.ones_like(u_delayed)])
+        coef, *_ = np.linalg.lstsq(design, rate, rcond=None)
+        residuals = rate - design @ coef
+        sse = float(residuals @ residuals)
+
+        if best is None or sse < best[0]:
+            best = (
+                sse,
+                PlantModel(
+                    gain=float(-coef[0]),
+                    delay=delay,
+                    dt=0.0,
+                    residuals=residuals,
+                ),
+            )
+
+    if best is None or not dts:
+        raise ValueError("記錄資料不足，無法擬合模型")
+
+    model = best[1]
+    return PlantModel(
+        gain=model.gain,
+        delay=model.delay,
+        dt=float(np.median(np.concatenate(dts))),
+        residuals=model.residuals,
+    )
+
+
+def simulate_controller(
+    model: PlantModel,
+    controller: SteeringController,
+    duration: float = 60.0,
+    seed: int = 0,
+    overshoot_weight: float = 0.02,
+    key_event_weight: float = 0.002,
+) -> SimulationResult:
+    """
+    以受控對象模型模擬閉迴路控制
+
+    Args:
+        model: 受控對象模型
+        controller: 方向控制器
+        duration: 模擬時長（秒）
+        seed: 隨機種子
+        overshoot_weight: 代價函數中每秒過衝次數的權重
+        key_event_weight: 代價函數中每秒按鍵事件數的權重
+
+    Returns:
+        模擬結果
+    """
+    rng = np.random.default_rng(seed)
+    period = controller.period
+    steps = max(1, int(duration / period))
+    drift = rng.choice(model.residuals, size=steps).tolist()
+    error = float(rng.uniform(-controller.saturation, controller.saturation))
+
+    controller.reset()
+    pending = [0.0] * model.delay
+    abs_error_sum = 0.0
+    overshoots = 0
+    key_events = 0
+    held = 0
+    last_side = 0
+
+    for k in range(steps):
+        output = controller.update(error, k * period)
+        pending.append(controller.applied_duty(output))
+        applied = pending.pop(0)
+
+        # 按鍵事件：週期開始時切換方向，未滿週期則在週期內釋放
+        direction = (output > 0) - (output < 0)
+        hold = controller.hold_time(output)
+        if hold == 0:
+            direction = 0
+        if direction != held:
+            key_events += (held != 0) + (direction != 0)
+            held = direction
+        if held and hold < period:
+            key_events += 1
+            held = 0
+
+        # 過衝：誤差越過死區跑到另一側
+        side = 0
+        if abs(error) >= controller.deadband:
+            side = 1 if error > 0 else -1
+        if side and last_side and side != last_side:
+            overshoots += 1
+        if side:
+            last_side = side
+
+        abs_error_sum += abs(error)
+        error += (-model.gain * applied + drift[k]) * period
+
+    elapsed = steps * period
+    mean_abs_error = abs_error_sum / steps
+    overshoots_per_second = overshoots / elapsed
+    key_events_per_second = key_events / elapsed
+    return SimulationResult(
+        mean_abs_error=mean_abs_error,
+        overshoots_per_second=overshoots_per_second,
+        key_events_per_second=key_events_per_second,
+        cost=(
+            mean_abs_error
+            + overshoot_weight * overshoots_per_second
+            + key_event_weight * key_events_per_second
+        ),
+    )
+
+
+def tune_gains(
+    model: PlantModel,
+    tracking: FishTrackingConfig,
+    lookahead: float = 0.0,
+    kp_values: list[float] | None = None,
+    ki_values: list[float] | None = None,
+    kd_values: list[float] | None = None,
+    seeds: int = 3,
+    duration: float = 60.0,
+) -> tuple[SteeringGains, SimulationResult]:
+    """
+    以網格搜索找出代價最低的增益
+
+    Args:
+        model: 受控對象模型
+        tracking: 魚追蹤配置（除增益外的控制器參數與拉力階段相同）
+        lookahead: 預測時間（秒）
+        kp_values: 比例增益候選值
+        ki_values: 積分增益候選值
+        kd_values: 微分增益候選值
+        seeds: 每組增益的模擬次數
+        duration: 每次模擬的時長（秒）
+
+    Returns:
+        (最佳增益, 平均模擬結果)
+    """
+    logger = logging.getLogger("FishingBot.SteeringTuner")
+
+    if kp_values is None:
+        kp_values = [2.0, 3.0, 4.0, 5.5, 7.0, 9.0, 12.0]
+    if ki_values is None:
+        ki_values = [0.0, 0.5, 1.0, 2.0]
+    if kd_values is None:
+        kd_values = [0.0, 0.1, 0.25, 0.5, 0.8]
+
+    best: tuple[SteeringGains, SimulationResult] | None = None
+    for kp, ki, kd in itertools.product(kp_values, ki_values, kd_values):
+        gains = SteeringGains(kp=kp, ki=ki, kd=kd)
+        controller = SteeringController.from_settings(
+            tracking, gains, lookahead
+        )
+        results = [
+            simulate_controller(model, controller, duration, seed)
+            for seed in range(seeds)
+        ]
+        result = SimulationResult(
+            mean_abs_error=float(np.mean([r.mean_abs_error for r in results])),
+            overshoots_per_second=float(
+                np.mean([r.overshoots_per_second for r in results])
+            ),
+            key_events_per_second=float(
+                np.mean([r.key_events_per_second for r in results])
+            ),
+            cost=float(np.mean([r.cost for r in results])),
+        )
+        logger.debug("kp=%s ki=%s kd=%s 代價=%.4f", kp, ki, kd, result.cost)
+        if best is None or result.cost < best[1].cost:
+            best = (gains, result)
+
+    if best is None:
+        raise ValueError("增益候選值不可為空")
+    return best
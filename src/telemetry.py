@@ -0,0 +1,151 @@
+"""
+控制週期遙測模組
+"""
+
+import logging
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+
+from src.clock import SYSTEM_CLOCK, Clock
+
+# 每個控制週期的記錄格式（固定大小，可直接以 np.load 讀回）
+TELEMETRY_DTYPE = np.dtype(
+    [
+        ("timestamp", "f8"),  # clock.time()
+        ("phase", "u1"),  # PHASE_CODES
+        ("tension", "i2"),  # 張力值，-1 表示未檢測
+        ("offset", "f4"),  # 魚偏移，NaN 表示未檢測
+        ("output", "f4"),  # 方向控制器輸出，NaN 表示無
+        ("held", "u1"),  # 按住的按鍵（HELD_* 位元組合）
+        ("detect_time", "f4"),  # 本週期檢測耗時（秒）
+    ]
+)
+
+# 記錄來源的控制迴圈
+PHASE_CODES = {"waiting": 1, "tension": 2, "steering": 3}
+
+# 按住狀態位元
+HELD_MOUSE_LEFT = 1
+HELD_LEFT_KEY = 2
+HELD_RIGHT_KEY = 4
+
+
+class TelemetryRing:
+    """
+    控制週期遙測環形緩衝區
+
+    以預先配置的 NumPy 結構化陣列保存最近 capacity 個控制週期的記錄，
+    記錄時只寫入一列，不配置記憶體也不格式化文字，可在正式運行時常駐開啟。
+    階段失敗、逾時或按下熱鍵時以 dump() 將內容依時間順序保存為 .npy。
+    """
+
+    def __init__(self, capacity: int = 4096, clock: Clock | None = None):
+        """
+        初始化遙測緩衝區
+
+        Args:
+            capacity: 保存的記錄數
+            clock: 時鐘（記錄的時間戳，預設使用實際時間）
+        """
+        if capacity <= 0:
+            raise ValueError("capacity 必須大於 0")
+
+        self.capacity = capacity
+        self.clock = clock or SYSTEM_CLOCK
+        self.logger = logging.getLogger("FishingBot.Telemetry")
+
+        self._buffer = np.zeros(capacity, dtype=TELEMETRY_DTYPE)
+        self._lock = threading.Lock()
+        self._count = 0
+        self.dump_count = 0
+
+    def __len__(self) -> int:
+        return min(self._count, self.capacity)
+
+    def record(
+        self,
+        phase: int,
+        tension: int = -1,
+        offset: float = np.nan,
+        output: float = np.nan,
+        held: int = 0,
+        detect_time: float = 0.0,
+    ):
+        """
+        記錄一個控制週期
+
+        Args:
+            phase: 記錄來源（PHASE_CODES 的值）
+            tension: 張力值，-1 表示未檢測
+            offset: 魚偏移，NaN 表示未檢測
+            output: 方向控制器輸出
+            held: 按住的按鍵（HELD_* 位元組合）
+            detect_time: 本週期檢測耗時（秒）
+        """
+        row = (
+            self.clock.time(),
+            phase,
+            tension,
+            offset,
+            output,
+            held,
+            detect_time,
+        )
+        with self._lock:
+            self._buffer[self._count % self.capacity] = row
+            self._count += 1
+
+    def snapshot(self) -> np.ndarray:
+        """
+        依時間順序複製目前的記錄
+
+        Returns:
+            結構化陣列（最舊的記錄在前）
+        """
+        with self._lock:
+            count = self._count
+            if count <= self.capacity:
+                return self._buffer[:count].copy()
+            start = count % self.capacity
+            return np.concatenate((self._buffer[start:], self._buffer[:start]))
+
+    def clear(self):
+        """清除所有記錄"""
+        with self._lock:
+            self._count = 0
+
+    def dump(self, directory: str, reason: str) -> Path | None:
+        """
+        將目前的記錄保存為 .npy
+
+        Args:
+            directory: 保存目錄
+            reason: 觸發原因（加入檔名）
+
+        Returns:
+            保存的檔案路徑，沒有記錄或保存失敗時返回 None
+        """
+        records = self.snapshot()
+        if len(records) == 0:
+            return None
+
+        try:
+            path = Path(directory)
+            path.mkdir(parents=True, exist_ok=True)
+            # 加上序號，同一秒內多次保存也不會覆蓋
+            filename = (
+                time.strftime("%Y%m%d_%H%M%S")
+                + f"_{self.dump_count:03d}_{reason}.npy"
+            )
+            file = path / filename
+            np.save(file, records)
+        except Exception as e:
+            self.logger.error("保存遙測記錄失敗: %s", e)
+            return None
+
+        self.dump_count += 1
+        self.logger.info("遙測記錄已保存（%s 筆）: %s", len(records), file)
+        return file
@@ -0,0 +1,232 @@
+"""
+執行區段追蹤模組
+"""
+
+import collections
+import contextlib
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable, Generator
+from pathlib import Path
+
+
+class Tracer:
+    """
+    執行區段追蹤器
+
+    記錄各階段、檢測、截圖與輸入呼叫的開始時間與耗時（含所在線程），
+    匯出為 Chrome trace-event JSON，可在 Perfetto 或 chrome://tracing 中
+    檢視各控制線程的時間軸。事件保存在固定長度的佇列中，超過時丟棄最舊的。
+    時間使用 perf_counter，虛擬時鐘下也反映實際的執行耗時。
+    """
+
+    def __init__(self, capacity: int = 200_000):
+        """
+        初始化追蹤器
+
+        Args:
+            capacity: 保存的事件數
+        """
+        if capacity <= 0:
+            raise ValueError("capacity 必須大於 0")
+
+        self.capacity = capacity
+        self.logger = logging.getLogger("FishingBot.Tracer")
+        self.start_ns = time.perf_counter_ns()
+        self.dump_count = 0
+
+        # 事件為 (名稱, 類別, 開始, 耗時, 線程編號)，deque.append 為原子操作，
+        # 記錄時不需加鎖
+        self._events: collections.deque = collections.deque(maxlen=capacity)
+        # 每個線程依 (ident, 名稱) 分配編號，ident 被新線程重用時也不會混淆
+        self._threads: dict[tuple[int, str], int] = {}
+        self._thread_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def _thread_id(self) -> int:
+        """取得目前線程的編號（首次出現時分配）"""
+        thread = threading.current_thread()
+        key = (thread.ident or 0, thread.name)
+        tid = self._threads.get(key)
+        if tid is None:
+            with self._thread_lock:
+                tid = self._threads.setdefault(key, len(self._threads) + 1)
+        return tid
+
+    def record(
+        self,
+        name: str,
+        category: str,
+        start_ns: int,
+        end_ns: int | None = None,
+    ):
+        """
+        記錄一個已完成的區段
+
+        Args:
+            name: 區段名稱
+            category: 類別（phase、detector、capture、input、control）
+            start_ns: 開始時間（perf_counter_ns）
+            end_ns: 結束時間（None 表示現在）
+        """
+        if end_ns is None:
+            end_ns = time.perf_counter_ns()
+        self._events.append(
+            (name, category, start_ns, end_ns - start_ns, self._thread_id())
+        )
+
+    @contextlib.contextmanager
+    def span(self, name: str, category: str) -> Generator[None]:
+        """
+        記錄區塊的執行區段
+
+        Args:
+            name: 區段名稱
+            category: 類別
+        """
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.record(name, category, start)
+
+    def to_chrome(self) -> dict:
+        """
+        轉換為 Chrome trace-event 格式
+
+        Returns:
+            可直接以 JSON 保存的字典
+        """
+        pid = os.getpid()
+        with self._thread_lock:
+            threads = dict(self._threads)
+
+        events = [
+            {
+                "name": "process_name",
+                "ph": "M",
+                "pid": pid,
+                "args": {"name": "FishingBot"},
+            }
+        ]
+        for (_, thread_name), tid in threads.items():
+            events.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": pid,
+                    "tid": tid,
+                    "args": {"name": thread_name},
+                }
+            )
+        for name, category, start, duration, tid in list(self._events):
+            events.append(
+                {
+                    "name": name,
+                    "cat": category,
+                    "ph": "X",
+                    "ts": (start - self.start_ns) / 1000,
+                    "dur": duration / 1000,
+                    "pid": pid,
+                    "tid": tid,
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def dump(self, directory: str, reason: str) -> Path | None:
+        """
+        將目前的事件保存為 Chrome trace-event JSON
+
+        Args:
+            directory: 保存目錄
+            reason: 觸發原因（加入檔名）
+
+        Returns:
+            保存的檔案路徑，沒有事件或保存失敗時返回 None
+        """
+        if not self._events:
+            return None
+
+        try:
+            path = Path(directory)
+            path.mkdir(parents=True, exist_ok=True)
+            filename = (
+                time.strftime("%Y%m%d_%H%M%S")
+                + f"_{self.dump_count:03d}_{reason}.json"
+            )
+            file = path / filename
+            with file.open("w", encoding="utf-8") as f:
+                json.dump(self.to_chrome(), f)
+        except Exception as e:
+            self.logger.error("保存追蹤記錄失敗: %s", e)
+            return None
+
+        self.dump_count += 1
+        self.logger.info("追蹤記錄已保存（%s 個區段）: %s", len(self), file)
+        return file
+
+
+# 目前啟用的追蹤器（None 表示未啟用，各追蹤點只做一次判斷）
+_tracer: Tracer | None = None
+
+
+def install(tracer: Tracer | None):
+    """
+    啟用或停用追蹤
+
+    Args:
+        tracer: 追蹤器，None 表示停用
+    """
+    global _tracer
+    _tracer = tracer
+
+
+def active_tracer() -> Tracer | None:
+    """取得目前啟用的追蹤器"""
+    return _tracer
+
+
+def span(name: str, category: str) -> contextlib.AbstractContextManager:
+    """
+    記錄區塊的執行區段（未啟用追蹤時不記錄）
+
+    Args:
+        name: 區段名稱
+        category: 類別
+    """
+    tracer = _tracer
+    if tracer is None:
+        return contextlib.nullcontext()
+    return tracer.span(name, category)
+
+
+def traced(name: str, category: str) -> Callable:
+    """
+    記錄函數執行區段的裝飾器（未啟用追蹤時直接呼叫）
+
+    Args:
+        name: 區段名稱
+        category: 類別
+    """
+
+    def decorator(function: Callable) -> Callable:
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            tracer = _tracer
+            if tracer is None:
+                return function(*args, **kwargs)
+            start = time.perf_counter_ns()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                tracer.record(name, category, start)
+
+        return wrapper
+
+    return decorator
@@ -3,24 +3,61 @@
 """
 
 import logging
+import threading
+from typing import Protocol
 
-import pygetwindow as gw
+from src.clock import SYSTEM_CLOCK, Clock
+
+
+class WindowManagerLike(Protocol):
+    """視窗管理器介面（實際視窗與固定位置的視窗管理器共用）"""
+
+    window_title: str
+    geometry_version: int
+
+    def find_window(self) -> bool: ...
+
+    def activate_window(self) -> bool: ...
+
+    def get_window_rect(self) -> tuple[int, int, int, int] | None: ...
+
+    def invalidate_geometry(self) -> None: ...
+
+    def is_window_active(self) -> bool: ...
 
 
 class WindowManager:
     """遊戲視窗管理器"""
 
-    def __init__(self, window_title: str):
+    def __init__(
+        self,
+        window_title: str,
+        rect_ttl: float = 0.5,
+        clock: Clock | None = None,
+        handle: int | None = None,
+    ):
         """
         初始化視窗管理器
 
         Args:
             window_title: 視窗標題
+            rect_ttl: 視窗位置快取的有效時間（秒）
+            clock: 時鐘（快取有效時間，預設使用實際時間）
+            handle: 視窗代碼（多視窗模式指定視窗，None 時使用第一個標題相符的視窗）
         """
         self.window_title = window_title
+        self.handle = handle
         self.window = None
+        self.rect_ttl = rect_ttl
+        self.clock = clock or SYSTEM_CLOCK
         self.logger = logging.getLogger("FishingBot.WindowManager")
 
+        # 視窗位置快取；位置或大小改變時遞增版本號，依賴者據此重新計算衍生資料
+        self.geometry_version = 0
+        self._rect: tuple[int, int, int, int] | None = None
+        self._rect_time = 0.0
+        self._rect_lock = threading.Lock()
+
     def find_window(self) -> bool:
         """
         查找遊戲視窗
@@ -29,9 +66,15 @@ class WindowManager:
             是否找到視窗
         """
         try:
+            # 延遲導入：PyGetWindow 在非 Windows 環境下導入即失敗
+            import pygetwindow as gw
+
             windows = gw.getWindowsWithTitle(self.window_title)
+            if self.handle is not None:
+                windows = [w for w in windows if w._hWnd == self.handle]
             if windows:
                 self.window = windows[0]
+                self.invalidate_geometry()
                 self.logger.info(f"找到視窗: {self.window.title}")
                 return True
             else:
@@ -43,6 +86,29 @@ class WindowManager:
             self.logger.error(f"查找視窗時出錯: {e}")
             return False
 
+    @staticmethod
+    def list_handles(window_title: str) -> list[int]:
+        """
+        列出所有標題相符的視窗代碼
+
+        Args:
+            window_title: 視窗標題
+
+        Returns:
+            視窗代碼列表，依視窗位置由左到右、由上到下排序（與激活順序無關）
+        """
+        logger = logging.getLogger("FishingBot.WindowManager")
+        try:
+            import pygetwindow as gw
+
+            windows = gw.getWindowsWithTitle(window_title)
+        except Exception as e:
+            logger.error("查找視窗時出錯: %s", e)
+            return []
+
+        windows.sort(key=lambda window: (window.left, window.top))
+        return [window._hWnd for window in windows]
+
     def activate_window(self) -> bool:
         """
         激活遊戲視窗
@@ -74,16 +140,35 @@ class WindowManager:
         if not self.window:
             return None
 
-        try:
-            return (
-                self.window.left,
-                self.window.top,
-                self.window.width,
-                self.window.height,
-            )
-        except Exception as e:
-            self.logger.error(f"獲取視窗位置時出錯: {e}")
-            return None
+        with self._rect_lock:
+            now = self.clock.monotonic()
+            if (
+                self._rect is not None
+                and now - self._rect_time < self.rect_ttl
+            ):
+                return self._rect
+
+            try:
+                # box 一次取得位置和大小，避免分別查詢四個屬性
+                left, top, width, height = self.window.box
+            except Exception as e:
+                self.logger.error("獲取視窗位置時出錯: %s", e)
+                return None
+
+            rect = (left, top, width, height)
+            if rect != self._rect:
+                if self._rect is not None:
+                    self.logger.info("視窗位置已改變: %s", rect)
+                self._rect = rect
+                self.geometry_version += 1
+            self._rect_time = now
+            return rect
+
+    def invalidate_geometry(self):
+        """清除視窗位置快取，下次查詢時重新取得"""
+        with self._rect_lock:
+            self._rect_time = 0.0
+            self._rect = None
 
     def is_window_active(self) -> bool:
         """
@@ -99,3 +184,42 @@ class WindowManager:
             return self.window.isActive
         except Exception:
             return False
+
+
+class StaticWindowManager:
+    """
+    固定位置的視窗管理器
+
+    不操作任何實際視窗，用於回放錄製畫面或模擬時提供固定的視窗位置。
+    """
+
+    def __init__(self, rect: tuple[int, int, int, int]):
+        """
+        初始化固定視窗管理器
+
+        Args:
+            rect: 視窗位置和大小 (x, y, width, height)
+        """
+        self.rect = rect
+        self.window_title = ""
+        self.geometry_version = 1
+        self.logger = logging.getLogger("FishingBot.WindowManager")
+
+    def find_window(self) -> bool:
+        """查找遊戲視窗（固定存在）"""
+        return True
+
+    def activate_window(self) -> bool:
+        """激活遊戲視窗（無操作）"""
+        return True
+
+    def get_window_rect(self) -> tuple[int, int, int, int] | None:
+        """獲取視窗位置和大小"""
+        return self.rect
+
+    def invalidate_geometry(self):
+        """清除視窗位置快取（位置固定，無操作）"""
+
+    def is_window_active(self) -> bool:
+        """檢查視窗是否處於活動狀態"""
+        return True